@@ -1,9 +1,12 @@
+import asyncio
+import logging
 from dataclasses import dataclass
 from typing import (
     Dict,
     List,
 )
 
+import anyio
 from fastapi import HTTPException
 from src.application.cars.dto.car import DTOCars
 from src.application.cars.schemas.base import (
@@ -19,33 +22,93 @@ from src.infrastructure.db.services import (
     BaseQueryParserCarsMongoDBService,
 )
 from src.infrastructure.mediator.handlers.commands import CommandHandler
+from src.infrastructure.parser.progress import CrawlProgress
 
 
 @dataclass(frozen=True)
 class ParserCarsCommand(BaseCommands):
     offset: int
+    progress: CrawlProgress | None = None
+    mode: str = "full"
 
 
 @dataclass(frozen=True)
 class ParserCarsCommandHandler(CommandHandler[ParserCarsCommand, DTOCars]):
+    """Парсер і запис у Mongo працюють конвеєром через обмежену чергу:
+    машини зберігаються пачками, щойно їх розібрано."""
+
     query_pasring_all_cars_service: BaseQueryParserCarsMongoDBService
     command_save_cars_service: BaseCommandCarsParserMongoDBService
+    batch_size: int = 50
+    queue_size: int = 200
+    flush_interval: float = 2.0
 
     async def handle(
         self,
         command: ParserCarsCommand,
     ) -> Dict:
-        cars = await self.query_pasring_all_cars_service.parser_cars(
-            offset=command.offset,
-        )
-        if not cars:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        progress = command.progress or CrawlProgress()
+
+        async def produce() -> None:
+            try:
+                async for car in self.query_pasring_all_cars_service.parser_cars(
+                    offset=command.offset,
+                    progress=progress,
+                    mode=command.mode,
+                ):
+                    # Якщо запис відстає, парсер чекає тут
+                    await queue.put(car)
+            finally:
+                await queue.put(None)
+
+        async def flush(batch: List[Dict]) -> None:
+            if not batch:
+                return
+
+            with progress.metrics.timer("save"):
+                await self.command_save_cars_service.save_cars_from_parser(batch)
+            progress.saved += len(batch)
+            logging.info(f"Збережено {progress.saved} автомобілів")
+            batch.clear()
+
+        async def write() -> None:
+            loop = asyncio.get_running_loop()
+            batch = []
+            # Непорожня пачка зберігається не пізніше ніж за flush_interval
+            # після першої машини в ній, навіть якщо машини йдуть безперервно
+            deadline = None
+            while True:
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                try:
+                    car = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    await flush(batch)
+                    deadline = None
+                    continue
+
+                if car is None:
+                    break
+
+                if not batch:
+                    deadline = loop.time() + self.flush_interval
+                batch.append(car)
+                if len(batch) >= self.batch_size or loop.time() >= deadline:
+                    await flush(batch)
+                    deadline = None
+
+            await flush(batch)
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(produce)
+            tg.start_soon(write)
+
+        logging.info(f"Етапи синхронізації: {progress.metrics.to_dict()}")
+
+        if not progress.parsed:
             raise HTTPException(status_code=400, detail="Some problem with the parser.")
 
-        original_cars = cars.copy()
-
-        await self.command_save_cars_service.save_cars_from_parser(cars)
-
-        return original_cars
+        return {"parsed": progress.parsed, "saved": progress.saved}
 
 
 @dataclass(frozen=True)
@@ -2,6 +2,7 @@ from dataclasses import (
     dataclass,
     field,
 )
+from datetime import datetime
 from typing import (
     Dict,
     Optional,
@@ -39,6 +40,10 @@ class CarSchema:
     url_image: Optional[str] = field(default=None)
     mileage_numeric: Optional[int] = field(default=None)
     price_numeric: Optional[int] = field(default=None)
+    url: Optional[str] = field(default=None)
+    olx_id: Optional[str] = field(default=None)
+    parsed_at: Optional[datetime] = field(default=None)
+    card_parsed_at: Optional[datetime] = field(default=None)
 
     def __post_init__(self):
         if isinstance(self._id, ObjectId):
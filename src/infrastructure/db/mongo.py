@@ -1,11 +1,37 @@
-from dataclasses import dataclass
+import asyncio
+import logging
+import os
+import socket
+import uuid
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+)
+from contextlib import (
+    asynccontextmanager,
+    nullcontext,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timedelta,
+    timezone,
+)
 from typing import (
     Dict,
     List,
 )
 
-import anyio
 from bson import ObjectId
+from pymongo import (
+    ASCENDING,
+    DESCENDING,
+    UpdateOne,
+)
 from src.domain.cars.exceptions.car import AlreadyExistOblectExceptions
 from src.infrastructure.db.config import BaseMongoDBRepository
 from src.infrastructure.db.services import (
@@ -14,21 +40,463 @@ from src.infrastructure.db.services import (
     BaseQueryCarsMongoDBService,
     BaseQueryParserCarsMongoDBService,
 )
-from src.infrastructure.parser.parser_auto import parsing_olx_cars
+from src.infrastructure.parser.archive import BasePageArchive
+from src.infrastructure.parser.driver import WebDriverPool
+from src.infrastructure.parser.extraction import (
+    BaseExtractionRunner,
+    ThreadExtractionRunner,
+)
+from src.infrastructure.parser.fetchers import init_fetcher
+from src.infrastructure.parser.frontier import (
+    BaseCrawlFrontier,
+    DONE,
+    FAILED,
+    IN_PROGRESS,
+    PENDING,
+)
+from src.infrastructure.parser.parser_auto import (
+    init_discovery,
+    init_extractor,
+    parsing_olx_cars,
+)
+from src.infrastructure.parser.partitions import (
+    BasePartitionStore,
+    PricePartition,
+)
+from src.infrastructure.parser.progress import CrawlProgress
+from src.infrastructure.parser.throttle import AdaptiveConcurrencyLimiter
+from src.infrastructure.parser.utils import olx_listing_id
+from src.settings.config import Config
+
+
+# Скільки ID передавати в одному $in-запиті
+KNOWN_LISTINGS_CHUNK = 1000
+
+
+def default_worker_id() -> str:
+    # Кілька фронтирів в одному процесі не мають ділити оренди
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
 
 
 @dataclass
-class QueryParserCarsMongoDBService(BaseQueryParserCarsMongoDBService):
+class CrawlFrontierMongoDBService(BaseCrawlFrontier, BaseMongoDBRepository):
+    """Фронтир обходу в Mongo: документ на кожне посилання в основній
+    колекції і курсор пагінації в cursor_collection.
+
+    Колекція водночас є чергою для кількох воркерів: посилання
+    видаються в оренду атомарним find_one_and_update на lease_seconds, а
+    оренди воркерів, що впали, після закінчення строку видаються знову.
+    Зміни станів посилань накопичуються і пишуться одним bulk_write на
+    checkpoint_batch посилань. Поки посилання в роботі, heartbeat
+    продовжує їхню оренду, тож повільна пачка не перевидається іншому
+    воркеру.
+
+    Екземпляр тримає стан одного обходу, тож кожна синхронізація
+    створює свій, а спільні в них лише клієнт і колекції.
+    """
+
+    cursor_collection: str = "parser_cursors"
+    checkpoint_batch: int = 50
+    lease_seconds: float = 300.0
+    worker_id: str = field(default_factory=default_worker_id)
+    _listing_url: str | None = field(default=None, init=False, repr=False)
+    _marks: list = field(default_factory=list, init=False, repr=False)
+    _leased: set = field(default_factory=set, init=False, repr=False)
+    _indexes_created: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def _cursors(self):
+        return self.mongo_db_client[self.mongo_db_db_name][self.cursor_collection]
+
+    async def ensure_indexes(self) -> None:
+        if self._indexes_created:
+            return
+
+        await self._collection.create_index(
+            [("listing_url", ASCENDING), ("state", ASCENDING)],
+        )
+        await self._collection.create_index(
+            [("state", ASCENDING), ("lease_until", ASCENDING)],
+        )
+        self._indexes_created = True
+
+    async def start(self, listing_url: str) -> int | None:
+        await self.ensure_indexes()
+        self._listing_url = listing_url
+        now = datetime.now(timezone.utc)
+
+        cursor = await self._cursors.find_one({"_id": listing_url})
+        if cursor is not None and cursor["state"] == "fetching" and not await self._unfinished():
+            # Решту посилань уже обробили окремі воркери
+            cursor["state"] = "complete"
+
+        if cursor is None or cursor["state"] == "complete":
+            await self._collection.delete_many({"listing_url": listing_url})
+            await self._cursors.replace_one(
+                {"_id": listing_url},
+                {"state": "paginating", "next_page": 0, "started_at": now, "updated_at": now},
+                upsert=True,
+            )
+            return 0
+
+        # Посилання, які оброблялися в момент зупинки, повернуться в чергу,
+        # коли закінчиться їхня оренда
+        logging.info(
+            f"Відновлюємо обхід від {cursor['started_at']}: сторінка {cursor['next_page']}",
+        )
+
+        if cursor["state"] == "paginating":
+            return cursor["next_page"]
+        return None
+
+    async def add_page(self, page: int, links: Iterable[str]) -> None:
+        now = datetime.now(timezone.utc)
+        operations = []
+        for url in links:
+            queued = {
+                "listing_url": self._listing_url,
+                "olx_id": olx_listing_id(url),
+                "state": PENDING,
+                "attempts": 0,
+                "discovered_at": now,
+                "updated_at": now,
+            }
+            operations.append(UpdateOne({"_id": url}, {"$setOnInsert": queued}, upsert=True))
+            # Посилання, завершене в обході іншого пошуку, цей обхід бере знову;
+            # те, що зараз у черзі чи в роботі іншого обходу, там і лишається
+            operations.append(
+                UpdateOne(
+                    {"_id": url, "listing_url": {"$ne": self._listing_url}, "state": {"$in": [DONE, FAILED]}},
+                    {"$set": queued, "$unset": {"error": "", "lease_owner": ""}},
+                ),
+            )
+        if operations:
+            await self._collection.bulk_write(operations, ordered=False)
+
+        await self._cursors.update_one(
+            {"_id": self._listing_url},
+            {"$max": {"next_page": page + 1}, "$set": {"updated_at": now}},
+        )
+
+    async def finish_pagination(self) -> None:
+        await self._cursors.update_one(
+            {"_id": self._listing_url},
+            {"$set": {"state": "fetching", "updated_at": datetime.now(timezone.utc)}},
+        )
+
+    async def claim(self, limit: int) -> list[str]:
+        urls = []
+        for _ in range(limit):
+            now = datetime.now(timezone.utc)
+            doc = await self._collection.find_one_and_update(
+                {
+                    **self._listing_filter(),
+                    "$or": [
+                        {"state": PENDING},
+                        {"state": IN_PROGRESS, "lease_until": {"$lt": now}},
+                    ],
+                },
+                {
+                    "$set": {
+                        "state": IN_PROGRESS,
+                        "lease_owner": self.worker_id,
+                        "lease_until": now + timedelta(seconds=self.lease_seconds),
+                        "updated_at": now,
+                    },
+                },
+                projection={"_id": 1},
+                sort=[("discovered_at", ASCENDING)],
+            )
+            if doc is None:
+                break
+            urls.append(doc["_id"])
+
+        self._leased.update(urls)
+        return urls
+
+    async def renew(self) -> None:
+        """Продовжує оренду посилань, які цей фронтир узяв і ще не позначив."""
+        if not self._leased:
+            return
+
+        now = datetime.now(timezone.utc)
+        await self._collection.update_many(
+            {"_id": {"$in": list(self._leased)}, "state": IN_PROGRESS, "lease_owner": self.worker_id},
+            {"$set": {"lease_until": now + timedelta(seconds=self.lease_seconds), "updated_at": now}},
+        )
+
+    @asynccontextmanager
+    async def heartbeat(self) -> AsyncIterator[None]:
+        async def beat() -> None:
+            while True:
+                await asyncio.sleep(self.lease_seconds / 3)
+                try:
+                    await self.renew()
+                except Exception as e:
+                    logging.warning(f"Не вдалося продовжити оренду посилань: {e}")
+
+        task = asyncio.create_task(beat())
+        try:
+            yield
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+
+    def _listing_filter(self) -> dict:
+        # Воркер без start() бачить посилання всіх обходів
+        return {"listing_url": self._listing_url} if self._listing_url is not None else {}
+
+    async def has_in_progress(self) -> bool:
+        await self.flush()
+        return (
+            await self._collection.find_one(
+                {**self._listing_filter(), "state": IN_PROGRESS},
+                {"_id": 1},
+            )
+            is not None
+        )
+
+    async def mark(self, url: str, state: str, error: str | None = None) -> None:
+        self._leased.discard(url)
+        # Якщо оренду вже забрав інший воркер, його результат не перезаписуємо
+        self._marks.append(
+            UpdateOne(
+                {"_id": url, "lease_owner": self.worker_id},
+                {
+                    "$set": {"state": state, "error": error, "updated_at": datetime.now(timezone.utc)},
+                    "$unset": {"lease_until": ""},
+                    "$inc": {"attempts": 1},
+                },
+            ),
+        )
+        if len(self._marks) >= self.checkpoint_batch:
+            await self.flush()
+
+    async def flush(self) -> None:
+        if not self._marks:
+            return
+
+        marks, self._marks = self._marks, []
+        await self._collection.bulk_write(marks, ordered=False)
+
+    async def _unfinished(self) -> bool:
+        return (
+            await self._collection.find_one(
+                {**self._listing_filter(), "state": {"$in": [PENDING, IN_PROGRESS]}},
+                {"_id": 1},
+            )
+            is not None
+        )
+
+    async def finish(self) -> dict:
+        await self.flush()
+
+        counts = {}
+        async for doc in self._collection.aggregate(
+            [
+                {"$match": {"listing_url": self._listing_url}},
+                {"$group": {"_id": "$state", "count": {"$sum": 1}}},
+            ],
+        ):
+            counts[doc["_id"]] = doc["count"]
+
+        if not counts.get(PENDING) and not counts.get(IN_PROGRESS):
+            await self._cursors.update_one(
+                {"_id": self._listing_url},
+                {"$set": {"state": "complete", "updated_at": datetime.now(timezone.utc)}},
+            )
+        return counts
+
+
+@dataclass
+class PartitionMongoDBService(BasePartitionStore, BaseMongoDBRepository):
+    """Розбиття пошуку на діапазони цін: документ на кожен діапазон
+    джерела з кількістю оголошень у ньому."""
+
+    async def load(self, source: str) -> dict[PricePartition, int | None]:
+        sizes = {}
+        async for doc in self._collection.find({"source": source}):
+            sizes[PricePartition.from_key(doc["partition"])] = doc["size"]
+        return sizes
+
+    async def save(self, source: str, sizes: dict[PricePartition, int | None]) -> None:
+        keys = [partition.key for partition in sizes]
+        await self._collection.delete_many({"source": source, "partition": {"$nin": keys}})
+        if not sizes:
+            return
+
+        now = datetime.now(timezone.utc)
+        await self._collection.bulk_write(
+            [
+                UpdateOne(
+                    {"_id": f"{source}|{partition.key}"},
+                    {
+                        "$set": {
+                            "source": source,
+                            "partition": partition.key,
+                            "size": size,
+                            "updated_at": now,
+                        },
+                    },
+                    upsert=True,
+                )
+                for partition, size in sizes.items()
+            ],
+            ordered=False,
+        )
+
+
+@dataclass(eq=False)
+class PageArchiveMongoDBService(BasePageArchive, BaseMongoDBRepository):
+    """Архів сирих сторінок у Mongo: документ на кожне завантаження
+    сторінки, словники zstd — у dictionary_collection."""
+
+    dictionary_collection: str = "parser_archive_dictionaries"
+    _indexes_created: bool = field(default=False, init=False, repr=False)
+
+    @property
+    def _dictionaries(self):
+        return self.mongo_db_client[self.mongo_db_db_name][self.dictionary_collection]
+
+    async def ensure_indexes(self) -> None:
+        if self._indexes_created:
+            return
+
+        await self._collection.create_index(
+            [("olx_id", ASCENDING), ("fetched_at", DESCENDING)],
+        )
+        self._indexes_created = True
+
+    async def _put(self, olx_id: str, fetched_at: datetime, url: str, frame: bytes) -> None:
+        await self.ensure_indexes()
+        await self._collection.insert_one(
+            {"olx_id": olx_id, "fetched_at": fetched_at, "url": url, "page": frame},
+        )
+
+    async def _latest(self) -> AsyncIterator[tuple[str, datetime, bytes]]:
+        await self.ensure_indexes()
+        # Порядок індексу: перший документ кожного оголошення — найсвіжіший
+        cursor = self._collection.find(
+            {},
+            {"_id": 0, "olx_id": 1, "fetched_at": 1, "page": 1},
+            sort=[("olx_id", ASCENDING), ("fetched_at", DESCENDING)],
+        )
+        last_id = None
+        async for doc in cursor:
+            if doc["olx_id"] == last_id:
+                continue
+            last_id = doc["olx_id"]
+            yield doc["olx_id"], doc["fetched_at"], doc["page"]
+
+    async def _read_dictionaries(self) -> list[bytes]:
+        cursor = self._dictionaries.find({}, sort=[("created_at", ASCENDING)])
+        return [doc["data"] async for doc in cursor]
+
+    async def _write_dictionary(self, dict_id: int, data: bytes) -> None:
+        await self._dictionaries.update_one(
+            {"_id": dict_id},
+            {"$set": {"data": data, "created_at": datetime.now(timezone.utc)}},
+            upsert=True,
+        )
+
+
+@dataclass
+class QueryParserCarsMongoDBService(
+    BaseQueryParserCarsMongoDBService,
+    BaseMongoDBRepository,
+):
+    config: Config
+    webdriver_pool: WebDriverPool
+    fetch_limiter: AdaptiveConcurrencyLimiter | None = None
+    # Новий фронтир на кожну синхронізацію: паралельні обходи не ділять курсор і незаписані позначки
+    frontier_factory: Callable[[], BaseCrawlFrontier] | None = None
+    extraction_runner: BaseExtractionRunner = field(default_factory=ThreadExtractionRunner)
+    partition_store: BasePartitionStore | None = None
+    archive: BasePageArchive | None = None
+
+    async def select_links_to_fetch(self, car_links: set) -> set:
+        """Залишає лише нові оголошення та ті, що давно не оновлювалися."""
+        links_by_id = {olx_listing_id(url): url for url in car_links}
+        olx_ids = list(links_by_id)
+        refresh_border = datetime.now(timezone.utc) - timedelta(
+            hours=self.config.parser_refresh_after_hours,
+        )
+
+        fresh_ids = set()
+        for start in range(0, len(olx_ids), KNOWN_LISTINGS_CHUNK):
+            cursor = self._collection.find(
+                {
+                    "olx_id": {"$in": olx_ids[start : start + KNOWN_LISTINGS_CHUNK]},
+                    "parsed_at": {"$gte": refresh_border},
+                },
+                {"olx_id": 1, "_id": 0},
+            )
+            fresh_ids.update([doc["olx_id"] async for doc in cursor])
+
+        return {url for olx_id, url in links_by_id.items() if olx_id not in fresh_ids}
+
     async def parser_cars(
         self,
         offset: int,
-    ) -> Dict:
-        cars = await anyio.to_thread.run_sync(
-            parsing_olx_cars,
-            offset,
+        progress: CrawlProgress | None = None,
+        mode: str = "full",
+    ) -> AsyncIterator[Dict]:
+        if progress is None:
+            progress = CrawlProgress()
+        frontier = self.frontier_factory() if self.frontier_factory is not None else None
+
+        extractor = init_extractor(
+            html_backend=self.config.parser_html_backend,
+            schema_path=self.config.parser_schema_path,
+            mode=self.config.parser_extraction_mode,
         )
+        async with (
+            init_fetcher(
+                self.config,
+                self.webdriver_pool,
+                self.fetch_limiter,
+                progress.metrics,
+            ) as fetcher,
+            # Окремий HTTP-клієнт потрібен лише для JSON API оголошень
+            (
+                init_fetcher(
+                    self.config,
+                    self.webdriver_pool,
+                    self.fetch_limiter,
+                    progress.metrics,
+                    backend="http",
+                )
+                if self.config.parser_discovery_backend == "api"
+                else nullcontext()
+            ) as api_fetcher,
+        ):
+            async for car in parsing_olx_cars(
+                offset,
+                fetcher,
+                concurrency=self.config.parser_concurrency,
+                extractor=extractor,
+                link_filter=self.select_links_to_fetch,
+                frontier=frontier,
+                progress=progress,
+                runner=self.extraction_runner,
+                discovery=init_discovery(
+                    self.config,
+                    fetcher,
+                    api_fetcher,
+                    extractor,
+                    self.extraction_runner,
+                    self.partition_store,
+                ),
+                card_only=mode == "cards",
+                required_fields=tuple(
+                    name.strip() for name in self.config.parser_card_required_fields.split(",") if name.strip()
+                ),
+                archive=self.archive,
+            ):
+                yield car
 
-        return cars
+        if self.fetch_limiter is not None:
+            logging.info(f"Ліміти запитів після обходу: {self.fetch_limiter.snapshot()}")
 
 
 @dataclass
@@ -151,13 +619,36 @@ class CommandCarsParserMongoDBService(
     BaseCommandCarsParserMongoDBService,
     BaseMongoDBRepository,
 ):
+    _indexes_created: bool = field(default=False, init=False, repr=False)
+
+    async def ensure_indexes(self) -> None:
+        if self._indexes_created:
+            return
+
+        await self._collection.create_index(
+            [("olx_id", ASCENDING)],
+            unique=True,
+            partialFilterExpression={"olx_id": {"$exists": True}},
+        )
+        await self._collection.create_index([("url", ASCENDING)])
+        self._indexes_created = True
+
     async def save_cars_from_parser(
         self,
         car_list: List,
     ) -> None:
-        for car in car_list:
-            await self._collection.update_one(
-                car,
-                {"$set": car},
-                upsert=True,
-            )
+        if not car_list:
+            return
+
+        await self.ensure_indexes()
+        await self._collection.bulk_write(
+            [
+                UpdateOne(
+                    {"olx_id": car["olx_id"]} if "olx_id" in car else car,
+                    {"$set": car},
+                    upsert=True,
+                )
+                for car in car_list
+            ],
+            ordered=False,
+        )
@@ -2,17 +2,25 @@ from abc import (
     ABC,
     abstractmethod,
 )
+from collections.abc import AsyncIterator
 from dataclasses import dataclass
 from typing import (
     Dict,
     List,
 )
 
+from src.infrastructure.parser.progress import CrawlProgress
+
 
 @dataclass
 class BaseQueryParserCarsMongoDBService(ABC):
     @abstractmethod
-    async def parser_cars(self, offset: int) -> None:
+    def parser_cars(
+        self,
+        offset: int,
+        progress: CrawlProgress | None = None,
+        mode: str = "full",
+    ) -> AsyncIterator[Dict]:
         raise NotImplementedError()
 
 
@@ -66,5 +74,5 @@ class BaseCommandCarsMongoDBService(ABC):
 @dataclass
 class BaseCommandCarsParserMongoDBService(ABC):
     @abstractmethod
-    async def save_cars_from_parser(self, cars: Dict) -> None:
+    async def save_cars_from_parser(self, cars: List[Dict]) -> None:
         raise NotImplementedError()
@@ -29,6 +29,9 @@ from src.application.cars.commands.cars import (
 from src.infrastructure.db.mongo import (
     CommandCarsMongoDBService,
     CommandCarsParserMongoDBService,
+    CrawlFrontierMongoDBService,
+    PageArchiveMongoDBService,
+    PartitionMongoDBService,
     QueryCarsMongoDBService,
     QueryParserCarsMongoDBService,
 )
@@ -37,8 +40,30 @@ from src.infrastructure.db.services import (
     BaseCommandCarsParserMongoDBService,
     BaseQueryCarsMongoDBService,
 )
+from src.infrastructure.jobs.reextract import ArchiveReextractor
+from src.infrastructure.jobs.sync import (
+    init_scheduler,
+    SyncJobManager,
+)
+from src.infrastructure.jobs.worker import CrawlWorker
 from src.infrastructure.mediator.main import Mediator
 from src.infrastructure.mediator.sub_mediators.event import EventMediator
+from src.infrastructure.parser.archive import (
+    BasePageArchive,
+    FilePageArchive,
+    init_page_codec,
+)
+from src.infrastructure.parser.driver import WebDriverPool
+from src.infrastructure.parser.extraction import (
+    BaseExtractionRunner,
+    init_extraction_runner,
+)
+from src.infrastructure.parser.fetchers import (
+    init_fetch_limiter,
+    init_webdriver_pool,
+)
+from src.infrastructure.parser.parser_auto import init_extractor
+from src.infrastructure.parser.throttle import AdaptiveConcurrencyLimiter
 from src.settings.config import Config
 
 
@@ -67,6 +92,79 @@ def _initialize_container() -> Container:
     )
     client = container.resolve(AsyncIOMotorClient)
 
+    # Драйвери Chrome прогріваються при старті застосунку і живуть до його зупинки
+    container.register(
+        WebDriverPool,
+        factory=lambda: init_webdriver_pool(config),
+        scope=Scope.singleton,
+    )
+    # Ліміти запитів до хостів зберігаються між синхронізаціями
+    container.register(
+        AdaptiveConcurrencyLimiter,
+        factory=lambda: init_fetch_limiter(config),
+        scope=Scope.singleton,
+    )
+
+    # Пул процесів розбору HTML живе до зупинки застосунку
+    container.register(
+        BaseExtractionRunner,
+        factory=lambda: init_extraction_runner(config),
+        scope=Scope.singleton,
+    )
+
+    # Стан фронтиру в Mongo спільний для всіх синхронізацій, щоб продовжувати
+    # перервані, але кожна синхронізація і воркер отримують свій екземпляр
+    container.register(
+        CrawlFrontierMongoDBService,
+        factory=lambda: CrawlFrontierMongoDBService(
+            mongo_db_client=client,
+            mongo_db_db_name=config.mongodb_galery_database,
+            mongo_db_collection=config.mongodb_frontier_collection,
+            cursor_collection=config.mongodb_cursor_collection,
+            checkpoint_batch=config.parser_checkpoint_batch,
+            lease_seconds=config.parser_lease_seconds,
+        ),
+    )
+
+    # Вивчене розбиття пошуку на діапазони цін переходить між синхронізаціями
+    container.register(
+        PartitionMongoDBService,
+        factory=lambda: PartitionMongoDBService(
+            mongo_db_client=client,
+            mongo_db_db_name=config.mongodb_galery_database,
+            mongo_db_collection=config.mongodb_partition_collection,
+        ),
+        scope=Scope.singleton,
+    )
+
+    def init_page_archive() -> BasePageArchive | None:
+        backend = config.parser_archive_backend
+        if not backend:
+            return None
+
+        if backend == "files":
+            return FilePageArchive(
+                codec=init_page_codec(config),
+                directory=config.parser_archive_dir,
+            )
+        if backend == "mongo":
+            return PageArchiveMongoDBService(
+                mongo_db_client=client,
+                mongo_db_db_name=config.mongodb_galery_database,
+                mongo_db_collection=config.mongodb_archive_collection,
+                codec=init_page_codec(config),
+                dictionary_collection=config.mongodb_archive_dictionary_collection,
+            )
+
+        raise ValueError(f"Unknown parser archive backend: {backend}")
+
+    # Архів сторінок спільний для синхронізацій, воркерів і повторного розбору
+    container.register(
+        BasePageArchive,
+        factory=init_page_archive,
+        scope=Scope.singleton,
+    )
+
     def init_mongodb_cars_from_parser_service() -> BaseCommandCarsParserMongoDBService:
         return CommandCarsParserMongoDBService(
             mongo_db_client=client,
@@ -106,6 +204,39 @@ def _initialize_container() -> Container:
         scope=Scope.singleton,
     )
 
+    container.register(
+        CrawlWorker,
+        factory=lambda: CrawlWorker(
+            config=config,
+            frontier=container.resolve(CrawlFrontierMongoDBService),
+            command_save_cars_service=container.resolve(
+                BaseCommandCarsParserMongoDBService,
+            ),
+            webdriver_pool=container.resolve(WebDriverPool),
+            fetch_limiter=container.resolve(AdaptiveConcurrencyLimiter),
+            extraction_runner=container.resolve(BaseExtractionRunner),
+            archive=container.resolve(BasePageArchive),
+        ),
+    )
+
+    container.register(
+        ArchiveReextractor,
+        factory=lambda: ArchiveReextractor(
+            archive=container.resolve(BasePageArchive),
+            command_save_cars_service=container.resolve(
+                BaseCommandCarsParserMongoDBService,
+            ),
+            # HTML зі сторінок у браузері не архівується, тож розбираємо його в Python
+            extractor=init_extractor(
+                html_backend=config.parser_html_backend,
+                schema_path=config.parser_schema_path,
+                mode="html" if config.parser_extraction_mode == "browser" else config.parser_extraction_mode,
+            ),
+            extraction_runner=container.resolve(BaseExtractionRunner),
+            batch_size=config.parser_reextract_batch_size,
+        ),
+    )
+
     # Handlers
     container.register(GetAllCarsCommandHandler)
     container.register(ParserCarsCommandHandler)
@@ -129,10 +260,24 @@ def _initialize_container() -> Container:
         # command handlers
         parsing_all_cars_handler = ParserCarsCommandHandler(
             _mediator=mediator,
-            query_pasring_all_cars_service=QueryParserCarsMongoDBService(),
+            query_pasring_all_cars_service=QueryParserCarsMongoDBService(
+                mongo_db_client=client,
+                mongo_db_db_name=config.mongodb_galery_database,
+                mongo_db_collection=config.mongodb_cars_collection,
+                config=config,
+                webdriver_pool=container.resolve(WebDriverPool),
+                fetch_limiter=container.resolve(AdaptiveConcurrencyLimiter),
+                frontier_factory=lambda: container.resolve(CrawlFrontierMongoDBService),
+                extraction_runner=container.resolve(BaseExtractionRunner),
+                partition_store=container.resolve(PartitionMongoDBService),
+                archive=container.resolve(BasePageArchive),
+            ),
             command_save_cars_service=container.resolve(
                 BaseCommandCarsParserMongoDBService,
             ),
+            batch_size=config.parser_save_batch_size,
+            queue_size=config.parser_save_queue_size,
+            flush_interval=config.parser_save_flush_interval,
         )
 
         # command handlers
@@ -250,6 +395,18 @@ def _initialize_container() -> Container:
     container.register(Mediator, factory=init_mediator)
     container.register(EventMediator, factory=init_mediator)
 
-    container.register(Scheduler, factory=lambda: Scheduler(), scope=Scope.singleton)
+    container.register(
+        Scheduler,
+        factory=lambda: init_scheduler(config),
+        scope=Scope.singleton,
+    )
+    container.register(
+        SyncJobManager,
+        factory=lambda: SyncJobManager(
+            scheduler=container.resolve(Scheduler),
+            mediator=container.resolve(Mediator),
+        ),
+        scope=Scope.singleton,
+    )
 
     return container
@@ -11,6 +11,20 @@ class BaseMediatorException(BaseAppException):
         return "Error while check request"
 
 
+@dataclass(eq=False)
+class BaseParserException(BaseAppException):
+    @property
+    def message(self) -> str:
+        return "Error while parsing OLX"
+
+
+@dataclass(eq=False)
+class BaseJobException(BaseAppException):
+    @property
+    def message(self) -> str:
+        return "Error while running background job"
+
+
 @dataclass(eq=False)
 class BaseAppException(Exception):
     """Base class for app exceptions."""
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+
+from src.infrastructure.exceptions.base import BaseJobException
+
+
+@dataclass(eq=False)
+class SyncJobNotFoundException(BaseJobException):
+    job_id: str
+
+    @property
+    def message(self) -> str:
+        return f"Sync job {self.job_id} not found"
+
+
+@dataclass(eq=False)
+class TooManySyncJobsException(BaseJobException):
+    @property
+    def message(self) -> str:
+        return "Too many sync jobs are waiting, try again later"
+
+
+@dataclass(eq=False)
+class UnknownSyncModeException(BaseJobException):
+    mode: str
+
+    @property
+    def message(self) -> str:
+        return f"Unknown sync mode {self.mode}"
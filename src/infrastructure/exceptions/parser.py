@@ -0,0 +1,31 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from src.infrastructure.exceptions.base import BaseParserException
+
+
+@dataclass(eq=False)
+class PageFetchException(BaseParserException):
+    url: str
+    status_code: Optional[int] = None
+    retry_after: Optional[float] = None
+
+    @property
+    def message(self) -> str:
+        return f"Failed to fetch page {self.url} (status {self.status_code})"
+
+
+@dataclass(eq=False)
+class ListingRemovedException(PageFetchException):
+    @property
+    def message(self) -> str:
+        return f"Listing {self.url} is removed or sold"
+
+
+@dataclass(eq=False)
+class IncompletePageException(PageFetchException):
+    html: str = ""
+
+    @property
+    def message(self) -> str:
+        return f"Page {self.url} is blank or missing expected elements"
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+
+from src.infrastructure.db.services import BaseCommandCarsParserMongoDBService
+from src.infrastructure.parser.archive import (
+    ArchivedPage,
+    BasePageArchive,
+)
+from src.infrastructure.parser.extraction import (
+    BaseExtractionRunner,
+    ThreadExtractionRunner,
+)
+from src.infrastructure.parser.parser_auto import (
+    CarPageExtractor,
+    extract_car_details_timed,
+    run_extraction,
+)
+from src.infrastructure.parser.progress import CrawlProgress
+
+
+@dataclass(eq=False)
+class ArchiveReextractor:
+    """Витягує поля автомобілів із заархівованих сторінок поточним
+    екстрактором, без повторного обходу сайту.
+
+    Архів читається потоком, сторінки розбираються пачками в
+    extraction_runner, тобто в пулі процесів на всі ядра, а кожна пачка
+    пишеться в Mongo одним bulk_write, поки з архіву читається наступна.
+    """
+
+    archive: BasePageArchive
+    command_save_cars_service: BaseCommandCarsParserMongoDBService
+    extractor: CarPageExtractor
+    extraction_runner: BaseExtractionRunner = field(default_factory=ThreadExtractionRunner)
+    batch_size: int = 500
+
+    async def run(self) -> CrawlProgress:
+        progress = CrawlProgress()
+        pending: asyncio.Task | None = None
+        batch = []
+
+        try:
+            async for page in self.archive.latest():
+                batch.append(page)
+                if len(batch) < self.batch_size:
+                    continue
+
+                if pending is not None:
+                    await pending
+                pending = asyncio.create_task(self.process_batch(batch, progress))
+                batch = []
+
+            if pending is not None:
+                await pending
+            if batch:
+                await self.process_batch(batch, progress)
+        finally:
+            if pending is not None and not pending.done():
+                pending.cancel()
+
+        logging.info(f"Етапи повторного розбору: {progress.metrics.to_dict()}")
+        return progress
+
+    async def process_batch(self, pages: list[ArchivedPage], progress: CrawlProgress) -> None:
+        results = await asyncio.gather(
+            *(
+                run_extraction(
+                    self.extraction_runner,
+                    progress.metrics,
+                    "detail",
+                    extract_car_details_timed,
+                    page.body,
+                    self.extractor,
+                )
+                for page in pages
+            ),
+        )
+
+        # parsed_at не змінюється: він позначає завантаження сторінки
+        reextracted_at = datetime.now(timezone.utc)
+        cars = [
+            {**details, "url": page.url, "olx_id": page.olx_id, "reextracted_at": reextracted_at}
+            for page, details in zip(pages, results)
+            if details
+        ]
+        with progress.metrics.timer("save"):
+            await self.command_save_cars_service.save_cars_from_parser(cars)
+
+        progress.parsed += len(cars)
+        progress.saved += len(cars)
+        progress.errors += len(pages) - len(cars)
+        logging.info(f"Повторно розібрано оголошень: {progress.to_dict()}")
@@ -0,0 +1,147 @@
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from uuid import uuid4
+
+from aiojobs import Scheduler
+from fastapi import HTTPException
+from src.application.cars.commands.cars import ParserCarsCommand
+from src.domain.common.exceptions.base import BaseAppException
+from src.infrastructure.exceptions.jobs import (
+    SyncJobNotFoundException,
+    TooManySyncJobsException,
+    UnknownSyncModeException,
+)
+from src.infrastructure.mediator.main import Mediator
+from src.infrastructure.parser.parser_auto import SYNC_MODES
+from src.infrastructure.parser.progress import CrawlProgress
+from src.settings.config import Config
+
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+@dataclass(eq=False)
+class SyncJob:
+    offset: int
+    mode: str = "full"
+    job_id: str = field(default_factory=lambda: uuid4().hex)
+    status: str = QUEUED
+    progress: CrawlProgress = field(default_factory=CrawlProgress)
+    summary: dict | None = None
+    error: str | None = None
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+
+    def to_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "offset": self.offset,
+            "mode": self.mode,
+            "status": self.status,
+            "progress": self.progress.to_dict(),
+            "metrics": self.progress.metrics.to_dict(),
+            "summary": self.summary,
+            "error": self.error,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+
+
+@dataclass(eq=False)
+class SyncJobManager:
+    """Запускає синхронізації у фоні через aiojobs Scheduler.
+
+    Кількість одночасних синхронізацій обмежує limit планувальника, решта
+    чекає в його черзі. Історія зберігає останні history_size задач.
+    """
+
+    scheduler: Scheduler
+    mediator: Mediator
+    history_size: int = 100
+    _jobs: OrderedDict = field(default_factory=OrderedDict, init=False, repr=False)
+
+    async def submit(self, offset: int, mode: str = "full") -> SyncJob:
+        if mode not in SYNC_MODES:
+            raise UnknownSyncModeException(mode=mode)
+        if self.scheduler.pending_count >= self.scheduler.pending_limit:
+            raise TooManySyncJobsException()
+
+        job = SyncJob(offset=offset, mode=mode)
+        self._jobs[job.job_id] = job
+        while len(self._jobs) > self.history_size:
+            self._jobs.popitem(last=False)
+
+        await self.scheduler.spawn(self._run(job))
+        logging.info(f"Синхронізацію {job.job_id} поставлено в чергу")
+        return job
+
+    async def _run(self, job: SyncJob) -> None:
+        job.status = RUNNING
+        job.started_at = datetime.now(timezone.utc)
+        try:
+            results = await self.mediator.handle_command(
+                ParserCarsCommand(offset=job.offset, progress=job.progress, mode=job.mode),
+            )
+        except asyncio.CancelledError:
+            job.status = CANCELLED
+            logging.warning(f"Синхронізацію {job.job_id} зупинено")
+            raise
+        except HTTPException as e:
+            job.status = FAILED
+            job.error = str(e.detail)
+        except BaseAppException as e:
+            job.status = FAILED
+            job.error = e.message
+        except Exception as e:
+            job.status = FAILED
+            job.error = repr(e)
+            logging.exception(f"Синхронізація {job.job_id} завершилась з помилкою")
+        else:
+            job.status = COMPLETED
+            job.summary = results[0]
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+            logging.info(f"Синхронізація {job.job_id}: {job.status}, {job.progress.to_dict()}")
+
+    async def close(self) -> None:
+        """Чекає на запущені синхронізації до wait_timeout планувальника;
+        ті, що так і не почалися, позначаються зупиненими."""
+        await self.scheduler.wait_and_close()
+
+        for job in self._jobs.values():
+            if job.status in (QUEUED, RUNNING):
+                job.status = CANCELLED
+                job.finished_at = datetime.now(timezone.utc)
+                logging.warning(f"Синхронізацію {job.job_id} скасовано під час зупинки застосунку")
+
+    def get(self, job_id: str) -> SyncJob:
+        try:
+            return self._jobs[job_id]
+        except KeyError:
+            raise SyncJobNotFoundException(job_id=job_id)
+
+    def list(self) -> list[SyncJob]:
+        return list(reversed(self._jobs.values()))
+
+
+def init_scheduler(config: Config) -> Scheduler:
+    return Scheduler(
+        limit=config.parser_max_concurrent_syncs,
+        pending_limit=config.parser_max_pending_syncs,
+        wait_timeout=config.parser_shutdown_timeout,
+    )
@@ -0,0 +1,123 @@
+import asyncio
+import logging
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from src.infrastructure.db.mongo import CrawlFrontierMongoDBService
+from src.infrastructure.db.services import BaseCommandCarsParserMongoDBService
+from src.infrastructure.parser.archive import BasePageArchive
+from src.infrastructure.parser.driver import WebDriverPool
+from src.infrastructure.parser.extraction import (
+    BaseExtractionRunner,
+    ThreadExtractionRunner,
+)
+from src.infrastructure.parser.fetchers import (
+    BaseFetcher,
+    init_fetcher,
+)
+from src.infrastructure.parser.frontier import (
+    DONE,
+    FAILED,
+)
+from src.infrastructure.parser.parser_auto import (
+    CarPageExtractor,
+    init_extractor,
+    parsing_data_cars,
+)
+from src.infrastructure.parser.progress import CrawlProgress
+from src.infrastructure.parser.throttle import AdaptiveConcurrencyLimiter
+from src.settings.config import Config
+
+
+@dataclass(eq=False)
+class CrawlWorker:
+    """Окремий процес обходу: бере в оренду пачки посилань з фронтиру,
+    розбирає їх і зберігає автомобілі.
+
+    Пагінацію й наповнення фронтиру виконує /sync, тож запуск більшої
+    кількості воркерів лише пришвидшує завантаження оголошень.
+    """
+
+    config: Config
+    frontier: CrawlFrontierMongoDBService
+    command_save_cars_service: BaseCommandCarsParserMongoDBService
+    webdriver_pool: WebDriverPool
+    fetch_limiter: AdaptiveConcurrencyLimiter
+    extraction_runner: BaseExtractionRunner = field(default_factory=ThreadExtractionRunner)
+    archive: BasePageArchive | None = None
+    idle_interval: float = 5.0
+
+    async def run(self, stop: asyncio.Event) -> CrawlProgress:
+        progress = CrawlProgress()
+        extractor = init_extractor(
+            html_backend=self.config.parser_html_backend,
+            schema_path=self.config.parser_schema_path,
+            mode=self.config.parser_extraction_mode,
+        )
+        logging.info(f"Воркер {self.frontier.worker_id} запущено")
+
+        # Оренда взятої пачки продовжується, поки її обробка триває довше за lease_seconds
+        async with (
+            init_fetcher(
+                self.config,
+                self.webdriver_pool,
+                self.fetch_limiter,
+                progress.metrics,
+            ) as fetcher,
+            self.frontier.heartbeat(),
+        ):
+            while not stop.is_set():
+                urls = await self.frontier.claim(self.config.parser_worker_batch_size)
+                if not urls:
+                    try:
+                        await asyncio.wait_for(stop.wait(), self.idle_interval)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                await self.process_batch(urls, fetcher, extractor, progress)
+                logging.info(f"Воркер {self.frontier.worker_id}: {progress.to_dict()}")
+
+        await self.frontier.flush()
+        logging.info(f"Етапи воркера {self.frontier.worker_id}: {progress.metrics.to_dict()}")
+        return progress
+
+    async def process_batch(
+        self,
+        urls: list[str],
+        fetcher: BaseFetcher,
+        extractor: CarPageExtractor,
+        progress: CrawlProgress,
+    ) -> None:
+        semaphore = asyncio.Semaphore(self.config.parser_concurrency)
+
+        async def parse(url: str) -> dict:
+            async with semaphore:
+                try:
+                    return await parsing_data_cars(
+                        url,
+                        fetcher,
+                        extractor,
+                        self.extraction_runner,
+                        progress.metrics,
+                        self.archive,
+                    )
+                except Exception as e:
+                    logging.error(f"Помилка при обробці {url}: {e}")
+                    return {}
+
+        results = await asyncio.gather(*(parse(url) for url in urls))
+        cars = [car for car in results if car]
+
+        # Стан посилань фіксується лише після запису автомобілів
+        with progress.metrics.timer("save"):
+            await self.command_save_cars_service.save_cars_from_parser(cars)
+        for url, car in zip(urls, results):
+            await self.frontier.mark(url, DONE if car else FAILED)
+        await self.frontier.flush()
+
+        progress.parsed += len(cars)
+        progress.saved += len(cars)
+        progress.errors += len(urls) - len(cars)
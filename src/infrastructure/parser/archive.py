@@ -0,0 +1,230 @@
+import logging
+import os
+import threading
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import AsyncIterator
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import (
+    quote,
+    unquote,
+)
+
+import anyio
+from src.settings.config import Config
+
+
+try:
+    import zstandard
+except ImportError:  # zstandard не входить до обов'язкових залежностей
+    zstandard = None
+
+
+# Формат часу в іменах файлів архіву: сортується як рядок
+FETCHED_AT_FORMAT = "%Y%m%dT%H%M%S%f"
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    """Сирий HTML сторінки оголошення на момент завантаження."""
+
+    olx_id: str
+    url: str
+    fetched_at: datetime
+    body: str
+
+
+def encode_page(page: ArchivedPage) -> bytes:
+    # URL у тому ж кадрі, що й сторінка: потрібен для повторного розбору
+    return f"{page.url}\n{page.body}".encode()
+
+
+def decode_page(olx_id: str, fetched_at: datetime, data: bytes) -> ArchivedPage:
+    url, _, body = data.decode().partition("\n")
+    return ArchivedPage(olx_id=olx_id, url=url, fetched_at=fetched_at, body=body)
+
+
+@dataclass(eq=False)
+class PageCodec:
+    """Стискання сторінок zstd зі спільним словником.
+
+    Сторінки OLX майже однакові за розміткою, тож словник, навчений на
+    них, стискає кожну окремо майже так само добре, як увесь архів разом.
+    Новий словник лише додається: ID словника записаний у кадрі zstd,
+    тому старі записи читаються словником, яким їх стиснуто.
+    """
+
+    level: int = 3
+    _dictionaries: dict = field(default_factory=dict, init=False, repr=False)
+    _current: object = field(default=None, init=False, repr=False)
+    _local: threading.local = field(default_factory=threading.local, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if zstandard is None:
+            raise RuntimeError("Page archive requires the zstandard package")
+
+    def add_dictionary(self, data: bytes) -> int:
+        """Додає словник і стискає ним нові сторінки."""
+        dictionary = zstandard.ZstdCompressionDict(data)
+        dictionary.precompute_compress(level=self.level)
+        self._dictionaries[dictionary.dict_id()] = dictionary
+        self._current = dictionary
+        return dictionary.dict_id()
+
+    def train(self, samples: list[bytes], size: int) -> bytes:
+        return zstandard.train_dictionary(size, samples, level=self.level).as_bytes()
+
+    def compress(self, data: bytes) -> bytes:
+        # Компресор zstd не можна ділити між потоками
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None or self._local.dictionary is not self._current:
+            compressor = zstandard.ZstdCompressor(level=self.level, dict_data=self._current)
+            self._local.compressor, self._local.dictionary = compressor, self._current
+        return compressor.compress(data)
+
+    def decompress(self, frame: bytes) -> bytes:
+        dict_id = zstandard.get_frame_parameters(frame).dict_id
+        # Декомпресор на кожен словник у кожному потоці: словники лише додаються
+        decompressors = getattr(self._local, "decompressors", None)
+        if decompressors is None:
+            decompressors = self._local.decompressors = {}
+
+        decompressor = decompressors.get(dict_id)
+        if decompressor is None:
+            if dict_id and dict_id not in self._dictionaries:
+                raise ValueError(f"Unknown archive dictionary {dict_id}")
+            decompressor = zstandard.ZstdDecompressor(dict_data=self._dictionaries.get(dict_id))
+            decompressors[dict_id] = decompressor
+        return decompressor.decompress(frame)
+
+
+def init_page_codec(config: Config) -> PageCodec:
+    return PageCodec(level=config.parser_archive_level)
+
+
+@dataclass(eq=False)
+class BasePageArchive(ABC):
+    """Архів сирих сторінок оголошень з ключем за ID оголошення і часом
+    завантаження: поля можна витягнути заново без повторного обходу."""
+
+    codec: PageCodec
+    _dictionaries_loaded: bool = field(default=False, init=False, repr=False)
+
+    @abstractmethod
+    async def _put(self, olx_id: str, fetched_at: datetime, url: str, frame: bytes) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def _latest(self) -> AsyncIterator[tuple[str, datetime, bytes]]:
+        """Найсвіжіший стиснутий кадр кожного оголошення."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _read_dictionaries(self) -> list[bytes]:
+        """Збережені словники від найстарішого до найновішого."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def _write_dictionary(self, dict_id: int, data: bytes) -> None:
+        raise NotImplementedError()
+
+    async def load_dictionaries(self) -> None:
+        if self._dictionaries_loaded:
+            return
+
+        for data in await self._read_dictionaries():
+            self.codec.add_dictionary(data)
+        self._dictionaries_loaded = True
+
+    async def save_dictionary(self, data: bytes) -> int:
+        await self.load_dictionaries()
+        dict_id = self.codec.add_dictionary(data)
+        await self._write_dictionary(dict_id, data)
+        return dict_id
+
+    async def put(self, page: ArchivedPage) -> int:
+        """Повертає розмір стиснутого запису."""
+        await self.load_dictionaries()
+        frame = await anyio.to_thread.run_sync(self.codec.compress, encode_page(page))
+        await self._put(page.olx_id, page.fetched_at, page.url, frame)
+        return len(frame)
+
+    async def latest(self) -> AsyncIterator[ArchivedPage]:
+        await self.load_dictionaries()
+        async for olx_id, fetched_at, frame in self._latest():
+            try:
+                data = await anyio.to_thread.run_sync(self.codec.decompress, frame)
+            except (ValueError, zstandard.ZstdError) as e:
+                logging.error(f"Пошкоджений запис архіву {olx_id} від {fetched_at}: {e}")
+                continue
+            yield decode_page(olx_id, fetched_at, data)
+
+
+@dataclass(eq=False)
+class FilePageArchive(BasePageArchive):
+    """Архів у файлах: `pages/<ID оголошення>/<час завантаження>.zst`,
+    словники — `dictionaries/<ID словника>.zdict`."""
+
+    directory: Path
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        (self.directory / "pages").mkdir(parents=True, exist_ok=True)
+        (self.directory / "dictionaries").mkdir(exist_ok=True)
+
+    def _page_dir(self, olx_id: str) -> Path:
+        # Посилання без ID дають ключ-шлях зі слешами
+        return self.directory / "pages" / quote(olx_id, safe="")
+
+    async def _put(self, olx_id: str, fetched_at: datetime, url: str, frame: bytes) -> None:
+        await anyio.to_thread.run_sync(self._write, self._page_dir(olx_id), fetched_at, frame)
+
+    @staticmethod
+    def _write(page_dir: Path, fetched_at: datetime, frame: bytes) -> None:
+        page_dir.mkdir(exist_ok=True)
+        path = page_dir / f"{fetched_at.strftime(FETCHED_AT_FORMAT)}.zst"
+
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(frame)
+        os.replace(tmp_path, path)
+
+    async def _latest(self) -> AsyncIterator[tuple[str, datetime, bytes]]:
+        page_dirs = await anyio.to_thread.run_sync(lambda: sorted((self.directory / "pages").iterdir()))
+        for page_dir in page_dirs:
+            frames = sorted(page_dir.glob("*.zst"))
+            if not frames:
+                continue
+
+            path = frames[-1]
+            frame = await anyio.to_thread.run_sync(path.read_bytes)
+            yield unquote(page_dir.name), datetime.strptime(path.stem, FETCHED_AT_FORMAT), frame
+
+    async def _read_dictionaries(self) -> list[bytes]:
+        paths = sorted((self.directory / "dictionaries").glob("*.zdict"), key=lambda path: path.stat().st_mtime)
+        return [path.read_bytes() for path in paths]
+
+    async def _write_dictionary(self, dict_id: int, data: bytes) -> None:
+        (self.directory / "dictionaries" / f"{dict_id}.zdict").write_bytes(data)
+
+
+async def train_dictionary(archive: BasePageArchive, samples: int, size: int) -> int:
+    """Навчає новий спільний словник на найсвіжіших сторінках архіву."""
+    pages = []
+    async for page in archive.latest():
+        pages.append(encode_page(page))
+        if len(pages) >= samples:
+            break
+
+    if not pages:
+        raise ValueError("Page archive is empty, nothing to train the dictionary on")
+
+    logging.info(f"Навчаємо словник архіву на {len(pages)} сторінках")
+    data = await anyio.to_thread.run_sync(archive.codec.train, pages, size)
+    return await archive.save_dictionary(data)
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+
+from src.infrastructure.parser.schema import CarPageSchema
+
+
+# Повторює BaseHTMLParser.text: обрізані текстові вузли без роздільника,
+# як get_text(strip=True) у BeautifulSoup
+DETAIL_SCRIPT = """
+const [elements, paramSelector, locationBlock, locationParts, waitFor, removed] = arguments;
+const text = (node) => {
+    const walker = document.createTreeWalker(node, NodeFilter.SHOW_TEXT);
+    let result = "";
+    while (walker.nextNode()) {
+        result += walker.currentNode.nodeValue.trim();
+    }
+    return result;
+};
+const block = document.querySelector(locationBlock);
+const found = waitFor.filter((name) => document.getElementsByClassName(name).length > 0).length;
+return {
+    ready: found === waitFor.length,
+    found: found,
+    removed: removed.some((selector) => document.querySelector(selector) !== null),
+    elements: elements.map(([selector, attr]) => {
+        const node = document.querySelector(selector);
+        if (node === null) {
+            return null;
+        }
+        return attr ? node.getAttribute(attr) : text(node);
+    }),
+    params: Array.from(document.querySelectorAll(paramSelector), text),
+    location: block === null ? null : locationParts.map((selector) => {
+        const node = block.querySelector(selector);
+        return node === null ? "" : text(node);
+    }),
+};
+"""
+
+
+@dataclass(frozen=True)
+class BrowserScript:
+    """Скрипт для execute_script з аргументами, взятими зі схеми."""
+
+    source: str
+    args: tuple
+
+    def is_ready(self, fields: dict) -> bool:
+        return bool(fields.get("ready"))
+
+    def is_partial(self, fields: dict) -> bool:
+        return not self.is_ready(fields) and bool(fields.get("found"))
+
+    def is_removed(self, fields: dict) -> bool:
+        return bool(fields.get("removed"))
+
+
+def removed_selector(marker: str) -> str:
+    """Маркери знятого оголошення — значення data-testid."""
+    return f'[data-testid="{marker}"]'
+
+
+def build_detail_script(schema: CarPageSchema) -> BrowserScript:
+    """Скрипт збирає в сторінці лише потрібні схемі значення і повертає
+    їх компактним об'єктом замість усього page_source."""
+    return BrowserScript(
+        source=DETAIL_SCRIPT,
+        args=(
+            [[element.selector, element.attr] for element in schema.elements],
+            schema.param_selector,
+            schema.location_block,
+            list(schema.location_parts),
+            list(schema.detail_wait_for),
+            [removed_selector(marker) for marker in schema.detail_removed],
+        ),
+    )
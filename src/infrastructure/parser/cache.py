@@ -0,0 +1,151 @@
+import gzip
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from pathlib import Path
+
+import orjson
+from src.infrastructure.parser.utils import canonical_url
+
+
+@dataclass(frozen=True)
+class CachedPage:
+    url: str
+    body: str
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    def is_fresh(self, ttl: float) -> bool:
+        return time.time() - self.stored_at < ttl
+
+    @property
+    def validators(self) -> dict:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass(eq=False)
+class DiskPageCache:
+    """Кеш сторінок на диску з ключем за канонічним URL.
+
+    Записи старші за ttl не видаляються, а перевіряються умовним запитом.
+    Коли розмір кешу перевищує max_bytes, видаляються записи, до яких
+    найдовше не зверталися.
+    """
+
+    directory: Path
+    ttl: float = 3600.0
+    max_bytes: int = 512 * 1024 * 1024
+    _size: int | None = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.directory = Path(self.directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _entries(self) -> list[Path]:
+        return list(self.directory.glob("*/*.gz"))
+
+    def _measured_size(self) -> int:
+        # Обхід усього кешу дорогий: він виконується лише раз, у потоці
+        # першого запису, а не при створенні кешу в циклі подій
+        if self._size is None:
+            self._size = sum(path.stat().st_size for path in self._entries())
+        return self._size
+
+    def _path(self, url: str) -> Path:
+        key = hashlib.sha256(canonical_url(url).encode()).hexdigest()
+        return self.directory / key[:2] / f"{key}.gz"
+
+    def get(self, url: str) -> CachedPage | None:
+        path = self._path(url)
+        try:
+            data = orjson.loads(gzip.decompress(path.read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError) as e:
+            logging.warning(f"Пошкоджений запис кешу {path}: {e}")
+            self._remove(path)
+            return None
+
+        # mtime слугує часом останнього звернення для LRU-витіснення
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            pass
+        return CachedPage(**data)
+
+    def put(
+        self,
+        url: str,
+        body: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> None:
+        page = CachedPage(
+            url=canonical_url(url),
+            body=body,
+            etag=etag,
+            last_modified=last_modified,
+            stored_at=time.time(),
+        )
+        self._write(self._path(url), page)
+
+    def revalidated(self, page: CachedPage) -> None:
+        """Позначає запис свіжим після відповіді 304 Not Modified."""
+        self.put(page.url, page.body, page.etag, page.last_modified)
+
+    def _write(self, path: Path, page: CachedPage) -> None:
+        payload = gzip.compress(orjson.dumps(page.__dict__))
+        path.parent.mkdir(exist_ok=True)
+
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(payload)
+
+        with self._lock:
+            size = self._measured_size()
+            old_size = path.stat().st_size if path.exists() else 0
+            os.replace(tmp_path, path)
+            self._size = size + len(payload) - old_size
+            over_limit = self._size > self.max_bytes
+
+        if over_limit:
+            self._evict()
+
+    def _remove(self, path: Path) -> None:
+        with self._lock:
+            total = self._measured_size()
+            try:
+                size = path.stat().st_size
+                path.unlink()
+            except FileNotFoundError:
+                return
+            self._size = total - size
+
+    def _evict(self) -> None:
+        # Звільняємо із запасом, щоб не запускати витіснення на кожен запис
+        target = int(self.max_bytes * 0.9)
+        entries = []
+        for path in self._entries():
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        for _, path in sorted(entries):
+            if self._size <= target:
+                break
+            self._remove(path)
+
+        logging.info(f"Кеш сторінок стиснуто до {self._size} байт")
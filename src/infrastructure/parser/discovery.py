@@ -0,0 +1,400 @@
+import asyncio
+import logging
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import (
+    Awaitable,
+    Callable,
+)
+from dataclasses import dataclass
+from urllib.parse import urlencode
+
+import orjson
+from src.infrastructure.exceptions.parser import PageFetchException
+from src.infrastructure.parser.fetchers import BaseFetcher
+from src.infrastructure.parser.metrics import CrawlMetrics
+from src.infrastructure.parser.page_state import (
+    details_from_mapping,
+    get_path,
+)
+from src.infrastructure.parser.partitions import (
+    BasePartitionStore,
+    PricePartition,
+)
+from src.infrastructure.parser.progress import CrawlProgress
+from src.infrastructure.parser.schema import CarPageSchema
+
+
+OLX_OFFERS_API_URL = "https://www.olx.ua/api/v1/offers/"
+# Легкові автомобілі
+OLX_CARS_CATEGORY_ID = 108
+# Більше за один запит API не віддає
+OFFERS_MAX_PAGE_SIZE = 50
+# Новіші спершу: порядок не змінюється між запитами сусідніх сторінок
+OFFERS_SORT = "created_at:desc"
+# Відповідь без масиву data — сторінка помилки або капча, її варто повторити
+OFFERS_WAIT_FOR = ('"data"',)
+OFFERS_PHOTO_SIZE = "1000x700"
+OFFERS_TOTAL_PATH = ("metadata", "total_elements")
+
+PageHandler = Callable[[int, dict[str, dict]], Awaitable[None]]
+
+
+@dataclass(frozen=True)
+class ListingPage:
+    """Оголошення сторінки пошуку: `посилання -> поля картки`. last
+    позначає сторінку, після якої результатів більше немає."""
+
+    cards: dict[str, dict]
+    last: bool = False
+
+
+async def crawl_pages(
+    pages: range,
+    fetch_listing_page: Callable[[int], Awaitable[ListingPage]],
+    on_page: PageHandler | None = None,
+    progress: CrawlProgress | None = None,
+    metrics: CrawlMetrics | None = None,
+    stop_when_exhausted: bool = True,
+) -> set:
+    """Завантажує сторінки пошуку паралельно, але об'єднує їх по порядку,
+    щоб знайти першу порожню, повторну або останню сторінку.
+
+    on_page викликається для кожної обробленої сторінки по порядку і
+    слугує точкою збереження прогресу. Без stop_when_exhausted сторінки
+    незалежні, як розділи пошуку, і обходяться всі.
+    """
+    if metrics is None:
+        metrics = CrawlMetrics()
+
+    # Семафор у fetch_listing_page пропускає сторінки по черзі, тож спершу завантажуються найближчі
+    tasks = [asyncio.create_task(fetch_listing_page(page)) for page in pages]
+
+    car_links = set()
+    last_page_links = None
+    try:
+        for page, current_page_task in zip(pages, tasks):
+            try:
+                listing_page = await current_page_task
+            except PageFetchException as e:
+                # Одна недоступна сторінка не завершує обхід пагінації
+                logging.error(f"Пропускаємо сторінку {page}: {e.message}")
+                metrics.count("fetch_errors")
+                if progress is not None:
+                    progress.errors += 1
+                continue
+
+            current_page_links = set(listing_page.cards)
+            if stop_when_exhausted and not current_page_links:
+                logging.info("Оголошення не знайдені - завершуємо обхід пагінації.")
+                break
+
+            if stop_when_exhausted and last_page_links is not None and current_page_links == last_page_links:
+                logging.info("Досягнуто останньої унікальної сторінки, припиняю обхід.")
+                break
+
+            car_links |= current_page_links
+            last_page_links = current_page_links
+            if progress is not None:
+                progress.pages += 1
+            if on_page is not None:
+                await on_page(page, listing_page.cards)
+
+            if stop_when_exhausted and listing_page.last:
+                logging.info("Остання сторінка результатів, завершуємо обхід пагінації.")
+                break
+    finally:
+        # Сторінки за кінцем пагінації більше не потрібні
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    return car_links
+
+
+@dataclass
+class BaseListingDiscovery(ABC):
+    """Знаходить оголошення на сторінках пошуку разом із полями їхніх
+    карток."""
+
+    @abstractmethod
+    def cursor_key(self, partition: PricePartition | None = None) -> str:
+        """Ключ курсора пагінації у фронтирі: номери сторінок різних
+        джерел не збігаються."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def discover(
+        self,
+        pages: int,
+        start_page: int = 0,
+        on_page: PageHandler | None = None,
+        progress: CrawlProgress | None = None,
+        partition: PricePartition | None = None,
+    ) -> set:
+        raise NotImplementedError()
+
+    async def count(
+        self,
+        partition: PricePartition | None = None,
+        progress: CrawlProgress | None = None,
+    ) -> int | None:
+        """Кількість оголошень, яку повідомляє пошук, або None, якщо
+        джерело її не знає."""
+        return None
+
+
+def offer_card(offer: dict, schema: CarPageSchema) -> dict:
+    card = details_from_mapping(offer, schema.offers, schema)
+    if "url_image" in card:
+        card["url_image"] = card["url_image"].replace("{width}x{height}", OFFERS_PHOTO_SIZE)
+    return card
+
+
+def offers_page(body: str, url: str, schema: CarPageSchema, page_size: int) -> ListingPage:
+    try:
+        payload = orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        logging.error(f"Відповідь API не є JSON ({e}): {url}")
+        raise PageFetchException(url=url) from None
+
+    offers = get_path(payload, ("data",))
+    if not isinstance(offers, list):
+        raise PageFetchException(url=url)
+
+    cards = {}
+    for offer in offers:
+        offer_url = get_path(offer, schema.offers.url_path) if isinstance(offer, dict) else None
+        if isinstance(offer_url, str):
+            cards[offer_url] = offer_card(offer, schema)
+
+    return ListingPage(cards=cards, last=len(offers) < page_size)
+
+
+@dataclass
+class OffersAPIDiscovery(BaseListingDiscovery):
+    """Гортає JSON API оголошень OLX замість сторінок пошуку в Chrome:
+    один невеликий запит віддає page_size оголошень із полями карток.
+
+    api_url можна спрямувати на локальний сервер-заглушку, що віддає
+    відповіді у форматі `{"data": [...]}`.
+    """
+
+    fetcher: BaseFetcher
+    schema: CarPageSchema
+    api_url: str = OLX_OFFERS_API_URL
+    category_id: int = OLX_CARS_CATEGORY_ID
+    page_size: int = OFFERS_MAX_PAGE_SIZE
+    concurrency: int = 1
+
+    def _url(self, **params) -> str:
+        separator = "&" if "?" in self.api_url else "?"
+        return f"{self.api_url}{separator}{urlencode(params)}"
+
+    def cursor_key(self, partition: PricePartition | None = None) -> str:
+        filters = partition.filters() if partition is not None else {}
+        return self._url(category_id=self.category_id, limit=self.page_size, **filters)
+
+    def page_url(
+        self,
+        page: int,
+        partition: PricePartition | None = None,
+        limit: int | None = None,
+    ) -> str:
+        limit = self.page_size if limit is None else limit
+        filters = partition.filters() if partition is not None else {}
+        return self._url(
+            offset=page * limit,
+            limit=limit,
+            category_id=self.category_id,
+            sort_by=OFFERS_SORT,
+            **filters,
+        )
+
+    async def count(
+        self,
+        partition: PricePartition | None = None,
+        progress: CrawlProgress | None = None,
+    ) -> int | None:
+        metrics = progress.metrics if progress is not None else CrawlMetrics()
+        url = self.page_url(0, partition, limit=1)
+        with metrics.timer("fetch.probe"):
+            body = await self.fetcher.fetch(url, wait_for=OFFERS_WAIT_FOR)
+
+        try:
+            total = get_path(orjson.loads(body), OFFERS_TOTAL_PATH)
+        except orjson.JSONDecodeError as e:
+            logging.error(f"Відповідь API не є JSON ({e}): {url}")
+            return None
+        return total if isinstance(total, int) else None
+
+    async def discover(
+        self,
+        pages: int,
+        start_page: int = 0,
+        on_page: PageHandler | None = None,
+        progress: CrawlProgress | None = None,
+        partition: PricePartition | None = None,
+    ) -> set:
+        semaphore = asyncio.Semaphore(self.concurrency)
+        metrics = progress.metrics if progress is not None else CrawlMetrics()
+
+        async def fetch_offers(page: int) -> ListingPage:
+            url = self.page_url(page, partition)
+            async with semaphore:
+                logging.info(f"Обробляємо сторінку API {page}: {url}")
+                with metrics.timer("fetch.offers"):
+                    body = await self.fetcher.fetch(url, wait_for=OFFERS_WAIT_FOR)
+
+            metrics.count("pages_fetched")
+            metrics.count("page_chars", len(body))
+            with metrics.timer("extract.offers"):
+                listing_page = offers_page(body, url, self.schema, self.page_size)
+            metrics.count("offers", len(listing_page.cards))
+            return listing_page
+
+        return await crawl_pages(
+            range(start_page, pages),
+            fetch_offers,
+            on_page=on_page,
+            progress=progress,
+            metrics=metrics,
+        )
+
+
+@dataclass
+class PartitionedDiscovery(BaseListingDiscovery):
+    """Обходить пошук діапазонами цін, кожен з яких сайт дає догорнути до
+    кінця: діапазон, у якому більше за cap оголошень, ділиться навпіл.
+
+    Розбиття і розміри діапазонів зберігаються в store, тож наступна
+    синхронізація бере вивчене розбиття без повторних проб і ділить лише
+    ті діапазони, обхід яких уперся в cap. Діапазони обходяться
+    паралельно, а для фронтиру номер сторінки — це номер діапазону в
+    розбитті, тож перерваний обхід продовжується за незмінним розбиттям.
+    """
+
+    inner: BaseListingDiscovery
+    store: BasePartitionStore
+    cap: int = 1000
+    price_step: int = 5000
+    concurrency: int = 4
+
+    def cursor_key(self, partition: PricePartition | None = None) -> str:
+        return f"{self.inner.cursor_key(partition)}#partitions"
+
+    async def probe(
+        self,
+        partition: PricePartition,
+        semaphore: asyncio.Semaphore,
+        progress: CrawlProgress | None = None,
+    ) -> dict[PricePartition, int | None]:
+        metrics = progress.metrics if progress is not None else CrawlMetrics()
+        try:
+            async with semaphore:
+                size = await self.inner.count(partition, progress)
+        except PageFetchException as e:
+            logging.error(f"Не вдалося дізнатися розмір діапазону {partition.key}: {e.message}")
+            size = None
+        metrics.count("partition_probes")
+
+        # Невідомий розмір зберігається як None і перевіряється наступною синхронізацією
+        if size is None or size <= self.cap:
+            return {partition: size}
+        if not partition.can_split():
+            logging.warning(f"Діапазон {partition.key} більший за ліміт пагінації: {size}")
+            return {partition: size}
+
+        sizes = {}
+        for part_sizes in await asyncio.gather(
+            *(self.probe(part, semaphore, progress) for part in partition.split(self.price_step)),
+        ):
+            sizes.update(part_sizes)
+        return sizes
+
+    async def plan(
+        self,
+        progress: CrawlProgress | None = None,
+        frozen: bool = False,
+    ) -> dict[PricePartition, int | None]:
+        """frozen залишає збережене розбиття як є: номери діапазонів у
+        курсорі фронтиру мають вказувати на ті самі діапазони."""
+        source = self.inner.cursor_key()
+        learned = await self.store.load(source)
+        if learned and frozen:
+            return learned
+        if not learned:
+            logging.info("Розбиття пошуку ще не відоме, перевіряємо розміри діапазонів")
+            to_probe = [PricePartition()]
+            planned = {}
+        else:
+            # Обійдений діапазон не буває більшим за cap: рівний cap уперся в ліміт
+            exhausted = {
+                partition
+                for partition, size in learned.items()
+                if size is not None and size >= self.cap and partition.can_split()
+            }
+            unknown = [partition for partition, size in learned.items() if size is None]
+            to_probe = [part for partition in exhausted for part in partition.split(self.price_step)] + unknown
+            planned = {
+                partition: size
+                for partition, size in learned.items()
+                if partition not in exhausted and size is not None
+            }
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        for sizes in await asyncio.gather(*(self.probe(partition, semaphore, progress) for partition in to_probe)):
+            planned.update(sizes)
+
+        if to_probe:
+            await self.store.save(source, planned)
+        return planned
+
+    async def discover(
+        self,
+        pages: int,
+        start_page: int = 0,
+        on_page: PageHandler | None = None,
+        progress: CrawlProgress | None = None,
+        partition: PricePartition | None = None,
+    ) -> set:
+        """pages обмежує кількість сторінок кожного діапазону."""
+        metrics = progress.metrics if progress is not None else CrawlMetrics()
+        planned = await self.plan(progress, frozen=start_page > 0)
+        plan = sorted(planned)
+        logging.info(f"Розбиття пошуку: {len(plan)} діапазонів цін")
+        metrics.count("partitions", len(plan))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        crawled = {}
+
+        async def crawl_partition(index: int) -> ListingPage:
+            cards = {}
+
+            async def collect(page: int, page_cards: dict[str, dict]) -> None:
+                cards.update(page_cards)
+
+            async with semaphore:
+                with metrics.timer("partition.crawl"):
+                    await self.inner.discover(pages, on_page=collect, progress=progress, partition=plan[index])
+            crawled[plan[index]] = len(cards)
+            return ListingPage(cards=cards)
+
+        try:
+            return await crawl_pages(
+                range(start_page, len(plan)),
+                crawl_partition,
+                on_page=on_page,
+                metrics=metrics,
+                stop_when_exhausted=False,
+            )
+        finally:
+            # Розмір лише зростає: обхід обмежений pages і може не дійти до кінця діапазону,
+            # тому невідомий розмір не замінюється кількістю обійдених оголошень
+            sizes = {
+                partition: None if size is None else max(size, crawled.get(partition, 0))
+                for partition, size in planned.items()
+            }
+            await self.store.save(self.inner.cursor_key(), sizes)
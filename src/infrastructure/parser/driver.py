@@ -0,0 +1,340 @@
+import asyncio
+import logging
+import os
+import re
+import shutil
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+)
+from contextlib import asynccontextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import lru_cache
+
+import anyio
+import orjson
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+
+HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/85.0.4183.121 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Encoding": "gzip, deflate, br",
+    "Accept-Language": "uk,ru,en;q=0.8",
+    "Connection": "keep-alive",
+    "Cache-Control": "no-cache",
+    "Pragma": "no-cache",
+}
+
+# Шаблони для CDP Network.setBlockedURLs, "*" відповідає будь-якому рядку
+BLOCKED_RESOURCES: dict[str, tuple[str, ...]] = {
+    "images": (
+        "*.jpg*",
+        "*.jpeg*",
+        "*.png*",
+        "*.gif*",
+        "*.webp*",
+        "*.avif*",
+        "*.svg*",
+        "*.ico*",
+        # зображення оголошень OLX віддаються без розширення в URL
+        "*olxcdn.com/v1/files/*",
+    ),
+    "fonts": ("*.woff*", "*.woff2*", "*.ttf*", "*.otf*", "*.eot*"),
+    "stylesheets": ("*.css", "*.css?*"),
+    "media": ("*.mp4*", "*.webm*", "*.m3u8*"),
+    "trackers": (
+        "*google-analytics.com*",
+        "*googletagmanager.com*",
+        "*googlesyndication.com*",
+        "*doubleclick.net*",
+        "*facebook.net*",
+        "*facebook.com/tr*",
+        "*hotjar.com*",
+        "*criteo.*",
+        "*adnxs.com*",
+        "*tiktok.com*",
+        "*clarity.ms*",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ResourceBlockPolicy:
+    """Які ресурси Chrome не завантажує.
+
+    Блокування відбувається на рівні мережі, тому DOM не змінюється:
+    атрибут src у тегах img лишається, просто саме зображення не
+    завантажується.
+    """
+
+    categories: tuple[str, ...] = ()
+    extra_patterns: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        unknown = set(self.categories) - BLOCKED_RESOURCES.keys()
+        if unknown:
+            raise ValueError(f"Unknown blocked resource categories: {sorted(unknown)}")
+
+    @classmethod
+    def from_string(cls, categories: str, extra_patterns: str = "") -> "ResourceBlockPolicy":
+        return cls(
+            categories=tuple(item.strip() for item in categories.split(",") if item.strip()),
+            extra_patterns=tuple(
+                item.strip() for item in extra_patterns.split(",") if item.strip()
+            ),
+        )
+
+    @property
+    def url_patterns(self) -> list[str]:
+        patterns = [
+            pattern
+            for category in self.categories
+            for pattern in BLOCKED_RESOURCES[category]
+        ]
+        return [*patterns, *self.extra_patterns]
+
+    def category_of(self, url: str) -> str:
+        """Категорія, шаблон якої заблокував URL: custom для
+        PARSER_BLOCKED_URL_PATTERNS, other для решти причин блокування."""
+        for category in self.categories:
+            if any(match_url_pattern(pattern, url) for pattern in BLOCKED_RESOURCES[category]):
+                return category
+        if any(match_url_pattern(pattern, url) for pattern in self.extra_patterns):
+            return "custom"
+        return "other"
+
+
+@lru_cache(maxsize=256)
+def compile_url_pattern(pattern: str) -> re.Pattern:
+    return re.compile(".*".join(re.escape(part) for part in pattern.split("*")))
+
+
+def match_url_pattern(pattern: str, url: str) -> bool:
+    """Збіг URL із шаблоном Network.setBlockedURLs, де "*" — будь-який рядок."""
+    return compile_url_pattern(pattern).fullmatch(url) is not None
+
+
+@dataclass
+class PageTraffic:
+    """Мережевий трафік однієї сторінки за performance-логом Chrome."""
+
+    requests: int = 0
+    blocked: int = 0
+    blocked_by_category: dict[str, int] = field(default_factory=dict)
+    bytes: int = 0
+    dom_ready_ms: float | None = None
+
+
+def collect_page_traffic(
+    driver,
+    block_policy: ResourceBlockPolicy = ResourceBlockPolicy(),
+) -> PageTraffic:
+    """Зчитує і водночас очищає performance-лог драйвера після
+    завантаження сторінки. Заблоковані запити розкладаються за категоріями
+    block_policy."""
+    traffic = PageTraffic()
+    urls: dict[str, str] = {}
+
+    for entry in driver.get_log("performance"):
+        message = orjson.loads(entry["message"])["message"]
+        method = message.get("method")
+        params = message.get("params", {})
+
+        if method == "Network.requestWillBeSent":
+            urls[params.get("requestId")] = params.get("request", {}).get("url", "")
+        elif method == "Network.loadingFinished":
+            traffic.requests += 1
+            traffic.bytes += int(params.get("encodedDataLength", 0))
+        elif method == "Network.loadingFailed" and params.get("blockedReason"):
+            traffic.blocked += 1
+            category = block_policy.category_of(urls.get(params.get("requestId"), ""))
+            traffic.blocked_by_category[category] = traffic.blocked_by_category.get(category, 0) + 1
+
+    traffic.dom_ready_ms = driver.execute_script(
+        "const nav = performance.getEntriesByType('navigation')[0];"
+        "return nav ? nav.domContentLoadedEventEnd - nav.startTime : null;",
+    )
+    return traffic
+
+
+@lru_cache
+def resolve_driver_path(driver_path: str | None = None) -> str:
+    """Шлях до chromedriver з конфігурації або з PATH, без звернень до
+    мережі."""
+    if driver_path:
+        if not os.access(driver_path, os.X_OK):
+            raise RuntimeError(f"Chromedriver is not executable: {driver_path}")
+        return driver_path
+
+    found_path = shutil.which("chromedriver")
+    if found_path is None:
+        raise RuntimeError(
+            "Chromedriver not found in PATH, set PARSER_CHROMEDRIVER_PATH",
+        )
+    return found_path
+
+
+def init_driver(
+    page_load_strategy: str = "eager",
+    driver_path: str | None = None,
+    block_policy: ResourceBlockPolicy = ResourceBlockPolicy(),
+    log_traffic: bool = True,
+):
+    options = Options()
+    # "eager" чекає лише DOMContentLoaded, "none" взагалі не блокує driver.get
+    options.page_load_strategy = page_load_strategy
+    options.add_argument("--headless")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--window-size=1920,1080")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--lang=uk")
+    if log_traffic:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+    service = Service(resolve_driver_path(driver_path))
+    driver = webdriver.Chrome(service=service, options=options)
+
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": HEADERS})
+    blocked_urls = block_policy.url_patterns
+    if blocked_urls:
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": blocked_urls})
+
+    return driver
+
+
+def is_driver_alive(driver) -> bool:
+    try:
+        driver.execute_script("return 1")
+    except WebDriverException:
+        return False
+    return True
+
+
+def quit_driver(driver) -> None:
+    try:
+        driver.quit()
+    except WebDriverException as e:
+        logging.warning(f"Не вдалося коректно закрити драйвер: {e}")
+
+
+@dataclass(eq=False)
+class WebDriverPool:
+    """Обмежений пул прогрітих драйверів Chrome.
+
+    Кожен драйвер одночасно обслуговує лише одну сторінку, тому кількість
+    паралельних завантажень через браузер дорівнює розміру пулу. У черзі
+    лежать вільні драйвери і None на кожне вільне місце без драйвера:
+    той, хто отримав None, сам створює драйвер на цьому місці.
+    """
+
+    size: int
+    driver_factory: Callable = init_driver
+    _idle: asyncio.Queue = field(default_factory=asyncio.Queue, init=False, repr=False)
+    _alive: int = field(default=0, init=False, repr=False)
+    _started: bool = field(default=False, init=False, repr=False)
+    _closed: bool = field(default=False, init=False, repr=False)
+    _start_lock: asyncio.Lock = field(default_factory=asyncio.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for _ in range(self.size):
+            self._idle.put_nowait(None)
+
+    async def start(self) -> None:
+        async with self._start_lock:
+            if self._started:
+                return
+
+            self._closed = False
+            slots = [self._idle.get_nowait() for _ in range(self._idle.qsize())]
+            for driver in slots:
+                if driver is not None:
+                    self._idle.put_nowait(driver)
+
+            results = await asyncio.gather(
+                *(self._create() for driver in slots if driver is None),
+                return_exceptions=True,
+            )
+            errors = []
+            for result in results:
+                if isinstance(result, Exception):
+                    errors.append(result)
+                    self._idle.put_nowait(None)
+                else:
+                    self._idle.put_nowait(result)
+            if errors and not self._alive:
+                raise errors[0]
+            if errors:
+                # Решту драйверів acquire() створить пізніше, коли їх забракне
+                logging.warning(f"Не вдалося запустити {len(errors)} драйверів Chrome: {errors[0]}")
+
+            self._started = True
+            logging.info(f"Запущено пул з {self._alive} драйверів Chrome")
+
+    async def _create(self):
+        driver = await anyio.to_thread.run_sync(self.driver_factory)
+        self._alive += 1
+        return driver
+
+    async def _checkout(self):
+        driver = await self._idle.get()
+        if self._closed:
+            # Місце лишається в черзі, щоб решта очікувачів теж прокинулася
+            self._idle.put_nowait(driver)
+            raise RuntimeError("WebDriver pool is closed")
+        if driver is not None:
+            return driver
+
+        try:
+            return await self._create()
+        except BaseException:
+            # Місце звільняється: наступний очікувач спробує створити драйвер сам
+            self._idle.put_nowait(None)
+            raise
+
+    async def _discard(self, driver) -> None:
+        self._alive -= 1
+        self._idle.put_nowait(None)
+        await anyio.to_thread.run_sync(quit_driver, driver)
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator:
+        await self.start()
+        driver = await self._checkout()
+        try:
+            yield driver
+        except WebDriverException:
+            if not await anyio.to_thread.run_sync(is_driver_alive, driver):
+                logging.warning("Драйвер Chrome не пройшов перевірку, новий буде створено за потреби")
+                await self._discard(driver)
+                driver = None
+            raise
+        finally:
+            if driver is not None and self._closed:
+                # Пул закрили, поки драйвер був зайнятий
+                await self._discard(driver)
+            elif driver is not None:
+                self._idle.put_nowait(driver)
+
+    async def close(self) -> None:
+        async with self._start_lock:
+            self._closed = True
+            drivers = [self._idle.get_nowait() for _ in range(self._idle.qsize())]
+            for driver in drivers:
+                self._idle.put_nowait(None)
+                if driver is not None:
+                    self._alive -= 1
+                    await anyio.to_thread.run_sync(quit_driver, driver)
+            self._started = False
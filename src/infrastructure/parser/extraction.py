@@ -0,0 +1,105 @@
+import asyncio
+import logging
+import multiprocessing
+import os
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Any,
+    TypeVar,
+)
+
+import anyio
+from src.settings.config import Config
+
+
+T = TypeVar("T")
+
+
+@dataclass(eq=False)
+class BaseExtractionRunner(ABC):
+    """Де виконується CPU-важкий розбір HTML, поки event loop
+    завантажує сторінки."""
+
+    @abstractmethod
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        raise NotImplementedError()
+
+    def close(self) -> None:
+        pass
+
+
+@dataclass(eq=False)
+class ThreadExtractionRunner(BaseExtractionRunner):
+    """Розбір у потоці: не блокує event loop, але ділить GIL з API."""
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        return await anyio.to_thread.run_sync(func, *args)
+
+
+@dataclass(eq=False)
+class ProcessExtractionRunner(BaseExtractionRunner):
+    """Розбір у пулі процесів за кількістю ядер.
+
+    func і аргументи передаються між процесами через pickle, тому func
+    має бути функцією рівня модуля, а екстрактор — серіалізовним. Процеси
+    створюються через spawn: fork процесу з потоками Chrome і httpx
+    небезпечний. Якщо процес пулу гине, наприклад від нестачі пам'яті,
+    пул створюється заново, а розбір повторюється один раз.
+    """
+
+    max_workers: int | None = None
+    _executor: ProcessPoolExecutor | None = field(default=None, init=False, repr=False)
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            max_workers = self.max_workers or os.cpu_count() or 1
+            self._executor = ProcessPoolExecutor(
+                max_workers=max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            logging.info(f"Запущено пул розбору HTML на {max_workers} процесів")
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        try:
+            return await loop.run_in_executor(executor, func, *args)
+        except BrokenProcessPool:
+            self._replace_broken(executor)
+            return await loop.run_in_executor(self.executor, func, *args)
+
+    def _replace_broken(self, executor: ProcessPoolExecutor) -> None:
+        # Зламаний пул ловлять усі розбори, що в ньому чекали, а перезапустити його треба один раз
+        if self._executor is not executor:
+            return
+
+        logging.error("Процес пулу розбору HTML завершився аварійно, перезапускаємо пул")
+        executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+def init_extraction_runner(config: Config) -> BaseExtractionRunner:
+    backend = config.parser_extraction_backend
+    if backend == "thread":
+        return ThreadExtractionRunner()
+    if backend == "process":
+        return ProcessExtractionRunner(max_workers=config.parser_extraction_workers or None)
+
+    raise ValueError(f"Unknown parser extraction backend: {backend}")
@@ -0,0 +1,785 @@
+import asyncio
+import logging
+import time
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import Counter
+from collections.abc import (
+    AsyncIterator,
+    Callable,
+    Sequence,
+)
+from contextlib import asynccontextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import partial
+
+import anyio
+import httpx
+from selenium.common.exceptions import (
+    TimeoutException,
+    WebDriverException,
+)
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from src.infrastructure.exceptions.parser import (
+    IncompletePageException,
+    ListingRemovedException,
+    PageFetchException,
+)
+from src.infrastructure.parser.browser_extraction import (
+    BrowserScript,
+    removed_selector,
+)
+from src.infrastructure.parser.cache import DiskPageCache
+from src.infrastructure.parser.driver import (
+    collect_page_traffic,
+    HEADERS,
+    init_driver,
+    PageTraffic,
+    ResourceBlockPolicy,
+    WebDriverPool,
+)
+from src.infrastructure.parser.metrics import CrawlMetrics
+from src.infrastructure.parser.resilience import (
+    backoff_delay,
+    CircuitBreaker,
+    RetryBudget,
+)
+from src.infrastructure.parser.throttle import (
+    AdaptiveConcurrencyLimiter,
+    is_overload_status,
+    parse_host_budgets,
+)
+from src.settings.config import Config
+
+
+# httpx декодує brotli лише з додатковим пакетом, тому просимо gzip/deflate
+HTTP_HEADERS = {**HEADERS, "Accept-Encoding": "gzip, deflate"}
+FETCH_ERRORS = (
+    PageFetchException,
+    httpx.TransportError,
+    WebDriverException,
+    TimeoutError,
+)
+
+# Вбудований стан сторінки лежить у тексті inline-скрипту, а не в класах елементів
+SCRIPT_CONTAINS = "return Array.from(document.scripts).some((script) => script.text.includes(arguments[0]));"
+# Стан завантаженої сторінки відносно маркерів екстрактора
+READY = "ready"
+PARTIAL = "partial"
+BLANK = "blank"
+REMOVED = "removed"
+
+
+def is_page_removed(html: str, removed: Sequence[str]) -> bool:
+    return any(f'data-testid="{marker}"' in html for marker in removed)
+
+
+def has_ready_marker(html: str, ready_marker: str | None) -> bool:
+    return ready_marker is not None and ready_marker in html
+
+
+def page_status(
+    page: str | dict,
+    wait_for: Sequence[str],
+    removed: Sequence[str] = (),
+    script: BrowserScript | None = None,
+    ready_marker: str | None = None,
+) -> str:
+    """blank — у сторінці немає жодного маркера, тобто вона не
+    відмалювалася; partial — відмалювалася, але без частини блоків, як
+    оголошення без фото чи розташування."""
+    if isinstance(page, dict):
+        if script is None:
+            return BLANK
+        if script.is_removed(page):
+            return REMOVED
+        if script.is_ready(page):
+            return READY
+        return PARTIAL if script.is_partial(page) else BLANK
+
+    if is_page_removed(page, removed):
+        return REMOVED
+    if has_ready_marker(page, ready_marker):
+        return READY
+    found = sum(marker in page for marker in wait_for)
+    if found == len(wait_for):
+        return READY
+    return PARTIAL if found else BLANK
+
+
+def is_complete(
+    page: str,
+    wait_for: Sequence[str],
+    removed: Sequence[str] = (),
+    ready_marker: str | None = None,
+) -> bool:
+    """Сторінка готова або оголошення знято: її можна кешувати."""
+    return page_status(page, wait_for, removed, ready_marker=ready_marker) in (READY, REMOVED)
+
+
+def selectors_present(
+    wait_for: Sequence[str],
+    removed: Sequence[str] = (),
+    ready_marker: str | None = None,
+):
+    def condition(driver) -> bool:
+        # Знята сторінка вже не відмалює блоків оголошення, чекати нема чого
+        if any(driver.find_elements(By.CSS_SELECTOR, removed_selector(marker)) for marker in removed):
+            return True
+        if ready_marker is not None and driver.execute_script(SCRIPT_CONTAINS, ready_marker):
+            return True
+        if not wait_for:
+            return driver.execute_script("return document.readyState") != "loading"
+        return all(driver.find_elements(By.CLASS_NAME, marker) for marker in wait_for)
+
+    return condition
+
+
+def is_retryable(error: Exception) -> bool:
+    """Повторюємо мережеві збої, перевантаження сайту і порожні сторінки,
+    але не, наприклад, 404 чи зняте оголошення."""
+    if isinstance(error, ListingRemovedException):
+        return False
+    if isinstance(error, IncompletePageException):
+        return True
+    if isinstance(error, PageFetchException):
+        return error.status_code is None or is_overload_status(error.status_code)
+    return isinstance(error, FETCH_ERRORS)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    # Retry-After у вигляді HTTP-дати трапляється рідко, тоді діє пауза за замовчуванням
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def ensure_success(url: str, response: httpx.Response) -> None:
+    if response.is_success:
+        return
+
+    raise PageFetchException(
+        url=url,
+        status_code=response.status_code,
+        retry_after=parse_retry_after(response.headers.get("Retry-After")),
+    )
+
+
+@asynccontextmanager
+async def limited(
+    limiter: AdaptiveConcurrencyLimiter | None,
+    url: str,
+    metrics: CrawlMetrics | None = None,
+) -> AsyncIterator[None]:
+    """Виконує мережевий запит у межах поточного ліміту хоста і повідомляє
+    лімітеру про затримку або перевантаження."""
+    if limiter is None:
+        yield
+        return
+
+    started = time.perf_counter()
+    host = await limiter.acquire(url)
+    if metrics is not None:
+        metrics.record("limiter.wait", time.perf_counter() - started)
+
+    started = time.monotonic()
+    try:
+        yield
+    except PageFetchException as e:
+        if is_overload_status(e.status_code):
+            limiter.record_overload(host, e.retry_after)
+        raise
+    except (httpx.TransportError, WebDriverException):
+        limiter.record_overload(host)
+        raise
+    else:
+        limiter.record_success(host, time.monotonic() - started)
+    finally:
+        await limiter.release(host)
+
+
+@dataclass
+class PageWaitStats:
+    """Скільки насправді тривало очікування готовності сторінок."""
+
+    pages: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float, timed_out: bool) -> None:
+        self.pages += 1
+        self.timeouts += timed_out
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "pages": self.pages,
+            "timeouts": self.timeouts,
+            "total_seconds": round(self.total_seconds, 3),
+            "avg_seconds": round(self.total_seconds / self.pages, 3) if self.pages else 0.0,
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
+@dataclass
+class PageTrafficStats:
+    """Сумарний трафік сторінок у Chrome.
+
+    Заблоковані ресурси не завантажуються, тож їхній розмір невідомий.
+    Економію показує `python -m src.traffic <URL>`: він завантажує ту саму
+    сторінку з блокуванням і без нього та порівнює avg_bytes і
+    avg_dom_ready_ms.
+    """
+
+    pages: int = 0
+    requests: int = 0
+    blocked: int = 0
+    blocked_by_category: Counter = field(default_factory=Counter)
+    bytes: int = 0
+    dom_ready_ms: float = 0.0
+
+    def record(self, traffic: PageTraffic) -> None:
+        self.pages += 1
+        self.requests += traffic.requests
+        self.blocked += traffic.blocked
+        self.blocked_by_category.update(traffic.blocked_by_category)
+        self.bytes += traffic.bytes
+        self.dom_ready_ms += traffic.dom_ready_ms or 0.0
+
+    def to_dict(self) -> dict:
+        pages = self.pages or 1
+        return {
+            "pages": self.pages,
+            "blocked_requests": self.blocked,
+            "blocked_by_category": dict(self.blocked_by_category.most_common()),
+            "avg_requests": round(self.requests / pages, 1),
+            "avg_blocked": round(self.blocked / pages, 1),
+            "avg_bytes": self.bytes // pages,
+            "avg_dom_ready_ms": round(self.dom_ready_ms / pages, 1),
+        }
+
+
+@dataclass
+class BaseFetcher(ABC):
+    @abstractmethod
+    async def fetch(
+        self,
+        url: str,
+        wait_for: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str:
+        """wait_for — CSS-класи, потрібні екстрактору, removed — маркери
+        знятого оголошення, з якими чекати на wait_for марно. ready_marker —
+        рядок у вбудованому скрипті, з яким сторінка готова і без wait_for,
+        як JSON-стан для режиму state."""
+        raise NotImplementedError()
+
+    async def fetch_fields(
+        self,
+        url: str,
+        wait_for: Sequence[str],
+        script: BrowserScript,
+        removed: Sequence[str] = (),
+    ) -> str | dict:
+        """Повертає значення, зібрані script у браузері, або HTML, якщо
+        сторінку завантажено без браузера."""
+        return await self.fetch(url, wait_for, removed)
+
+    async def close(self) -> None:
+        pass
+
+    async def __aenter__(self) -> "BaseFetcher":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+@dataclass
+class HTTPFetcher(BaseFetcher):
+    """Один спільний httpx-клієнт з пулом з'єднань і keep-alive для всіх
+    запитів краулера."""
+
+    max_connections: int = 20
+    timeout: float = 15.0
+    cache: DiskPageCache | None = None
+    limiter: AdaptiveConcurrencyLimiter | None = None
+    metrics: CrawlMetrics = field(default_factory=CrawlMetrics)
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=HTTP_HEADERS,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+                timeout=self.timeout,
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def _get(self, url: str, headers: dict | None = None) -> httpx.Response:
+        # Відповіді з кешу не проходять через лімітер і не спотворюють затримку
+        async with limited(self.limiter, url, self.metrics):
+            with self.metrics.timer("http.request"):
+                response = await self.client.get(url, headers=headers)
+            # Стиснутий розмір відповіді, як її передано мережею
+            self.metrics.count("bytes", response.num_bytes_downloaded)
+            if response.status_code != httpx.codes.NOT_MODIFIED:
+                ensure_success(url, response)
+
+        return response
+
+    async def fetch(
+        self,
+        url: str,
+        wait_for: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str:
+        if self.cache is None:
+            response = await self._get(url)
+            return response.text
+
+        cached = await anyio.to_thread.run_sync(self.cache.get, url)
+        if cached is not None and not is_complete(cached.body, wait_for, removed, ready_marker):
+            cached = None
+        if cached is not None and cached.is_fresh(self.cache.ttl):
+            self.metrics.count("cache_hits")
+            return cached.body
+
+        response = await self._get(
+            url,
+            headers=cached.validators if cached is not None else None,
+        )
+        if cached is not None and response.status_code == httpx.codes.NOT_MODIFIED:
+            self.metrics.count("cache_revalidated")
+            await anyio.to_thread.run_sync(self.cache.revalidated, cached)
+            return cached.body
+
+        # Порожня сторінка чи капча не кешується, інакше повтор отримав би її ж
+        if is_complete(response.text, wait_for, removed, ready_marker):
+            await anyio.to_thread.run_sync(
+                self.cache.put,
+                url,
+                response.text,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+            )
+
+        return response.text
+
+    async def close(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+@dataclass
+class SeleniumFetcher(BaseFetcher):
+    """Завантажує сторінку в Chrome і чекає лише доти, доки не з'являться
+    потрібні екстрактору елементи, але не довше wait_timeout."""
+
+    pool: WebDriverPool
+    wait_timeout: float = 10.0
+    wait_stats: PageWaitStats = field(default_factory=PageWaitStats)
+    traffic_stats: PageTrafficStats = field(default_factory=PageTrafficStats)
+    log_traffic: bool = True
+    block_policy: ResourceBlockPolicy = field(default_factory=ResourceBlockPolicy)
+    limiter: AdaptiveConcurrencyLimiter | None = None
+    metrics: CrawlMetrics = field(default_factory=CrawlMetrics)
+
+    def _load(
+        self,
+        driver,
+        url: str,
+        wait_for: Sequence[str],
+        removed: Sequence[str],
+        ready_marker: str | None = None,
+    ) -> None:
+        with self.metrics.timer("browser.navigate"):
+            driver.get(url)
+
+        started = time.perf_counter()
+        timed_out = False
+        try:
+            WebDriverWait(driver, self.wait_timeout, poll_frequency=0.1).until(
+                selectors_present(wait_for, removed, ready_marker),
+            )
+        except TimeoutException:
+            timed_out = True
+            logging.warning(f"Сторінка не готова за {self.wait_timeout} с: {url}")
+
+        waited = time.perf_counter() - started
+        self.wait_stats.record(waited, timed_out)
+        self.metrics.record("browser.wait", waited)
+        logging.debug(f"Очікування сторінки {waited:.3f} с: {url}")
+
+        if self.log_traffic:
+            try:
+                traffic = collect_page_traffic(driver, self.block_policy)
+            except WebDriverException as e:
+                logging.debug(f"Не вдалося прочитати performance-лог: {e}")
+            else:
+                self.traffic_stats.record(traffic)
+                self.metrics.count("browser_bytes", traffic.bytes)
+                logging.debug(
+                    f"Трафік сторінки: запитів {traffic.requests}, {traffic.bytes} байт, "
+                    f"заблоковано {traffic.blocked_by_category}: {url}",
+                )
+
+    def _get_page_source(
+        self,
+        driver,
+        url: str,
+        wait_for: Sequence[str],
+        removed: Sequence[str],
+        ready_marker: str | None,
+    ) -> str:
+        self._load(driver, url, wait_for, removed, ready_marker)
+
+        # page_source серіалізує весь DOM і передає його через WebDriver
+        with self.metrics.timer("browser.page_source"):
+            return driver.page_source
+
+    def _run_script(
+        self,
+        driver,
+        url: str,
+        wait_for: Sequence[str],
+        script: BrowserScript,
+        removed: Sequence[str],
+    ) -> dict:
+        self._load(driver, url, wait_for, removed)
+
+        with self.metrics.timer("browser.script"):
+            return driver.execute_script(script.source, *script.args)
+
+    async def _with_driver(self, url: str, func: Callable, *args):
+        started = time.perf_counter()
+        async with self.pool.acquire() as driver:
+            self.metrics.record("browser.acquire", time.perf_counter() - started)
+            # Очікування вільного драйвера не є затримкою хоста і не впливає на ліміт
+            async with limited(self.limiter, url, self.metrics):
+                return await anyio.to_thread.run_sync(func, driver, url, *args)
+
+    async def fetch(
+        self,
+        url: str,
+        wait_for: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str:
+        return await self._with_driver(url, self._get_page_source, wait_for, removed, ready_marker)
+
+    async def fetch_fields(
+        self,
+        url: str,
+        wait_for: Sequence[str],
+        script: BrowserScript,
+        removed: Sequence[str] = (),
+    ) -> dict:
+        return await self._with_driver(url, self._run_script, wait_for, script, removed)
+
+    async def close(self) -> None:
+        # Пул драйверів живе разом із застосунком і не закривається після обходу
+        if self.wait_stats.pages:
+            logging.info(f"Очікування сторінок у Chrome: {self.wait_stats.to_dict()}")
+        if self.traffic_stats.pages:
+            logging.info(f"Трафік сторінок у Chrome: {self.traffic_stats.to_dict()}")
+
+
+@dataclass
+class HybridFetcher(BaseFetcher):
+    """Спершу завантажує сторінку через HTTP і запускає Chrome лише тоді,
+    коли без JavaScript у сторінці немає потрібних елементів."""
+
+    http: HTTPFetcher
+    browser: SeleniumFetcher
+
+    async def _fetch_http(
+        self,
+        url: str,
+        wait_for: Sequence[str],
+        removed: Sequence[str],
+        ready_marker: str | None = None,
+    ) -> str | None:
+        try:
+            html = await self.http.fetch(url, wait_for, removed, ready_marker)
+        except (httpx.HTTPError, PageFetchException) as e:
+            logging.warning(f"HTTP-запит не вдався ({e}), використовуємо Chrome: {url}")
+        else:
+            if is_complete(html, wait_for, removed, ready_marker):
+                return html
+            logging.info(f"Сторінка потребує JavaScript, використовуємо Chrome: {url}")
+
+        self.browser.metrics.count("browser_fallbacks")
+        return None
+
+    async def fetch(
+        self,
+        url: str,
+        wait_for: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str:
+        html = await self._fetch_http(url, wait_for, removed, ready_marker)
+        if html is not None:
+            return html
+
+        return await self.browser.fetch(url, wait_for, removed, ready_marker)
+
+    async def fetch_fields(
+        self,
+        url: str,
+        wait_for: Sequence[str],
+        script: BrowserScript,
+        removed: Sequence[str] = (),
+    ) -> str | dict:
+        html = await self._fetch_http(url, wait_for, removed)
+        if html is not None:
+            return html
+
+        return await self.browser.fetch_fields(url, wait_for, script, removed)
+
+    async def close(self) -> None:
+        await self.http.close()
+        await self.browser.close()
+
+
+@dataclass
+class RetryingFetcher(BaseFetcher):
+    """Обмежує кожну спробу request_timeout, повторює тимчасові збої та
+    порожні сторінки з експоненційною затримкою в межах бюджету повторів
+    і призупиняє обхід через CircuitBreaker, коли сайт падає.
+
+    Сторінка, якій бракує лише частини блоків, повертається як є, а
+    зняте оголошення чи порожня видача за останньою сторінкою пошуку
+    (маркери removed) одразу піднімають ListingRemovedException: такі
+    сторінки не повторюються і не рахуються збоями сайту. Після останньої спроби
+    будь-яка помилка піднімається як PageFetchException, а порожня
+    сторінка — як IncompletePageException разом з отриманим HTML.
+    """
+
+    inner: BaseFetcher
+    attempts: int = 3
+    request_timeout: float = 60.0
+    base_delay: float = 0.5
+    max_delay: float = 10.0
+    budget: RetryBudget = field(default_factory=RetryBudget)
+    breaker: CircuitBreaker = field(default_factory=CircuitBreaker)
+    metrics: CrawlMetrics = field(default_factory=CrawlMetrics)
+
+    async def _attempt(
+        self,
+        url: str,
+        wait_for: Sequence[str],
+        script: BrowserScript | None = None,
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str | dict:
+        with self.metrics.timer("breaker.wait"):
+            probe = await self.breaker.acquire()
+        try:
+            try:
+                async with asyncio.timeout(self.request_timeout):
+                    if script is None:
+                        page = await self.inner.fetch(url, wait_for, removed, ready_marker)
+                    else:
+                        page = await self.inner.fetch_fields(url, wait_for, script, removed)
+            except TimeoutError:
+                raise PageFetchException(url=url) from None
+
+            status = page_status(page, wait_for, removed, script, ready_marker)
+            if status == BLANK:
+                raise IncompletePageException(url=url, html=page if isinstance(page, str) else "")
+            if status == REMOVED:
+                raise ListingRemovedException(url=url)
+            if status == PARTIAL:
+                self.metrics.count("partial_pages")
+                logging.warning(f"На сторінці бракує частини блоків {list(wait_for)}, розбираємо як є: {url}")
+        except FETCH_ERRORS as e:
+            if is_retryable(e):
+                await self.breaker.record_failure(probe)
+            else:
+                # Сайт відповідає, просто сторінки немає
+                await self.breaker.record_success()
+            raise
+        except BaseException:
+            if probe:
+                await self.breaker.release_probe()
+            raise
+
+        await self.breaker.record_success()
+        return page
+
+    async def fetch(
+        self,
+        url: str,
+        wait_for: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str:
+        return await self._fetch(url, wait_for, None, removed, ready_marker)
+
+    async def fetch_fields(
+        self,
+        url: str,
+        wait_for: Sequence[str],
+        script: BrowserScript,
+        removed: Sequence[str] = (),
+    ) -> str | dict:
+        return await self._fetch(url, wait_for, script, removed)
+
+    async def _fetch(
+        self,
+        url: str,
+        wait_for: Sequence[str],
+        script: BrowserScript | None = None,
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str | dict:
+        self.budget.deposit()
+
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return await self._attempt(url, wait_for, script, removed, ready_marker)
+            except FETCH_ERRORS as e:
+                if attempt == self.attempts or not is_retryable(e) or not self.budget.withdraw():
+                    if isinstance(e, PageFetchException):
+                        raise
+                    raise PageFetchException(url=url) from e
+
+                delay = backoff_delay(
+                    attempt,
+                    self.base_delay,
+                    self.max_delay,
+                    getattr(e, "retry_after", None),
+                )
+                logging.warning(
+                    f"Спроба {attempt} не вдалася ({e!r}), повтор через {delay:.1f} с: {url}",
+                )
+                self.metrics.count("retries")
+                with self.metrics.timer("retry.backoff"):
+                    await asyncio.sleep(delay)
+
+    async def close(self) -> None:
+        await self.inner.close()
+
+
+def init_page_cache(config: Config) -> DiskPageCache | None:
+    if not config.parser_cache_dir:
+        return None
+
+    return DiskPageCache(
+        directory=config.parser_cache_dir,
+        ttl=config.parser_cache_ttl,
+        max_bytes=config.parser_cache_max_bytes,
+    )
+
+
+def init_block_policy(config: Config) -> ResourceBlockPolicy:
+    return ResourceBlockPolicy.from_string(
+        config.parser_blocked_resources,
+        config.parser_blocked_url_patterns,
+    )
+
+
+def init_webdriver_pool(config: Config) -> WebDriverPool:
+    return WebDriverPool(
+        size=config.parser_webdriver_pool_size,
+        driver_factory=partial(
+            init_driver,
+            page_load_strategy=config.parser_page_load_strategy,
+            driver_path=config.parser_chromedriver_path,
+            block_policy=init_block_policy(config),
+            log_traffic=config.parser_log_page_traffic,
+        ),
+    )
+
+
+def init_fetch_limiter(config: Config) -> AdaptiveConcurrencyLimiter:
+    return AdaptiveConcurrencyLimiter(
+        initial_limit=config.parser_initial_concurrency,
+        min_limit=config.parser_min_concurrency,
+        max_limit=config.parser_concurrency,
+        host_budgets=parse_host_budgets(config.parser_host_budgets),
+    )
+
+
+def init_fetcher(
+    config: Config,
+    webdriver_pool: WebDriverPool,
+    fetch_limiter: AdaptiveConcurrencyLimiter | None = None,
+    metrics: CrawlMetrics | None = None,
+    backend: str | None = None,
+) -> BaseFetcher:
+    if metrics is None:
+        metrics = CrawlMetrics()
+
+    return RetryingFetcher(
+        inner=init_backend_fetcher(config, webdriver_pool, fetch_limiter, metrics, backend),
+        attempts=config.parser_fetch_attempts,
+        request_timeout=config.parser_request_timeout,
+        base_delay=config.parser_retry_base_delay,
+        max_delay=config.parser_retry_max_delay,
+        budget=RetryBudget(ratio=config.parser_retry_budget_ratio),
+        breaker=CircuitBreaker(
+            failure_threshold=config.parser_breaker_threshold,
+            reset_timeout=config.parser_breaker_reset_timeout,
+        ),
+        metrics=metrics,
+    )
+
+
+def init_backend_fetcher(
+    config: Config,
+    webdriver_pool: WebDriverPool,
+    fetch_limiter: AdaptiveConcurrencyLimiter | None = None,
+    metrics: CrawlMetrics | None = None,
+    backend: str | None = None,
+) -> BaseFetcher:
+    """backend замінює PARSER_FETCH_BACKEND, наприклад http для JSON API."""
+    if metrics is None:
+        metrics = CrawlMetrics()
+
+    if backend is None:
+        backend = config.parser_fetch_backend
+    browser = SeleniumFetcher(
+        pool=webdriver_pool,
+        wait_timeout=config.parser_page_wait_timeout,
+        log_traffic=config.parser_log_page_traffic,
+        block_policy=init_block_policy(config),
+        limiter=fetch_limiter,
+        metrics=metrics,
+    )
+
+    if backend == "selenium":
+        return browser
+
+    http = HTTPFetcher(
+        max_connections=config.parser_http_max_connections,
+        timeout=config.parser_http_timeout,
+        cache=init_page_cache(config),
+        limiter=fetch_limiter,
+        metrics=metrics,
+    )
+    if backend == "http":
+        return http
+    if backend == "hybrid":
+        return HybridFetcher(http=http, browser=browser)
+
+    raise ValueError(f"Unknown parser fetch backend: {backend}")
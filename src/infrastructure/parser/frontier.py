@@ -0,0 +1,119 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from collections import deque
+from collections.abc import (
+    AsyncIterator,
+    Iterable,
+)
+from contextlib import asynccontextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+
+PENDING = "pending"
+IN_PROGRESS = "in_progress"
+DONE = "done"
+FAILED = "failed"
+
+
+@dataclass
+class BaseCrawlFrontier(ABC):
+    """Стан обходу: знайдені посилання на оголошення з їхнім станом і
+    курсор пагінації.
+
+    Перерваний обхід продовжується з наступної непройденої сторінки, а
+    посилання, які були в роботі, знову видаються воркерам.
+    """
+
+    @abstractmethod
+    async def start(self, listing_url: str) -> int | None:
+        """Повертає сторінку, з якої продовжити пагінацію, або None, якщо
+        пагінацію вже завершено."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def add_page(self, page: int, links: Iterable[str]) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def finish_pagination(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def claim(self, limit: int) -> list[str]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def has_in_progress(self) -> bool:
+        """Чи лишилися посилання в роботі, зокрема в інших воркерів."""
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def mark(self, url: str, state: str, error: str | None = None) -> None:
+        raise NotImplementedError()
+
+    @asynccontextmanager
+    async def heartbeat(self) -> AsyncIterator[None]:
+        """Поки блок виконується, продовжує оренду взятих посилань;
+        фронтиру без оренд продовжувати нічого."""
+        yield
+
+    @abstractmethod
+    async def flush(self) -> None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def finish(self) -> dict:
+        """Фіксує незбережені стани і повертає кількість посилань у кожному
+        стані."""
+        raise NotImplementedError()
+
+
+@dataclass
+class InMemoryCrawlFrontier(BaseCrawlFrontier):
+    """Фронтир без збереження між перезапусками."""
+
+    _states: dict[str, str] = field(default_factory=dict, init=False, repr=False)
+    _pending: deque = field(default_factory=deque, init=False, repr=False)
+
+    async def start(self, listing_url: str) -> int | None:
+        self._states.clear()
+        self._pending.clear()
+        return 0
+
+    async def add_page(self, page: int, links: Iterable[str]) -> None:
+        for url in links:
+            if url not in self._states:
+                self._states[url] = PENDING
+                self._pending.append(url)
+
+    async def finish_pagination(self) -> None:
+        pass
+
+    async def claim(self, limit: int) -> list[str]:
+        claimed = []
+        while self._pending and len(claimed) < limit:
+            url = self._pending.popleft()
+            self._states[url] = IN_PROGRESS
+            claimed.append(url)
+        return claimed
+
+    async def has_in_progress(self) -> bool:
+        # Посилання в роботі обробляють воркери цього ж обходу
+        return False
+
+    async def mark(self, url: str, state: str, error: str | None = None) -> None:
+        self._states[url] = state
+
+    async def flush(self) -> None:
+        pass
+
+    async def finish(self) -> dict:
+        counts = {}
+        for state in self._states.values():
+            counts[state] = counts.get(state, 0) + 1
+        return counts
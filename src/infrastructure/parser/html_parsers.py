@@ -0,0 +1,131 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import (
+    Any,
+    ClassVar,
+)
+
+from bs4 import (
+    BeautifulSoup,
+    FeatureNotFound,
+)
+
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax не входить до обов'язкових залежностей
+    LexborHTMLParser = None
+
+
+@dataclass(frozen=True)
+class BaseHTMLParser(ABC):
+    """Мінімальний інтерфейс над HTML-деревом, якого достатньо
+    екстракторам."""
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def parse(self, html: str) -> Any:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def select(self, node: Any, selector: str) -> list:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def select_one(self, node: Any, selector: str) -> Any | None:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def text(self, node: Any) -> str:
+        raise NotImplementedError()
+
+    @abstractmethod
+    def attr(self, node: Any, name: str) -> str | None:
+        raise NotImplementedError()
+
+
+@dataclass(frozen=True)
+class SoupHTMLParser(BaseHTMLParser):
+    name: ClassVar[str] = "html.parser"
+    features: ClassVar[str] = "html.parser"
+
+    def parse(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, self.features)
+
+    def select(self, node: BeautifulSoup, selector: str) -> list:
+        return node.select(selector)
+
+    def select_one(self, node: BeautifulSoup, selector: str) -> Any | None:
+        return node.select_one(selector)
+
+    def text(self, node: Any) -> str:
+        return node.get_text(strip=True)
+
+    def attr(self, node: Any, name: str) -> str | None:
+        return node.get(name)
+
+
+@dataclass(frozen=True)
+class LxmlSoupHTMLParser(SoupHTMLParser):
+    name: ClassVar[str] = "lxml"
+    features: ClassVar[str] = "lxml"
+
+    def __post_init__(self) -> None:
+        try:
+            BeautifulSoup("", self.features)
+        except FeatureNotFound:
+            raise RuntimeError("HTML backend 'lxml' requires the lxml package")
+
+
+@dataclass(frozen=True)
+class SelectolaxHTMLParser(BaseHTMLParser):
+    name: ClassVar[str] = "selectolax"
+
+    def __post_init__(self) -> None:
+        if LexborHTMLParser is None:
+            raise RuntimeError("HTML backend 'selectolax' requires the selectolax package")
+
+    def parse(self, html: str) -> Any:
+        return LexborHTMLParser(html)
+
+    def select(self, node: Any, selector: str) -> list:
+        return node.css(selector)
+
+    def select_one(self, node: Any, selector: str) -> Any | None:
+        return node.css_first(selector)
+
+    def text(self, node: Any) -> str:
+        return node.text(strip=True)
+
+    def attr(self, node: Any, name: str) -> str | None:
+        return node.attributes.get(name)
+
+
+HTML_PARSERS: dict[str, type[BaseHTMLParser]] = {
+    parser.name: parser
+    for parser in (SoupHTMLParser, LxmlSoupHTMLParser, SelectolaxHTMLParser)
+}
+
+
+def init_html_parser(name: str) -> BaseHTMLParser:
+    try:
+        parser_type = HTML_PARSERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown HTML parser backend: {name}")
+
+    return parser_type()
+
+
+def available_html_parsers() -> list[BaseHTMLParser]:
+    parsers = []
+    for name in HTML_PARSERS:
+        try:
+            parsers.append(init_html_parser(name))
+        except RuntimeError:
+            continue
+
+    return parsers
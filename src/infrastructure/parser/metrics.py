@@ -0,0 +1,79 @@
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+
+@dataclass
+class StageTimer:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 3),
+            "avg_ms": round(self.total_seconds / self.count * 1000, 2) if self.count else 0.0,
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+@dataclass(eq=False)
+class CrawlMetrics:
+    """Час етапів обходу і лічильники однієї синхронізації.
+
+    Етапи виконуються паралельно, тож їхня сума більша за elapsed_seconds:
+    порівнювати варто середній час етапу і частку кожного в сумі.
+    Записи надходять і з потоків Chrome, тому захищені блокуванням.
+    """
+
+    stages: dict[str, StageTimer] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    missing_fields: dict[str, int] = field(default_factory=dict)
+    started: float = field(default_factory=time.monotonic, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def record(self, stage: str, seconds: float) -> None:
+        with self._lock:
+            timer = self.stages.get(stage)
+            if timer is None:
+                timer = self.stages[stage] = StageTimer()
+            timer.record(seconds)
+
+    @contextmanager
+    def timer(self, stage: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(stage, time.perf_counter() - started)
+
+    def count(self, name: str, value: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def field_missing(self, name: str) -> None:
+        with self._lock:
+            self.missing_fields[name] = self.missing_fields.get(name, 0) + 1
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            return {
+                "elapsed_seconds": round(time.monotonic() - self.started, 3),
+                "stages": {
+                    name: timer.to_dict()
+                    for name, timer in sorted(self.stages.items(), key=lambda item: -item[1].total_seconds)
+                },
+                "counters": dict(self.counters),
+                "missing_fields": dict(self.missing_fields),
+            }
@@ -0,0 +1,108 @@
+import logging
+import re
+from collections.abc import Sequence
+from typing import Any
+
+import orjson
+from src.infrastructure.parser.schema import (
+    CarPageSchema,
+    StateSchema,
+)
+from src.infrastructure.parser.utils import (
+    join_location,
+    olx_listing_id,
+)
+
+
+# OLX вбудовує стан як JSON, загорнутий у JS-рядок: `marker = "{\"ad\": ...}";`.
+# Присвійні квантифікатори не відкочуються, тож рядок у сотні КБ проходиться за один раз
+STATE_LITERAL_RE = re.compile(r'\s*=\s*("[^"\\]*+(?:\\.[^"\\]*+)*+")', re.DOTALL)
+
+
+def find_page_state(html: str, marker: str) -> dict | None:
+    """Декодує вбудований стан сторінки без побудови DOM: пошук маркера,
+    один регулярний вираз і два виклики orjson."""
+    start = html.find(marker)
+    if start == -1:
+        return None
+
+    match = STATE_LITERAL_RE.match(html, start + len(marker))
+    if match is None:
+        return None
+
+    try:
+        state = orjson.loads(orjson.loads(match.group(1)))
+    except orjson.JSONDecodeError as e:
+        logging.warning(f"Не вдалося декодувати стан сторінки: {e}")
+        return None
+
+    return state if isinstance(state, dict) else None
+
+
+def get_path(data: Any, path: Sequence[str]) -> Any:
+    for key in path:
+        if isinstance(data, dict):
+            data = data.get(key)
+        elif isinstance(data, list) and key.isdigit() and int(key) < len(data):
+            data = data[int(key)]
+        else:
+            return None
+    return data
+
+
+def find_state_ad(html: str, state_schema: StateSchema) -> dict | None:
+    state = find_page_state(html, state_schema.marker)
+    if state is None:
+        return None
+
+    ad = get_path(state, state_schema.ad_path)
+    return ad if isinstance(ad, dict) else None
+
+
+def details_from_state(ad: dict, schema: CarPageSchema) -> dict:
+    """Переносить оголошення зі стану сторінки на поля автомобіля за тими
+    ж правилами схеми, що й розбір DOM."""
+    return details_from_mapping(ad, schema.state, schema)
+
+
+def details_from_mapping(ad: dict, state_schema: StateSchema, schema: CarPageSchema) -> dict:
+    param_rules = state_schema.param_rules if state_schema.param_rules is not None else schema.params
+    car_details = {}
+
+    for path, rule in state_schema.fields:
+        raw = get_path(ad, path)
+        if isinstance(raw, str) and raw:
+            rule.apply(raw, car_details)
+
+    for param in get_path(ad, state_schema.params_path) or ():
+        if not isinstance(param, dict):
+            continue
+
+        rule = param_rules.get(str(param.get(state_schema.param_label, "")).strip())
+        value = get_path(param, state_schema.param_value)
+        if rule is not None and value is not None:
+            rule.apply(str(value), car_details)
+
+    parts = [get_path(ad, path) for path in state_schema.location]
+    parts = [part for part in parts if isinstance(part, str)]
+    if parts:
+        car_details["location"] = join_location(parts)
+
+    return car_details
+
+
+def cards_from_state(html: str, state_schema: StateSchema, schema: CarPageSchema) -> dict[str, dict]:
+    """Поля карток сторінки пошуку зі стану сторінки: `ID оголошення ->
+    поля`. ID, а не посилання, бо посилання в картках мають параметри
+    аналітики."""
+    state = find_page_state(html, state_schema.marker)
+    ads = get_path(state, state_schema.ad_path) if state is not None else None
+    if not isinstance(ads, list):
+        return {}
+
+    cards = {}
+    for ad in ads:
+        url = get_path(ad, state_schema.url_path) if isinstance(ad, dict) else None
+        if isinstance(url, str):
+            cards[olx_listing_id(url)] = details_from_mapping(ad, state_schema, schema)
+    return cards
@@ -1,193 +1,864 @@
+import asyncio
 import logging
 import re
 import time
-from urllib.parse import urljoin
+from collections.abc import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Sequence,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+from datetime import (
+    datetime,
+    timezone,
+)
+from functools import lru_cache
+from urllib.parse import (
+    urlencode,
+    urljoin,
+)
 
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from src.infrastructure.exceptions.parser import (
+    IncompletePageException,
+    ListingRemovedException,
+    PageFetchException,
+)
+from src.infrastructure.parser.archive import (
+    ArchivedPage,
+    BasePageArchive,
+)
+from src.infrastructure.parser.browser_extraction import (
+    build_detail_script,
+    BrowserScript,
+)
+from src.infrastructure.parser.discovery import (
+    BaseListingDiscovery,
+    crawl_pages,
+    ListingPage,
+    OFFERS_MAX_PAGE_SIZE,
+    OffersAPIDiscovery,
+    PageHandler,
+    PartitionedDiscovery,
+)
+from src.infrastructure.parser.extraction import (
+    BaseExtractionRunner,
+    ThreadExtractionRunner,
+)
+from src.infrastructure.parser.fetchers import BaseFetcher
+from src.infrastructure.parser.frontier import (
+    BaseCrawlFrontier,
+    DONE,
+    FAILED,
+    InMemoryCrawlFrontier,
+)
+from src.infrastructure.parser.html_parsers import (
+    BaseHTMLParser,
+    init_html_parser,
+)
+from src.infrastructure.parser.metrics import CrawlMetrics
+from src.infrastructure.parser.page_state import (
+    cards_from_state,
+    details_from_state,
+    find_state_ad,
+)
+from src.infrastructure.parser.partitions import (
+    BasePartitionStore,
+    InMemoryPartitionStore,
+    PricePartition,
+)
+from src.infrastructure.parser.progress import CrawlProgress
+from src.infrastructure.parser.schema import (
+    CarPageSchema,
+    DEFAULT_SCHEMA_PATH,
+    load_car_schema,
+)
 from src.infrastructure.parser.utils import (
-    parse_mileage,
-    parse_price,
+    canonical_url,
+    join_location,
+    olx_listing_id,
 )
-from webdriver_manager.chrome import ChromeDriverManager
-
-
-def init_driver():
-    options = Options()
-    options.add_argument("--headless")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--window-size=1920,1080")
-    options.add_argument("--no-sandbox")
-    options.add_argument("--disable-dev-shm-usage")
-    options.add_argument("--lang=uk")
-
-    # Використовуємо webdriver-manager для автоматичного завантаження потрібної версії ChromeDriver
-    service = Service(ChromeDriverManager().install())
-    driver = webdriver.Chrome(service=service, options=options)
-
-    driver.execute_cdp_cmd("Network.enable", {})
-
-    custom_headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/85.0.4183.121 Safari/537.36"
-        ),
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Encoding": "gzip, deflate, br",
-        "Accept-Language": "uk,ru,en;q=0.8",
-        "Connection": "keep-alive",
-        "Cache-Control": "no-cache",
-        "Pragma": "no-cache",
-    }
-
-    driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": custom_headers})
-
-    return driver
-
-
-def parse_olx_autos(url: str, driver, offset: int = 1) -> set:
-    car_links = set()
-    page = 0
-    last_page_links = None
-
-    while True:
-        if page == offset:
-            break
-        paginated_url = f"{url}?page={page}"
-        logging.info(f"Обробляємо сторінку {page}: {paginated_url}")
+from src.settings.config import Config
+
+
+OLX_CARS_URL = "https://www.olx.ua/uk/transport/legkovye-avtomobili/"
+# Як часто перевіряти фронтир, поки посилання обробляють інші воркери, с
+FRONTIER_POLL_INTERVAL = 5.0
+# html: розбір DOM | state: JSON-стан сторінки з розбором DOM як запасним
+# варіантом | browser: збір полів скриптом у Chrome
+EXTRACTION_MODES = ("html", "state", "browser")
+# full: сторінка кожного оголошення | cards: автомобілі з карток пошуку, сторінки
+# лише для карток без обов'язкових полів
+SYNC_MODES = ("full", "cards")
+
+
+@dataclass(frozen=True)
+class CarPageExtractor:
+    """browser_script задано в режимі browser: поля сторінки автомобіля
+    збираються скриптом прямо в Chrome. use_state вмикає читання полів із
+    JSON-стану сторінки."""
+
+    html_parser: BaseHTMLParser
+    schema: CarPageSchema
+    browser_script: BrowserScript | None = None
+    use_state: bool = False
+
+
+def init_extractor(
+    html_backend: str = "html.parser",
+    schema_path: str = DEFAULT_SCHEMA_PATH,
+    mode: str = "html",
+) -> CarPageExtractor:
+    if mode not in EXTRACTION_MODES:
+        raise ValueError(f"Unknown parser extraction mode: {mode}")
+
+    schema = load_car_schema(schema_path)
+    return CarPageExtractor(
+        html_parser=init_html_parser(html_backend),
+        schema=schema,
+        browser_script=build_detail_script(schema) if mode == "browser" else None,
+        use_state=mode == "state" and schema.state is not None,
+    )
+
+
+@lru_cache(1)
+def default_extractor() -> CarPageExtractor:
+    """Екстрактор зі схемою за замовчуванням. Схема компілюється під час
+    першого розбору, а не імпорту модуля, тож процеси розбору і команди,
+    яким вона не потрібна, її не завантажують."""
+    return init_extractor()
+
+
+DEFAULT_RUNNER = ThreadExtractionRunner()
+
+
+def links_from_document(document, url: str, extractor: CarPageExtractor) -> set:
+    html_parser, schema = extractor.html_parser, extractor.schema
+    listings = html_parser.select(document, schema.listing_card)
+
+    page_links = set()
+    for listing in listings:
+        try:
+            link_tag = html_parser.select_one(listing, schema.listing_link)
+            if link_tag:
+                page_links.add(urljoin(url, html_parser.attr(link_tag, "href")))
+        except Exception as e:
+            logging.error(f"Помилка при обробці оголошення: {e}")
+            continue
+
+    return page_links
+
+
+def extract_car_links(
+    html: str,
+    url: str,
+    extractor: CarPageExtractor | None = None,
+) -> set:
+    if extractor is None:
+        extractor = default_extractor()
+    return links_from_document(extractor.html_parser.parse(html), url, extractor)
+
+
+def extract_car_links_timed(
+    html: str,
+    url: str,
+    extractor: CarPageExtractor | None = None,
+) -> tuple[set, float, float]:
+    """extract_car_links, що повертає ще й час побудови дерева і час
+    вибірки посилань. Час міряється там, де йде розбір, зокрема в пулі
+    процесів."""
+    if extractor is None:
+        extractor = default_extractor()
+    started = time.perf_counter()
+    document = extractor.html_parser.parse(html)
+    parsed = time.perf_counter()
+    page_links = links_from_document(document, url, extractor)
+    return page_links, parsed - started, time.perf_counter() - parsed
+
+
+def extract_listing_cards_timed(
+    html: str,
+    url: str,
+    extractor: CarPageExtractor | None = None,
+) -> tuple[dict[str, dict], float, float]:
+    """Посилання з DOM сторінки пошуку разом із полями їхніх карток зі
+    стану сторінки. Без стану картки лишаються порожніми."""
+    if extractor is None:
+        extractor = default_extractor()
+    page_links, parse_seconds, extract_seconds = extract_car_links_timed(html, url, extractor)
+    listing_state = extractor.schema.listing_state
+    if listing_state is None:
+        return {link: {} for link in page_links}, parse_seconds, extract_seconds
+
+    started = time.perf_counter()
+    cards = cards_from_state(html, listing_state, extractor.schema)
+    page_cards = {link: cards.get(olx_listing_id(link), {}) for link in page_links}
+    return page_cards, parse_seconds, extract_seconds + time.perf_counter() - started
+
+
+def extract_total_count(
+    html: str,
+    extractor: CarPageExtractor | None = None,
+) -> int | None:
+    """Кількість результатів пошуку, наприклад `Ми знайшли 1 250 оголошень`."""
+    if extractor is None:
+        extractor = default_extractor()
+    html_parser, selector = extractor.html_parser, extractor.schema.listing_total_count
+    if selector is None:
+        return None
+
+    node = html_parser.select_one(html_parser.parse(html), selector)
+    if node is None:
+        return None
+
+    digits = re.sub(r"\D", "", html_parser.text(node))
+    return int(digits) if digits else None
+
+
+def extract_location(document, extractor: CarPageExtractor) -> str | None:
+    html_parser, schema = extractor.html_parser, extractor.schema
+
+    location_block = html_parser.select_one(document, schema.location_block)
+    if not location_block:
+        logging.warning("Block doesn't found")
+        return None
+
+    parts = []
+    for selector in schema.location_parts:
+        part_el = html_parser.select_one(location_block, selector)
+        parts.append(html_parser.text(part_el) if part_el else "")
+
+    return join_location(parts)
+
+
+def details_from_document(document, extractor: CarPageExtractor) -> dict:
+    html_parser, schema = extractor.html_parser, extractor.schema
+    car_details = {}
 
-        driver.get(paginated_url)
-        time.sleep(0.8)
+    try:
+        # Base Data
+        for element in schema.elements:
+            node = html_parser.select_one(document, element.selector)
+            if node is None:
+                continue
 
-        soup = BeautifulSoup(driver.page_source, "html.parser")
-        listings = soup.find_all("div", class_="css-1ut25fa")
+            raw = html_parser.attr(node, element.attr) if element.attr else html_parser.text(node)
+            if raw:
+                element.rule.apply(raw, car_details)
 
-        if not listings:
-            logging.info("Оголошення не знайдені - завершуємо обхід пагінації.")
-            break
+        # Details Car: один прохід, пошук правила за підписом у словнику
+        for p in html_parser.select(document, schema.param_selector):
+            label, _, value = html_parser.text(p).partition(schema.param_separator)
 
-        current_page_links = set()
-        for listing in listings:
-            try:
-                link_tag = listing.find("a", href=True)
-                if link_tag:
-                    product_url = urljoin(url, link_tag["href"])
-                    car_links.add(product_url)
-                    current_page_links.add(product_url)
-            except Exception as e:
-                logging.error(f"Помилка при обробці оголошення: {e}")
-                continue
+            rule = schema.params.get(label.strip())
+            if rule is not None:
+                rule.apply(value, car_details)
 
-        if last_page_links is not None and current_page_links == last_page_links:
-            logging.info("Досягнуто останньої унікальної сторінки, припиняю обхід.")
-            break
-        last_page_links = current_page_links
+        location = extract_location(document, extractor)
+        if location is not None:
+            car_details["location"] = location
 
-        page += 1
+    except Exception as e:
+        logging.error(f"Error While Trying Accumulate Car Data: {e}")
 
-    return car_links
+    return car_details
 
 
-def parsing_data_cars(url: str, driver) -> dict:
-    logging.info(f"Обробляємо автомобіль: {url}")
-    driver.get(url)
-    time.sleep(1)
-    soup = BeautifulSoup(driver.page_source, "html.parser")
+def details_from_fields(fields: dict, extractor: CarPageExtractor) -> dict:
+    """Застосовує правила схеми до значень, які зібрав у браузері
+    скрипт build_detail_script."""
+    schema = extractor.schema
     car_details = {}
 
     try:
-        # Base Data
-        mark_tag = soup.find("h4", class_="css-10ofhqw")
-        if mark_tag:
-            car_details["mark"] = mark_tag.get_text(strip=True)
-
-        price_tag = soup.find("h3", class_="css-fqcbii")
-        if price_tag:
-            car_details["price"] = price_tag.get_text(strip=True)
-            car_details["price_numeric"] = parse_price(
-                price_str=price_tag.get_text(strip=True),
-            )
-
-        # Details Car
-        for p in soup.find_all("p", class_="css-1los5bp"):
-            text = p.get_text(strip=True)
+        for element, raw in zip(schema.elements, fields["elements"]):
+            if raw:
+                element.rule.apply(raw, car_details)
 
-            if "Рік випуску" in text:
-                try:
-                    car_details["year_created"] = int(text.split(":")[-1].strip())
-                except ValueError:
-                    pass
-            if "Пробіг" in text:
-                km = text.split(":")[-1].strip().lower()
-                try:
-                    car_details["mileage"] = km
-                    car_details["mileage_numeric"] = parse_mileage(km)
-                except ValueError:
-                    pass
+        for text in fields["params"]:
+            label, _, value = text.partition(schema.param_separator)
 
-            if "Тип палива" in text:
-                car_details["engine_type"] = text.split(":")[-1].strip()
+            rule = schema.params.get(label.strip())
+            if rule is not None:
+                rule.apply(value, car_details)
 
-            if "Коробка передач" in text:
-                car_details["gear_box"] = text.split(":")[-1].strip()
-
-            if "Об'єм двигуна" in text:
-                car_details["engine_capacity"] = text.split(":")[-1].strip().lower()
+        if fields["location"] is None:
+            logging.warning("Block doesn't found")
+        else:
+            car_details["location"] = join_location(fields["location"])
 
-            if "Тип приводу" in text:
-                car_details["drive_type"] = text.split(":")[-1].strip()
+    except Exception as e:
+        logging.error(f"Error While Trying Accumulate Car Data: {e}")
 
-            if "Модель" in text:
-                car_details["model"] = text.split(":")[-1].strip()
+    return car_details
 
-        location_block = soup.find("div", class_="css-1q7h1ph")
-        if not location_block:
-            logging.warning("Block doesn't found")
-        else:
-            city_el = location_block.find("p", class_="css-7wnksb")
-            region_el = location_block.find("p", class_="css-2n34b3")
-            area_el = location_block.find("p", class_="css-z0m36u")
 
-            city = city_el.get_text(strip=True) if city_el else ""
-            region = region_el.get_text(strip=True) if region_el else ""
-            area = area_el.get_text(strip=True) if area_el else ""
+def extract_car_details(
+    html: str,
+    extractor: CarPageExtractor | None = None,
+) -> dict:
+    car_details, _, _ = extract_car_details_timed(html, extractor)
+    return car_details
 
-            parts = [part for part in [city, region, area] if part.strip()]
 
-            full_location = ", ".join(parts)
+def extract_car_details_timed(
+    html: str,
+    extractor: CarPageExtractor | None = None,
+) -> tuple[dict, float, float]:
+    if extractor is None:
+        extractor = default_extractor()
+    started = time.perf_counter()
+    if extractor.use_state:
+        ad = find_state_ad(html, extractor.schema.state)
+        parsed = time.perf_counter()
+        if ad is not None:
+            car_details = details_from_state(ad, extractor.schema)
+            if car_details:
+                return car_details, parsed - started, time.perf_counter() - parsed
+
+        # Стану немає або він змінив формат: розбираємо DOM
+        logging.debug("Стан сторінки не знайдено, розбираємо DOM")
+
+    document = extractor.html_parser.parse(html)
+    parsed = time.perf_counter()
+    car_details = details_from_document(document, extractor)
+    return car_details, parsed - started, time.perf_counter() - parsed
+
+
+def schema_fields(schema: CarPageSchema) -> list[str]:
+    fields = [element.rule.field for element in schema.elements]
+    fields.extend(dict.fromkeys(rule.field for rule in schema.params.values()))
+    return [*fields, "location"]
+
+
+async def run_extraction(
+    runner: BaseExtractionRunner,
+    metrics: CrawlMetrics,
+    kind: str,
+    func: Callable,
+    *args,
+):
+    """Запускає *_timed-функцію розбору і записує час етапів parse,
+    extract та очікування вільного процесу розбору."""
+    started = time.perf_counter()
+    result, parse_seconds, extract_seconds = await runner.run(func, *args)
+    elapsed = time.perf_counter() - started
+
+    metrics.record(f"parse.{kind}", parse_seconds)
+    metrics.record(f"extract.{kind}", extract_seconds)
+    metrics.record("extract.queue", max(elapsed - parse_seconds - extract_seconds, 0.0))
+    return result
+
+
+async def fetch_page(
+    fetcher: BaseFetcher,
+    metrics: CrawlMetrics,
+    kind: str,
+    url: str,
+    wait_for: Sequence[str],
+    removed: Sequence[str] = (),
+    ready_marker: str | None = None,
+) -> str:
+    with metrics.timer(f"fetch.{kind}"):
+        html = await fetcher.fetch(url, wait_for=wait_for, removed=removed, ready_marker=ready_marker)
+
+    metrics.count("pages_fetched")
+    # Байти з мережі рахують самі фетчери: bytes для HTTP, browser_bytes для Chrome
+    metrics.count("page_chars", len(html))
+    return html
+
+
+async def fetch_fields(
+    fetcher: BaseFetcher,
+    metrics: CrawlMetrics,
+    url: str,
+    wait_for: Sequence[str],
+    script: BrowserScript,
+    removed: Sequence[str] = (),
+) -> str | dict:
+    with metrics.timer("fetch.detail"):
+        page = await fetcher.fetch_fields(url, wait_for, script, removed)
+
+    metrics.count("pages_fetched")
+    if isinstance(page, str):
+        metrics.count("page_chars", len(page))
+    else:
+        metrics.count("browser_extractions")
+    return page
+
+
+def page_url(url: str, page: int) -> str:
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}page={page}"
+
+
+def partition_url(url: str, partition: PricePartition | None = None) -> str:
+    if partition is None:
+        return url
+
+    query = urlencode({f"search[{name}]": value for name, value in partition.filters().items()})
+    separator = "&" if "?" in url else "?"
+    return f"{url}{separator}{query}"
+
+
+async def parse_olx_autos(
+    url: str,
+    fetcher: BaseFetcher,
+    offset: int = 1,
+    concurrency: int = 1,
+    extractor: CarPageExtractor | None = None,
+    start_page: int = 0,
+    on_page: PageHandler | None = None,
+    progress: CrawlProgress | None = None,
+    runner: BaseExtractionRunner = DEFAULT_RUNNER,
+) -> set:
+    """Гортає сторінки пошуку сайту і збирає з карток посилання на
+    оголошення; порядок обходу і точки збереження — як у crawl_pages."""
+    if extractor is None:
+        extractor = default_extractor()
+    semaphore = asyncio.Semaphore(concurrency)
+    metrics = progress.metrics if progress is not None else CrawlMetrics()
+
+    async def fetch_page_links(page: int) -> ListingPage:
+        async with semaphore:
+            paginated_url = page_url(url, page)
+            logging.info(f"Обробляємо сторінку {page}: {paginated_url}")
 
-            full_location = re.sub(r",\s*,", ",", full_location)
-            full_location = re.sub(r",\s*(\S)", r", \1", full_location)
+            try:
+                html = await fetch_page(
+                    fetcher,
+                    metrics,
+                    "listing",
+                    paginated_url,
+                    extractor.schema.listing_wait_for,
+                    removed=extractor.schema.listing_empty,
+                )
+            except ListingRemovedException:
+                # Сайт показав порожню видачу: пагінація скінчилася, повторювати нічого
+                metrics.count("empty_listing_pages")
+                return ListingPage(cards={}, last=True)
+            except IncompletePageException as e:
+                # Сторінка без карток після всіх повторів — ймовірно, кінець пагінації
+                html = e.html
+
+        page_cards = await run_extraction(
+            runner,
+            metrics,
+            "listing",
+            extract_listing_cards_timed,
+            html,
+            url,
+            extractor,
+        )
+        return ListingPage(cards=page_cards)
+
+    return await crawl_pages(
+        range(start_page, offset),
+        fetch_page_links,
+        on_page=on_page,
+        progress=progress,
+        metrics=metrics,
+    )
+
+
+@dataclass
+class PaginationDiscovery(BaseListingDiscovery):
+    """Сторінки пошуку сайту: кожну рендерить fetcher, зокрема в Chrome."""
+
+    fetcher: BaseFetcher
+    extractor: CarPageExtractor = field(default_factory=default_extractor)
+    concurrency: int = 1
+    runner: BaseExtractionRunner = DEFAULT_RUNNER
+    url: str = OLX_CARS_URL
+
+    def cursor_key(self, partition: PricePartition | None = None) -> str:
+        return partition_url(self.url, partition)
+
+    async def count(
+        self,
+        partition: PricePartition | None = None,
+        progress: CrawlProgress | None = None,
+    ) -> int | None:
+        metrics = progress.metrics if progress is not None else CrawlMetrics()
+        url = page_url(partition_url(self.url, partition), 0)
+        try:
+            html = await fetch_page(
+                self.fetcher,
+                metrics,
+                "probe",
+                url,
+                self.extractor.schema.listing_wait_for,
+                removed=self.extractor.schema.listing_empty,
+            )
+        except ListingRemovedException:
+            return 0
+        except IncompletePageException as e:
+            # Без карток, але лічильник результатів на сторінці є
+            html = e.html
+
+        return await self.runner.run(extract_total_count, html, self.extractor)
+
+    async def discover(
+        self,
+        pages: int,
+        start_page: int = 0,
+        on_page: PageHandler | None = None,
+        progress: CrawlProgress | None = None,
+        partition: PricePartition | None = None,
+    ) -> set:
+        return await parse_olx_autos(
+            partition_url(self.url, partition),
+            self.fetcher,
+            offset=pages,
+            concurrency=self.concurrency,
+            extractor=self.extractor,
+            start_page=start_page,
+            on_page=on_page,
+            progress=progress,
+            runner=self.runner,
+        )
+
+
+def init_discovery(
+    config: Config,
+    fetcher: BaseFetcher,
+    api_fetcher: BaseFetcher | None = None,
+    extractor: CarPageExtractor | None = None,
+    runner: BaseExtractionRunner = DEFAULT_RUNNER,
+    partition_store: BasePartitionStore | None = None,
+) -> BaseListingDiscovery:
+    """api_fetcher завантажує JSON без браузера і потрібен лише бекенду
+    api, fetcher — сторінки пошуку. Зі сховищем розбиття пошук
+    обходиться діапазонами цін."""
+    discovery = init_source_discovery(config, fetcher, api_fetcher, extractor, runner)
+    if not config.parser_partitioned_crawl:
+        return discovery
+
+    return PartitionedDiscovery(
+        inner=discovery,
+        store=partition_store if partition_store is not None else InMemoryPartitionStore(),
+        cap=config.parser_pagination_cap,
+        price_step=config.parser_partition_price_step,
+        concurrency=config.parser_partition_concurrency,
+    )
+
+
+def init_source_discovery(
+    config: Config,
+    fetcher: BaseFetcher,
+    api_fetcher: BaseFetcher | None = None,
+    extractor: CarPageExtractor | None = None,
+    runner: BaseExtractionRunner = DEFAULT_RUNNER,
+) -> BaseListingDiscovery:
+    if extractor is None:
+        extractor = default_extractor()
+    backend = config.parser_discovery_backend
+
+    if backend == "html":
+        return PaginationDiscovery(
+            fetcher=fetcher,
+            extractor=extractor,
+            concurrency=config.parser_concurrency,
+            runner=runner,
+        )
+    if backend == "api":
+        if extractor.schema.offers is None:
+            raise ValueError("Parser schema has no [offers] section for the offers API discovery")
+        if api_fetcher is None:
+            raise ValueError("Offers API discovery requires an HTTP fetcher")
+
+        return OffersAPIDiscovery(
+            fetcher=api_fetcher,
+            schema=extractor.schema,
+            api_url=config.parser_offers_api_url,
+            category_id=config.parser_offers_category_id,
+            page_size=min(config.parser_offers_page_size, OFFERS_MAX_PAGE_SIZE),
+            concurrency=config.parser_concurrency,
+        )
+
+    raise ValueError(f"Unknown parser discovery backend: {backend}")
+
+
+def listing_identity(url: str) -> dict:
+    return {
+        "url": canonical_url(url),
+        "olx_id": olx_listing_id(url),
+        "parsed_at": datetime.now(timezone.utc),
+    }
 
-            car_details["location"] = full_location
 
-        image_tag = soup.find("img", class_="css-1bmvjcs")
-        if image_tag and image_tag.get("src"):
-            car_details["url_image"] = image_tag["src"]
+def is_card_complete(card: dict, required_fields: Sequence[str]) -> bool:
+    return bool(card) and all(name in card for name in required_fields)
 
-    except Exception as e:
-        logging.error(f"Error While Trying Accumulate Car Data: {e}")
 
-    return car_details
+def card_document(url: str, card: dict) -> dict:
+    """Автомобіль, зібраний лише з картки пошуку. parsed_at не задається:
+    він позначає завантаження сторінки оголошення, тож звичайна
+    синхронізація згодом оновить і решту полів."""
+    return {
+        **card,
+        "url": canonical_url(url),
+        "olx_id": olx_listing_id(url),
+        "card_parsed_at": datetime.now(timezone.utc),
+    }
 
 
-def parsing_olx_cars(offset: int):
-    url = "https://www.olx.ua/uk/transport/legkovye-avtomobili/"
-    driver = init_driver()
+async def archive_page(archive: BasePageArchive, url: str, html: str, metrics: CrawlMetrics) -> None:
+    page = ArchivedPage(
+        olx_id=olx_listing_id(url),
+        url=canonical_url(url),
+        fetched_at=datetime.now(timezone.utc),
+        body=html,
+    )
+    try:
+        with metrics.timer("archive"):
+            size = await archive.put(page)
+    except Exception as e:
+        # Архів допоміжний: без нього оголошення все одно зберігається
+        logging.error(f"Не вдалося заархівувати сторінку {url}: {e}")
+        return
+
+    metrics.count("archived")
+    metrics.count("archive_bytes", size)
+
+
+async def parsing_data_cars(
+    url: str,
+    fetcher: BaseFetcher,
+    extractor: CarPageExtractor | None = None,
+    runner: BaseExtractionRunner = DEFAULT_RUNNER,
+    metrics: CrawlMetrics | None = None,
+    archive: BasePageArchive | None = None,
+) -> dict:
+    """archive зберігає сирий HTML сторінки для повторного розбору; у
+    режимі browser HTML не передається з Chrome, тож архівувати нічого."""
+    if extractor is None:
+        extractor = default_extractor()
+    if metrics is None:
+        metrics = CrawlMetrics()
 
-    car_links = parse_olx_autos(url, driver, offset=offset)
-    logging.info(f"Found links: {len(car_links)}")
+    logging.info(f"Обробляємо автомобіль: {url}")
+    wait_for = extractor.schema.detail_wait_for
+    removed = extractor.schema.detail_removed
+    # З JSON-станом сторінка готова, навіть поки блоки з хешованими класами не відмалювалися
+    ready_marker = extractor.schema.state.marker if extractor.use_state else None
+    try:
+        if extractor.browser_script is None:
+            page = await fetch_page(fetcher, metrics, "detail", url, wait_for, removed, ready_marker)
+        else:
+            page = await fetch_fields(fetcher, metrics, url, wait_for, extractor.browser_script, removed)
+    except ListingRemovedException:
+        logging.info(f"Оголошення знято з публікації: {url}")
+        metrics.count("removed_listings")
+        return {}
+    except PageFetchException as e:
+        logging.error(f"Не вдалося завантажити сторінку {url}: {e.message}")
+        metrics.count("fetch_errors")
+        return {}
+
+    if archive is not None and isinstance(page, str):
+        await archive_page(archive, url, page, metrics)
+
+    if isinstance(page, dict):
+        # Значення вже зібрано в Chrome, лишилося нормалізувати кілька рядків
+        with metrics.timer("extract.detail"):
+            car_details = details_from_fields(page, extractor)
+    else:
+        # Розбір HTML блокує CPU, тому не виконуємо його в event loop
+        car_details = await run_extraction(
+            runner,
+            metrics,
+            "detail",
+            extract_car_details_timed,
+            page,
+            extractor,
+        )
+    if car_details:
+        for name in schema_fields(extractor.schema):
+            if name not in car_details:
+                metrics.field_missing(name)
+        car_details.update(listing_identity(url))
 
-    car_list = []
-    for index, car_url in enumerate(car_links):
-        logging.info(f"{index} з {len(car_links)}")
-        details = parsing_data_cars(car_url, driver)
-        if details:
-            car_list.append(details)
+    return car_details
 
-    driver.quit()
 
-    return car_list
+async def parsing_olx_cars(
+    offset: int,
+    fetcher: BaseFetcher,
+    concurrency: int = 1,
+    extractor: CarPageExtractor | None = None,
+    link_filter: Callable[[set], Awaitable[set]] | None = None,
+    frontier: BaseCrawlFrontier | None = None,
+    progress: CrawlProgress | None = None,
+    runner: BaseExtractionRunner = DEFAULT_RUNNER,
+    discovery: BaseListingDiscovery | None = None,
+    card_only: bool = False,
+    required_fields: Sequence[str] = (),
+    archive: BasePageArchive | None = None,
+) -> AsyncIterator[dict]:
+    """Віддає автомобілі по одному, щойно сторінку розібрано, не тримаючи
+    весь результат обходу в пам'яті.
+
+    link_filter відбирає з усіх знайдених посилань ті, деталі яких
+    справді треба завантажити. frontier зберігає знайдені посилання і
+    курсор пагінації, тож перерваний обхід продовжується з місця зупинки.
+    runner виконує розбір HTML поза event loop, зокрема в пулі процесів.
+    discovery знаходить посилання, за замовчуванням на сторінках пошуку
+    сайту, а offset задає кількість його сторінок.
+
+    З card_only автомобілі з усіма required_fields у картці віддаються
+    одразу під час пагінації, а сторінки завантажуються лише для решти.
+    archive зберігає сирі сторінки оголошень.
+    """
+    if extractor is None:
+        extractor = default_extractor()
+    if discovery is None:
+        discovery = PaginationDiscovery(
+            fetcher=fetcher,
+            extractor=extractor,
+            concurrency=concurrency,
+            runner=runner,
+        )
+    if frontier is None:
+        frontier = InMemoryCrawlFrontier()
+    if progress is None:
+        progress = CrawlProgress()
+
+    found_links = 0
+    card_cars = 0
+    queued_links = 0
+    # Автомобілі з карток, які знайшла пагінація, до споживача
+    cards: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def checkpoint(page: int, page_cards: dict[str, dict]) -> None:
+        nonlocal found_links, card_cars, queued_links
+        page_links = set(page_cards)
+        found_links += len(page_links)
+        if card_only:
+            for car_url, card in page_cards.items():
+                if is_card_complete(card, required_fields):
+                    page_links.discard(car_url)
+                    card_cars += 1
+                    await cards.put(card_document(car_url, card))
+
+        if link_filter is not None:
+            page_links = await link_filter(page_links)
+        queued_links += len(page_links)
+        progress.links += len(page_links)
+        await frontier.add_page(page, page_links)
+
+    async def discover_links() -> None:
+        start_page = await frontier.start(discovery.cursor_key())
+        if start_page is None:
+            logging.info("Пагінацію вже пройдено, продовжуємо завантаження оголошень")
+            return
+
+        if start_page:
+            logging.info(f"Продовжуємо перерваний обхід зі сторінки {start_page}")
+
+        await discovery.discover(
+            offset,
+            start_page=start_page,
+            on_page=checkpoint,
+            progress=progress,
+        )
+        await frontier.finish_pagination()
+        logging.info(
+            f"Found links: {found_links}, з карток: {card_cars}, пропущено відомих оголошень: "
+            f"{found_links - card_cars - queued_links}, до завантаження: {queued_links}",
+        )
+
+    async def run_discovery() -> None:
+        try:
+            await discover_links()
+        except Exception:
+            await cards.put(None)
+            raise
+        await cards.put(None)
+
+    discovery_task = asyncio.create_task(run_discovery())
+    try:
+        while (car := await cards.get()) is not None:
+            progress.parsed += 1
+            progress.metrics.count("cars_from_cards")
+            yield car
+        await discovery_task
+    finally:
+        discovery_task.cancel()
+        await asyncio.gather(discovery_task, return_exceptions=True)
+
+    # Воркери беруть посилання з фронтиру невеликими пачками
+    links: asyncio.Queue = asyncio.Queue(maxsize=concurrency * 2)
+    # Обмежена черга: воркери чекають, поки споживач не забере результат
+    results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+
+    async def feed() -> None:
+        try:
+            while True:
+                batch = await frontier.claim(concurrency * 2)
+                if not batch:
+                    if not await frontier.has_in_progress():
+                        break
+                    # Чекаємо інших воркерів: їхні оренди можуть закінчитися
+                    await asyncio.sleep(FRONTIER_POLL_INTERVAL)
+                    continue
+
+                for car_url in batch:
+                    await links.put(car_url)
+        except Exception as e:
+            logging.error(f"Не вдалося отримати посилання з фронтиру: {e}")
+
+        for _ in range(concurrency):
+            await links.put(None)
+
+    async def worker() -> None:
+        while (car_url := await links.get()) is not None:
+            try:
+                details = await parsing_data_cars(
+                    car_url,
+                    fetcher,
+                    extractor,
+                    runner,
+                    progress.metrics,
+                    archive,
+                )
+                await frontier.mark(car_url, DONE if details else FAILED)
+            except Exception as e:
+                logging.error(f"Помилка при обробці {car_url}: {e}")
+                details = {}
+            await results.put(details)
+        await results.put(None)
+
+    # Посилання в черзі й у роботі лишаються в оренді, скільки б не тривало завантаження
+    async with frontier.heartbeat():
+        tasks = [
+            asyncio.create_task(feed()),
+            *(asyncio.create_task(worker()) for _ in range(concurrency)),
+        ]
+        finished_workers = 0
+        processed = 0
+        try:
+            while finished_workers < concurrency:
+                details = await results.get()
+                if details is None:
+                    finished_workers += 1
+                    continue
+
+                processed += 1
+                logging.info(f"Оброблено оголошень: {processed}")
+                if not details:
+                    progress.errors += 1
+                    continue
+
+                progress.parsed += 1
+                yield details
+
+            logging.info(f"Стан фронтиру після обходу: {await frontier.finish()}")
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await frontier.flush()
@@ -0,0 +1,81 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+
+# Фільтр ціни OLX, межі включні
+PRICE_FROM_FILTER = "filter_float_price:from"
+PRICE_TO_FILTER = "filter_float_price:to"
+
+
+@dataclass(frozen=True, order=True)
+class PricePartition:
+    """Діапазон цін `[price_from, price_to)`, достатньо вузький, щоб
+    пагінація пошуку дійшла до кінця. price_to None — без верхньої межі.
+
+    Фільтр OLX дробовий і включний, тож межа price_to передається як є і
+    належить також наступному діапазону: оголошення з ціною на межі
+    знаходяться двічі, а дробові ціни не губляться між діапазонами.
+    """
+
+    price_from: int = 0
+    price_to: int | None = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.price_from}-{'' if self.price_to is None else self.price_to}"
+
+    @classmethod
+    def from_key(cls, key: str) -> "PricePartition":
+        price_from, _, price_to = key.partition("-")
+        return cls(int(price_from), int(price_to) if price_to else None)
+
+    def filters(self) -> dict[str, int]:
+        filters = {PRICE_FROM_FILTER: self.price_from}
+        if self.price_to is not None:
+            filters[PRICE_TO_FILTER] = self.price_to
+        return filters
+
+    def can_split(self) -> bool:
+        return self.price_to is None or self.price_to - self.price_from > 1
+
+    def split(self, step: int) -> tuple["PricePartition", "PricePartition"]:
+        """Ділить навпіл; відкритий діапазон — геометрично, бо дорогих
+        автомобілів небагато."""
+        if self.price_to is None:
+            middle = self.price_from + max(self.price_from, step)
+        else:
+            middle = (self.price_from + self.price_to) // 2
+        return PricePartition(self.price_from, middle), PricePartition(middle, self.price_to)
+
+
+@dataclass
+class BasePartitionStore(ABC):
+    """Розбиття пошуку з попередньої синхронізації і кількість оголошень
+    у кожному розділі, окремо для кожного джерела оголошень. Розмір None —
+    діапазон, розмір якого не вдалося дізнатися."""
+
+    @abstractmethod
+    async def load(self, source: str) -> dict[PricePartition, int | None]:
+        raise NotImplementedError()
+
+    @abstractmethod
+    async def save(self, source: str, sizes: dict[PricePartition, int | None]) -> None:
+        """Замінює збережене розбиття джерела новим."""
+        raise NotImplementedError()
+
+
+@dataclass
+class InMemoryPartitionStore(BasePartitionStore):
+    _plans: dict[str, dict[PricePartition, int | None]] = field(default_factory=dict, init=False, repr=False)
+
+    async def load(self, source: str) -> dict[PricePartition, int | None]:
+        return dict(self._plans.get(source, {}))
+
+    async def save(self, source: str, sizes: dict[PricePartition, int | None]) -> None:
+        self._plans[source] = dict(sizes)
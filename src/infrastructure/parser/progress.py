@@ -0,0 +1,28 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from src.infrastructure.parser.metrics import CrawlMetrics
+
+
+@dataclass
+class CrawlProgress:
+    """Лічильники поточного обходу, які оновлюються під час
+    синхронізації, і час його етапів у metrics."""
+
+    pages: int = 0
+    links: int = 0
+    parsed: int = 0
+    saved: int = 0
+    errors: int = 0
+    metrics: CrawlMetrics = field(default_factory=CrawlMetrics, repr=False)
+
+    def to_dict(self) -> dict:
+        return {
+            "pages": self.pages,
+            "links": self.links,
+            "parsed": self.parsed,
+            "saved": self.saved,
+            "errors": self.errors,
+        }
@@ -0,0 +1,133 @@
+import asyncio
+import logging
+import random
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+
+def backoff_delay(
+    attempt: int,
+    base_delay: float,
+    max_delay: float,
+    retry_after: float | None = None,
+) -> float:
+    """Експоненційна затримка з повним джитером, щоб повтори різних
+    воркерів не збігалися в часі."""
+    delay = random.uniform(0, min(max_delay, base_delay * 2**attempt))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, max_delay))
+    return delay
+
+
+@dataclass(eq=False)
+class RetryBudget:
+    """Повтори дозволені лише в межах частки ratio від усіх запитів.
+
+    Коли падає більшість запитів, повтори лише множать навантаження на
+    сайт, тож бюджет вичерпується і помилка одразу йде далі.
+    """
+
+    ratio: float = 0.2
+    min_retries: int = 10
+    capacity: int = 50
+    _tokens: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._tokens = float(self.min_retries)
+
+    def deposit(self) -> None:
+        self._tokens = min(self._tokens + self.ratio, float(self.capacity))
+
+    def withdraw(self) -> bool:
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+@dataclass(eq=False)
+class CircuitBreaker:
+    """Призупиняє обхід, коли сайт відповідає помилками поспіль.
+
+    Після failure_threshold невдач поспіль запити чекають reset_timeout,
+    потім один пробний запит вирішує, чи продовжувати. Кожне повторне
+    відкриття подвоює паузу до max_reset_timeout.
+    """
+
+    failure_threshold: int = 10
+    reset_timeout: float = 30.0
+    max_reset_timeout: float = 300.0
+    _failures: int = field(default=0, init=False, repr=False)
+    _opened_at: float | None = field(default=None, init=False, repr=False)
+    _current_timeout: float = field(default=0.0, init=False, repr=False)
+    _probing: bool = field(default=False, init=False, repr=False)
+    _condition: asyncio.Condition = field(
+        default_factory=asyncio.Condition,
+        init=False,
+        repr=False,
+    )
+
+    @property
+    def is_open(self) -> bool:
+        return self._opened_at is not None
+
+    async def acquire(self) -> bool:
+        """Чекає, поки вимикач закритий, і повертає True для пробного
+        запиту."""
+        async with self._condition:
+            while self.is_open:
+                remaining = self._opened_at + self._current_timeout - time.monotonic()
+                if remaining <= 0 and not self._probing:
+                    # Пробний запит: решта чекає на його результат
+                    self._probing = True
+                    return True
+                try:
+                    await asyncio.wait_for(
+                        self._condition.wait(),
+                        timeout=remaining if remaining > 0 else None,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+        return False
+
+    async def record_success(self) -> None:
+        async with self._condition:
+            if self.is_open:
+                logging.info("Сайт знову відповідає, продовжуємо обхід")
+            self._failures = 0
+            self._opened_at = None
+            self._probing = False
+            self._current_timeout = 0.0
+            self._condition.notify_all()
+
+    async def record_failure(self, probe: bool = False) -> None:
+        async with self._condition:
+            self._failures += 1
+            if probe or (
+                not self.is_open and self._failures >= self.failure_threshold
+            ):
+                self._open()
+            self._condition.notify_all()
+
+    async def release_probe(self) -> None:
+        """Дозволяє новий пробний запит, якщо попередній скасовано без
+        результату."""
+        async with self._condition:
+            self._probing = False
+            self._condition.notify_all()
+
+    def _open(self) -> None:
+        self._current_timeout = min(
+            self.max_reset_timeout,
+            self._current_timeout * 2 if self._current_timeout else self.reset_timeout,
+        )
+        self._opened_at = time.monotonic()
+        self._probing = False
+        logging.warning(
+            f"Сайт відповідає помилками {self._failures} разів поспіль, "
+            f"призупиняємо обхід на {self._current_timeout:.1f} с",
+        )
@@ -0,0 +1,275 @@
+from collections.abc import Callable
+from dataclasses import (
+    dataclass,
+    field,
+)
+from functools import lru_cache
+from typing import Any
+
+from src.infrastructure.config_loader import load_config
+from src.infrastructure.parser.utils import (
+    parse_mileage,
+    parse_price,
+)
+from src.settings.config import DEFAULT_SCHEMA_PATH
+
+
+def normalize_text(value: str) -> str:
+    return value.strip()
+
+
+def normalize_lower(value: str) -> str:
+    return value.strip().lower()
+
+
+def normalize_int(value: str) -> int:
+    return int(value.strip())
+
+
+NORMALIZERS: dict[str, Callable[[str], Any]] = {
+    "text": normalize_text,
+    "lower": normalize_lower,
+    "int": normalize_int,
+    "price": parse_price,
+    "mileage": parse_mileage,
+}
+
+
+@dataclass
+class ElementConfig:
+    field: str
+    selector: str
+    attr: str | None = None
+    normalizer: str = "text"
+    numeric_field: str | None = None
+    numeric: str | None = None
+
+
+@dataclass
+class ParamConfig:
+    label: str
+    field: str
+    aliases: list[str] = field(default_factory=list)
+    normalizer: str = "text"
+    numeric_field: str | None = None
+    numeric: str | None = None
+
+
+@dataclass
+class StateConfig:
+    marker: str = ""
+    ad_path: str = ""
+    params_path: str = "params"
+    param_label: str = "name"
+    param_value: str = "value"
+    url_path: str = "url"
+    fields: dict[str, str] = field(default_factory=dict)
+    params: dict[str, str] = field(default_factory=dict)
+    location: list[str] = field(default_factory=list)
+
+
+@dataclass
+class ListingConfig:
+    card: str
+    link: str
+    wait_for: list[str] = field(default_factory=list)
+    empty: list[str] = field(default_factory=list)
+    total_count: str | None = None
+    state: StateConfig | None = None
+
+
+@dataclass
+class DetailConfig:
+    param_selector: str
+    location: str
+    param_separator: str = ":"
+    wait_for: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+    location_parts: list[str] = field(default_factory=list)
+    elements: list[ElementConfig] = field(default_factory=list)
+    params: list[ParamConfig] = field(default_factory=list)
+
+
+@dataclass
+class SchemaConfig:
+    listing: ListingConfig
+    detail: DetailConfig
+    state: StateConfig | None = None
+    offers: StateConfig | None = None
+
+
+@dataclass(frozen=True)
+class FieldRule:
+    field: str
+    normalizer: Callable[[str], Any]
+    numeric_field: str | None = None
+    numeric: Callable[[str], Any] | None = None
+
+    def apply(self, raw: str, car_details: dict) -> None:
+        try:
+            car_details[self.field] = self.normalizer(raw)
+        except ValueError:
+            return
+
+        if self.numeric_field is not None:
+            try:
+                car_details[self.numeric_field] = self.numeric(raw)
+            except ValueError:
+                pass
+
+
+@dataclass(frozen=True)
+class ElementRule:
+    selector: str
+    attr: str | None
+    rule: FieldRule
+
+
+@dataclass(frozen=True)
+class StateSchema:
+    """Де в JSON-стані сторінки або у відповіді API лежать поля
+    автомобіля. Шляхи задані кортежами ключів, індекси списків — рядками
+    з цифр. param_rules шукає правило параметра за його ключем; без нього
+    параметри зіставляються з підписами сторінки."""
+
+    marker: str
+    ad_path: tuple[str, ...]
+    params_path: tuple[str, ...]
+    param_label: str
+    param_value: tuple[str, ...]
+    fields: tuple[tuple[tuple[str, ...], FieldRule], ...]
+    location: tuple[tuple[str, ...], ...]
+    url_path: tuple[str, ...] = ("url",)
+    param_rules: dict[str, FieldRule] | None = None
+
+
+@dataclass(frozen=True)
+class CarPageSchema:
+    """Скомпільована схема: таблиця `підпис параметра -> правило`
+    дозволяє розібрати всі параграфи сторінки за один прохід."""
+
+    listing_card: str
+    listing_link: str
+    listing_wait_for: tuple[str, ...]
+    detail_wait_for: tuple[str, ...]
+    elements: tuple[ElementRule, ...]
+    param_selector: str
+    param_separator: str
+    params: dict[str, FieldRule]
+    location_block: str
+    location_parts: tuple[str, ...]
+    state: StateSchema | None = None
+    offers: StateSchema | None = None
+    listing_state: StateSchema | None = None
+    listing_total_count: str | None = None
+    detail_removed: tuple[str, ...] = ()
+    listing_empty: tuple[str, ...] = ()
+
+
+def compile_rule(
+    field_name: str,
+    normalizer: str,
+    numeric_field: str | None,
+    numeric: str | None,
+) -> FieldRule:
+    try:
+        return FieldRule(
+            field=field_name,
+            normalizer=NORMALIZERS[normalizer],
+            numeric_field=numeric_field,
+            numeric=NORMALIZERS[numeric] if numeric_field else None,
+        )
+    except KeyError as e:
+        raise ValueError(f"Unknown normalizer {e} for field '{field_name}'")
+
+
+def split_path(path: str) -> tuple[str, ...]:
+    return tuple(path.split(".")) if path else ()
+
+
+def compile_state(
+    config: StateConfig,
+    elements: tuple[ElementRule, ...],
+    params: dict[str, FieldRule],
+) -> StateSchema:
+    # Поля стану нормалізуються тими ж правилами, що й відповідні елементи сторінки
+    rules = {element.rule.field: element.rule for element in elements}
+    fields = []
+    for field_name, path in config.fields.items():
+        if field_name not in rules:
+            raise ValueError(f"State field '{field_name}' has no matching detail element")
+        fields.append((split_path(path), rules[field_name]))
+
+    param_rules = None
+    if config.params:
+        rules.update((rule.field, rule) for rule in params.values())
+        param_rules = {}
+        for key, field_name in config.params.items():
+            if field_name not in rules:
+                raise ValueError(f"State parameter '{key}' maps to unknown field '{field_name}'")
+            param_rules[key] = rules[field_name]
+
+    return StateSchema(
+        marker=config.marker,
+        ad_path=split_path(config.ad_path),
+        params_path=split_path(config.params_path),
+        param_label=config.param_label,
+        param_value=split_path(config.param_value),
+        fields=tuple(fields),
+        location=tuple(split_path(path) for path in config.location),
+        url_path=split_path(config.url_path),
+        param_rules=param_rules,
+    )
+
+
+def compile_schema(config: SchemaConfig) -> CarPageSchema:
+    params = {}
+    for param in config.detail.params:
+        rule = compile_rule(
+            param.field,
+            param.normalizer,
+            param.numeric_field,
+            param.numeric,
+        )
+        for label in (param.label, *param.aliases):
+            params[label] = rule
+
+    elements = tuple(
+        ElementRule(
+            selector=element.selector,
+            attr=element.attr,
+            rule=compile_rule(
+                element.field,
+                element.normalizer,
+                element.numeric_field,
+                element.numeric,
+            ),
+        )
+        for element in config.detail.elements
+    )
+
+    return CarPageSchema(
+        listing_card=config.listing.card,
+        listing_link=config.listing.link,
+        listing_wait_for=tuple(config.listing.wait_for),
+        listing_empty=tuple(config.listing.empty),
+        detail_wait_for=tuple(config.detail.wait_for),
+        detail_removed=tuple(config.detail.removed),
+        elements=elements,
+        param_selector=config.detail.param_selector,
+        param_separator=config.detail.param_separator,
+        params=params,
+        location_block=config.detail.location,
+        location_parts=tuple(config.detail.location_parts),
+        state=compile_state(config.state, elements, params) if config.state is not None else None,
+        offers=compile_state(config.offers, elements, params) if config.offers is not None else None,
+        listing_total_count=config.listing.total_count,
+        listing_state=(
+            compile_state(config.listing.state, elements, params) if config.listing.state is not None else None
+        ),
+    )
+
+
+@lru_cache
+def load_car_schema(path: str = DEFAULT_SCHEMA_PATH) -> CarPageSchema:
+    return compile_schema(load_config(SchemaConfig, path=path))
@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+from urllib.parse import urlsplit
+
+
+# Відповіді, якими сайт сигналізує, що ми надто активні
+OVERLOAD_STATUSES = frozenset({403, 429})
+# Мінімальний інтервал між двома зниженнями ліміту одного хоста, с
+MIN_DECREASE_INTERVAL = 0.1
+
+
+def is_overload_status(status_code: int | None) -> bool:
+    return status_code in OVERLOAD_STATUSES or (status_code or 0) >= 500
+
+
+def parse_host_budgets(budgets: str) -> dict[str, int]:
+    """Розбирає рядок виду `www.olx.ua=8,m.olx.ua=2`."""
+    result = {}
+    for item in budgets.split(","):
+        if not item.strip():
+            continue
+        host, _, limit = item.partition("=")
+        result[host.strip()] = int(limit)
+
+    return result
+
+
+@dataclass(eq=False)
+class HostLimit:
+    """Поточний стан ліміту паралельних запитів до одного хоста."""
+
+    host: str
+    limit: float
+    max_limit: int
+    in_flight: int = 0
+    latency: float | None = None
+    base_latency: float | None = None
+    paused_until: float = 0.0
+    last_decrease: float = 0.0
+    successes: int = 0
+    overloads: int = 0
+    condition: asyncio.Condition = field(default_factory=asyncio.Condition, repr=False)
+
+    @property
+    def current(self) -> int:
+        return int(self.limit)
+
+    def has_capacity(self) -> bool:
+        return self.in_flight < self.current
+
+    def to_dict(self) -> dict:
+        return {
+            "limit": self.current,
+            "max_limit": self.max_limit,
+            "in_flight": self.in_flight,
+            "latency_ms": round(self.latency * 1000, 1) if self.latency else None,
+            "base_latency_ms": round(self.base_latency * 1000, 1) if self.base_latency else None,
+            "paused_for": round(max(0.0, self.paused_until - time.monotonic()), 1),
+            "successes": self.successes,
+            "overloads": self.overloads,
+        }
+
+
+@dataclass(eq=False)
+class AdaptiveConcurrencyLimiter:
+    """AIMD-ліміт паралельних запитів окремо для кожного хоста.
+
+    Поки відповіді успішні і затримка не перевищує базову більш ніж у
+    latency_tolerance разів, ліміт зростає приблизно на одиницю за кожні
+    `limit` успішних запитів. На 403/429/5xx, мережеві помилки або зростання
+    затримки ліміт множиться на decrease_factor, не частіше одного разу за
+    час відповіді, щоб одночасні невдачі не обвалили його до мінімуму.
+    """
+
+    initial_limit: int = 2
+    min_limit: int = 1
+    max_limit: int = 10
+    host_budgets: dict[str, int] = field(default_factory=dict)
+    decrease_factor: float = 0.5
+    latency_tolerance: float = 2.0
+    latency_alpha: float = 0.2
+    default_pause: float = 5.0
+    _hosts: dict[str, HostLimit] = field(default_factory=dict, init=False, repr=False)
+
+    def host(self, url: str) -> HostLimit:
+        host = urlsplit(url).netloc
+        if host not in self._hosts:
+            max_limit = self.host_budgets.get(host, self.max_limit)
+            self._hosts[host] = HostLimit(
+                host=host,
+                limit=float(max(self.min_limit, min(self.initial_limit, max_limit))),
+                max_limit=max_limit,
+            )
+        return self._hosts[host]
+
+    async def acquire(self, url: str) -> HostLimit:
+        host = self.host(url)
+        async with host.condition:
+            while True:
+                delay = host.paused_until - time.monotonic()
+                if delay <= 0 and host.has_capacity():
+                    break
+                try:
+                    # Під час паузи чекаємо з таймаутом, бо її кінець ніхто не сповіщає
+                    await asyncio.wait_for(
+                        host.condition.wait(),
+                        timeout=delay if delay > 0 else None,
+                    )
+                except asyncio.TimeoutError:
+                    pass
+            host.in_flight += 1
+
+        return host
+
+    async def release(self, host: HostLimit) -> None:
+        async with host.condition:
+            host.in_flight -= 1
+            host.condition.notify_all()
+
+    def record_success(self, host: HostLimit, latency: float) -> None:
+        host.successes += 1
+        if host.latency is None:
+            host.latency = latency
+        else:
+            host.latency += self.latency_alpha * (latency - host.latency)
+
+        if host.base_latency is None or host.latency < host.base_latency:
+            host.base_latency = host.latency
+        else:
+            # База повільно наздоганяє, якщо сайт став стабільно повільнішим
+            host.base_latency += 0.01 * (host.latency - host.base_latency)
+
+        if host.latency > host.base_latency * self.latency_tolerance:
+            self._decrease(host, reason=f"затримка {host.latency:.2f} с")
+        else:
+            host.limit = min(float(host.max_limit), host.limit + 1 / host.limit)
+
+    def record_overload(self, host: HostLimit, retry_after: float | None = None) -> None:
+        host.overloads += 1
+        self._decrease(host, reason="сайт обмежує запити")
+
+        pause = retry_after if retry_after is not None else self.default_pause
+        host.paused_until = max(host.paused_until, time.monotonic() + pause)
+
+    def _decrease(self, host: HostLimit, reason: str) -> None:
+        now = time.monotonic()
+        if now - host.last_decrease < max(host.latency or 0.0, MIN_DECREASE_INTERVAL):
+            return
+
+        host.last_decrease = now
+        host.limit = max(float(self.min_limit), host.limit * self.decrease_factor)
+        logging.warning(f"Знижуємо ліміт для {host.host} до {host.current}: {reason}")
+
+    def snapshot(self) -> dict:
+        return {name: host.to_dict() for name, host in self._hosts.items()}
@@ -1,4 +1,15 @@
 import re
+from urllib.parse import (
+    parse_qsl,
+    urlencode,
+    urlsplit,
+    urlunsplit,
+)
+
+
+# Параметри, які OLX додає до посилань для аналітики і які не змінюють сторінку
+TRACKING_PARAMS = frozenset({"reason", "search_reason"})
+OLX_ID_RE = re.compile(r"-ID([0-9A-Za-z]+)\.html")
 
 
 def parse_mileage(mileage_str: str) -> int:
@@ -15,3 +26,42 @@ def parse_mileage(mileage_str: str) -> int:
 def parse_price(price_str: str) -> int:
     number_str = re.sub(r"[^\d]", "", price_str)
     return int(number_str)
+
+
+def join_location(parts: list[str]) -> str:
+    full_location = ", ".join(part for part in parts if part.strip())
+
+    full_location = re.sub(r",\s*,", ",", full_location)
+    full_location = re.sub(r",\s*(\S)", r", \1", full_location)
+
+    return full_location
+
+
+def canonical_url(url: str) -> str:
+    parts = urlsplit(url)
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.startswith("utm_")
+    )
+
+    return urlunsplit(
+        (
+            parts.scheme.lower(),
+            parts.netloc.lower(),
+            parts.path or "/",
+            urlencode(query),
+            "",
+        ),
+    )
+
+
+def olx_listing_id(url: str) -> str:
+    """ID оголошення з посилання виду `.../title-IDabc12.html`.
+
+    Якщо посилання має інший формат, ключем слугує його канонічний шлях.
+    """
+    match = OLX_ID_RE.search(url)
+    if match:
+        return match.group(1)
+    return urlsplit(canonical_url(url)).path
@@ -1,4 +1,7 @@
-from typing import List
+from typing import (
+    Dict,
+    List,
+)
 
 from fastapi import (
     Depends,
@@ -15,7 +18,6 @@ from src.application.cars.commands.cars import (
     GetCarByIdCommand,
     GetCarsByMarkCommand,
     GetCarsByYearCommand,
-    ParserCarsCommand,
     PuttingCarCommand,
 )
 from src.application.cars.dto.car import DTOCars
@@ -25,7 +27,9 @@ from src.application.cars.schemas.base import (
 )
 from src.domain.common.exceptions.base import BaseAppException
 from src.infrastructure.di.main import init_container
+from src.infrastructure.jobs.sync import SyncJobManager
 from src.infrastructure.mediator.main import Mediator
+from src.infrastructure.parser.throttle import AdaptiveConcurrencyLimiter
 from src.presentation.api.controllers.responses.base import (
     ErrorData,
     SuccessResponse,
@@ -38,31 +42,89 @@ router = APIRouter(tags=["Auto Galery"])
 
 @router.get(
     "/sync",
-    status_code=status.HTTP_201_CREATED,
-    description="API Parser All Cars From OLX. RECOMMEND SET 'OFFSET'=1 FOR NOT WAITING TOO LONG",
+    status_code=status.HTTP_202_ACCEPTED,
+    description=(
+        "Start parsing all cars from OLX in the background. Returns the sync job at once, "
+        "its progress and final summary are available at /sync/{job_id}. "
+        "An interrupted sync resumes where it stopped. "
+        "mode=cards saves cars straight from the search result cards and opens car pages "
+        "only for cards missing required fields."
+    ),
     responses={
-        status.HTTP_201_CREATED: {"model": DTOCars},
         status.HTTP_400_BAD_REQUEST: {"model": ErrorData},
     },
 )
 async def parsing_cars_handler(
     offset: int,
+    mode: str = "full",
     container: Container = Depends(Stub(init_container)),
-) -> SuccessResponse[List[DTOCars]]:
+) -> SuccessResponse[Dict]:
     """Parsing Cars."""
-    mediator: Mediator = container.resolve(Mediator)
+    jobs: SyncJobManager = container.resolve(SyncJobManager)
 
     try:
-        cars = await mediator.handle_command(
-            ParserCarsCommand(offset=offset),
-        )
+        job = await jobs.submit(offset=offset, mode=mode)
     except BaseAppException as exception:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail={"error": exception.message},
         )
 
-    return SuccessResponse(result=cars)
+    return SuccessResponse(result=job.to_dict())
+
+
+@router.get(
+    "/sync/{job_id}",
+    status_code=status.HTTP_200_OK,
+    description="Status, progress counters and final summary of a sync job",
+    responses={
+        status.HTTP_404_NOT_FOUND: {"model": ErrorData},
+    },
+)
+async def sync_job_handler(
+    job_id: str,
+    container: Container = Depends(Stub(init_container)),
+) -> SuccessResponse[Dict]:
+    """Sync Job Status."""
+    jobs: SyncJobManager = container.resolve(SyncJobManager)
+
+    try:
+        job = jobs.get(job_id)
+    except BaseAppException as exception:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail={"error": exception.message},
+        )
+
+    return SuccessResponse(result=job.to_dict())
+
+
+@router.get(
+    "/sync_jobs",
+    status_code=status.HTTP_200_OK,
+    description="Recent sync jobs, newest first",
+)
+async def sync_jobs_handler(
+    container: Container = Depends(Stub(init_container)),
+) -> SuccessResponse[List[Dict]]:
+    """Sync Jobs."""
+    jobs: SyncJobManager = container.resolve(SyncJobManager)
+
+    return SuccessResponse(result=[job.to_dict() for job in jobs.list()])
+
+
+@router.get(
+    "/parser_limits",
+    status_code=status.HTTP_200_OK,
+    description="Current adaptive concurrency limits of the parser per OLX host",
+)
+async def parser_limits_handler(
+    container: Container = Depends(Stub(init_container)),
+) -> SuccessResponse[Dict]:
+    """Parser Limits."""
+    limiter: AdaptiveConcurrencyLimiter = container.resolve(AdaptiveConcurrencyLimiter)
+
+    return SuccessResponse(result=limiter.snapshot())
 
 
 @router.get(
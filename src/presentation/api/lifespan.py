@@ -0,0 +1,38 @@
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from punq import Container
+from src.infrastructure.di.main import init_container
+from src.infrastructure.jobs.sync import SyncJobManager
+from src.infrastructure.parser.driver import WebDriverPool
+from src.infrastructure.parser.extraction import BaseExtractionRunner
+from src.settings.config import Config
+
+
+async def start_webdriver_pool(container: Container) -> None:
+    config: Config = container.resolve(Config)
+    if config.parser_fetch_backend == "http" or not config.parser_webdriver_warm_start:
+        return
+
+    try:
+        await container.resolve(WebDriverPool).start()
+    except Exception as e:
+        # Застосунок працює і без Chrome, пул спробує запуститися при першому обході
+        logging.error(f"Не вдалося прогріти драйвери Chrome: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    container_factory = app.dependency_overrides.get(init_container, init_container)
+    container: Container = container_factory()
+
+    await start_webdriver_pool(container)
+    try:
+        yield
+    finally:
+        # Синхронізації, що не встигли завершитися, продовжаться з фронтиру
+        await container.resolve(SyncJobManager).close()
+        await container.resolve(WebDriverPool).close()
+        container.resolve(BaseExtractionRunner).close()
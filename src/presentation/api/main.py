@@ -5,6 +5,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import ORJSONResponse
 from src.presentation.api.controllers import setup_controllers
+from src.presentation.api.lifespan import lifespan
 from src.presentation.api.middlewares.main import setup_middleware
 
 from .config import APIConfig
@@ -23,6 +24,7 @@ def init_api(
         title="User service",
         version="1.0.0",
         default_response_class=ORJSONResponse,
+        lifespan=lifespan,
     )
     setup_middleware(app)
 
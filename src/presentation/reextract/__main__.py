@@ -0,0 +1,60 @@
+"""Повторний розбір архіву сирих сторінок поточним екстрактором.
+
+Приклад:
+    python -m src.reextract
+    python -m src.reextract --train-dictionary
+"""
+import argparse
+import asyncio
+import logging
+
+from src.infrastructure.di.main import init_container
+from src.infrastructure.jobs.reextract import ArchiveReextractor
+from src.infrastructure.parser.archive import (
+    BasePageArchive,
+    train_dictionary,
+)
+from src.infrastructure.parser.extraction import BaseExtractionRunner
+from src.settings.config import Config
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Re-extract car fields from the raw page archive")
+    parser.add_argument(
+        "--train-dictionary",
+        action="store_true",
+        help="train a new shared zstd dictionary on the archived pages instead of re-extracting",
+    )
+    return parser.parse_args()
+
+
+async def main() -> None:
+    args = parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    container = init_container()
+    config: Config = container.resolve(Config)
+    archive: BasePageArchive | None = container.resolve(BasePageArchive)
+    if archive is None:
+        raise SystemExit("PARSER_ARCHIVE_BACKEND is not set, there is no page archive")
+
+    if args.train_dictionary:
+        dict_id = await train_dictionary(
+            archive,
+            samples=config.parser_archive_dictionary_samples,
+            size=config.parser_archive_dictionary_size,
+        )
+        logging.info(f"Новий словник архіву: {dict_id}")
+        return
+
+    try:
+        progress = await container.resolve(ArchiveReextractor).run()
+        logging.info(f"Повторний розбір завершено: {progress.to_dict()}")
+    finally:
+        container.resolve(BaseExtractionRunner).close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""Порівнює трафік однієї сторінки в Chrome з блокуванням ресурсів і без нього.
+
+Приклад:
+    python -m src.traffic https://www.olx.ua/d/uk/obyavlenie/...
+    python -m src.traffic --repeat 5 https://www.olx.ua/uk/transport/legkovye-avtomobili/
+"""
+import argparse
+import logging
+import time
+
+from src.infrastructure.parser.driver import (
+    collect_page_traffic,
+    init_driver,
+    quit_driver,
+    ResourceBlockPolicy,
+)
+from src.infrastructure.parser.fetchers import (
+    init_block_policy,
+    PageTrafficStats,
+)
+from src.settings.config import Config
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Load the same page with resource blocking off and on and compare the traffic",
+    )
+    parser.add_argument("url", help="page to load")
+    parser.add_argument("--repeat", type=int, default=3, help="loads per mode, default 3")
+    return parser.parse_args()
+
+
+def measure(url: str, config: Config, block_policy: ResourceBlockPolicy, repeat: int) -> dict:
+    # Сторінка вантажиться повністю і без кешу, інакше повторні
+    # завантаження не тягнуть ресурси з мережі
+    driver = init_driver(
+        page_load_strategy="normal",
+        driver_path=config.parser_chromedriver_path,
+        block_policy=block_policy,
+    )
+    try:
+        driver.execute_cdp_cmd("Network.setCacheDisabled", {"cacheDisabled": True})
+        stats = PageTrafficStats()
+        load_seconds = 0.0
+        for _ in range(repeat):
+            started = time.perf_counter()
+            driver.get(url)
+            load_seconds += time.perf_counter() - started
+            stats.record(collect_page_traffic(driver, block_policy))
+    finally:
+        quit_driver(driver)
+
+    return {**stats.to_dict(), "avg_load_seconds": round(load_seconds / repeat, 3)}
+
+
+def saving(before: float, after: float) -> str:
+    if not before:
+        return "0%"
+    return f"{(before - after) / before:.0%}"
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    config = Config()
+    block_policy = init_block_policy(config)
+    if not block_policy.url_patterns:
+        raise SystemExit("PARSER_BLOCKED_RESOURCES and PARSER_BLOCKED_URL_PATTERNS are empty, nothing to compare")
+
+    unblocked = measure(args.url, config, ResourceBlockPolicy(), args.repeat)
+    logging.info(f"Без блокування: {unblocked}")
+    blocked = measure(args.url, config, block_policy, args.repeat)
+    logging.info(f"З блокуванням {','.join(block_policy.categories)}: {blocked}")
+
+    logging.info(
+        f"Економія: трафік {saving(unblocked['avg_bytes'], blocked['avg_bytes'])}, "
+        f"запити {saving(unblocked['avg_requests'], blocked['avg_requests'])}, "
+        f"DOMContentLoaded {saving(unblocked['avg_dom_ready_ms'], blocked['avg_dom_ready_ms'])}, "
+        f"повне завантаження {saving(unblocked['avg_load_seconds'], blocked['avg_load_seconds'])}",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+import signal
+
+from src.infrastructure.di.main import init_container
+from src.infrastructure.jobs.worker import CrawlWorker
+from src.infrastructure.parser.driver import WebDriverPool
+from src.infrastructure.parser.extraction import BaseExtractionRunner
+
+
+async def main() -> None:
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(levelname)s - %(message)s",
+    )
+    container = init_container()
+    worker: CrawlWorker = container.resolve(CrawlWorker)
+
+    # Після сигналу воркер дописує поточну пачку і завершується
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        progress = await worker.run(stop)
+        logging.info(f"Воркер зупинено: {progress.to_dict()}")
+    finally:
+        await container.resolve(WebDriverPool).close()
+        container.resolve(BaseExtractionRunner).close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
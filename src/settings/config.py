@@ -1,7 +1,13 @@
+from pathlib import Path
+
 from pydantic import Field
 from pydantic_settings import BaseSettings
 
 
+# Схема сторінок OLX, що постачається разом із кодом
+DEFAULT_SCHEMA_PATH = str(Path(__file__).parents[2] / "config" / "olx_schema.toml")
+
+
 class Config(BaseSettings):
     mongo_db_connection_uri: str = Field(alias="MONGO_DB_CONNECTION_URI")
     mongo_db_admin_password: str = Field(alias="MONGO_DB_ADMIN_PASSWORD")
@@ -17,5 +23,222 @@ class Config(BaseSettings):
         default="cars",
         alias="MONGODB_CARS_COLLECTION",
     )
+    mongodb_frontier_collection: str = Field(
+        default="parser_frontier",
+        alias="MONGODB_FRONTIER_COLLECTION",
+    )
+    mongodb_cursor_collection: str = Field(
+        default="parser_cursors",
+        alias="MONGODB_CURSOR_COLLECTION",
+    )
+    mongodb_partition_collection: str = Field(
+        default="parser_partitions",
+        alias="MONGODB_PARTITION_COLLECTION",
+    )
+    mongodb_archive_collection: str = Field(
+        default="parser_archive",
+        alias="MONGODB_ARCHIVE_COLLECTION",
+    )
+    mongodb_archive_dictionary_collection: str = Field(
+        default="parser_archive_dictionaries",
+        alias="MONGODB_ARCHIVE_DICTIONARY_COLLECTION",
+    )
+
+    parser_fetch_backend: str = Field(
+        default="hybrid",
+        alias="PARSER_FETCH_BACKEND",
+    )
+    parser_concurrency: int = Field(default=10, alias="PARSER_CONCURRENCY")
+    parser_initial_concurrency: int = Field(
+        default=2,
+        alias="PARSER_INITIAL_CONCURRENCY",
+    )
+    parser_min_concurrency: int = Field(default=1, alias="PARSER_MIN_CONCURRENCY")
+    parser_host_budgets: str = Field(default="", alias="PARSER_HOST_BUDGETS")
+    parser_http_max_connections: int = Field(
+        default=20,
+        alias="PARSER_HTTP_MAX_CONNECTIONS",
+    )
+    parser_http_timeout: float = Field(default=15.0, alias="PARSER_HTTP_TIMEOUT")
+    parser_request_timeout: float = Field(
+        default=60.0,
+        alias="PARSER_REQUEST_TIMEOUT",
+    )
+    parser_fetch_attempts: int = Field(default=3, alias="PARSER_FETCH_ATTEMPTS")
+    parser_retry_base_delay: float = Field(
+        default=0.5,
+        alias="PARSER_RETRY_BASE_DELAY",
+    )
+    parser_retry_max_delay: float = Field(
+        default=10.0,
+        alias="PARSER_RETRY_MAX_DELAY",
+    )
+    parser_retry_budget_ratio: float = Field(
+        default=0.2,
+        alias="PARSER_RETRY_BUDGET_RATIO",
+    )
+    parser_breaker_threshold: int = Field(
+        default=10,
+        alias="PARSER_BREAKER_THRESHOLD",
+    )
+    parser_breaker_reset_timeout: float = Field(
+        default=30.0,
+        alias="PARSER_BREAKER_RESET_TIMEOUT",
+    )
+    parser_cache_dir: str | None = Field(default=None, alias="PARSER_CACHE_DIR")
+    parser_cache_ttl: float = Field(default=3600.0, alias="PARSER_CACHE_TTL")
+    parser_cache_max_bytes: int = Field(
+        default=512 * 1024 * 1024,
+        alias="PARSER_CACHE_MAX_BYTES",
+    )
+    parser_webdriver_pool_size: int = Field(
+        default=4,
+        alias="PARSER_WEBDRIVER_POOL_SIZE",
+    )
+    parser_webdriver_warm_start: bool = Field(
+        default=True,
+        alias="PARSER_WEBDRIVER_WARM_START",
+    )
+    parser_chromedriver_path: str | None = Field(
+        default=None,
+        alias="PARSER_CHROMEDRIVER_PATH",
+    )
+    parser_page_load_strategy: str = Field(
+        default="eager",
+        alias="PARSER_PAGE_LOAD_STRATEGY",
+    )
+    parser_page_wait_timeout: float = Field(
+        default=10.0,
+        alias="PARSER_PAGE_WAIT_TIMEOUT",
+    )
+    parser_blocked_resources: str = Field(
+        default="images,fonts,media,trackers",
+        alias="PARSER_BLOCKED_RESOURCES",
+    )
+    parser_blocked_url_patterns: str = Field(
+        default="",
+        alias="PARSER_BLOCKED_URL_PATTERNS",
+    )
+    parser_log_page_traffic: bool = Field(
+        default=True,
+        alias="PARSER_LOG_PAGE_TRAFFIC",
+    )
+    parser_html_backend: str = Field(
+        default="html.parser",
+        alias="PARSER_HTML_BACKEND",
+    )
+    parser_extraction_mode: str = Field(
+        default="html",
+        alias="PARSER_EXTRACTION_MODE",
+    )
+    parser_extraction_backend: str = Field(
+        default="process",
+        alias="PARSER_EXTRACTION_BACKEND",
+    )
+    parser_extraction_workers: int = Field(
+        default=0,
+        alias="PARSER_EXTRACTION_WORKERS",
+    )
+    parser_discovery_backend: str = Field(
+        default="html",
+        alias="PARSER_DISCOVERY_BACKEND",
+    )
+    parser_offers_api_url: str = Field(
+        default="https://www.olx.ua/api/v1/offers/",
+        alias="PARSER_OFFERS_API_URL",
+    )
+    parser_offers_category_id: int = Field(
+        default=108,
+        alias="PARSER_OFFERS_CATEGORY_ID",
+    )
+    parser_offers_page_size: int = Field(
+        default=50,
+        alias="PARSER_OFFERS_PAGE_SIZE",
+    )
+    parser_partitioned_crawl: bool = Field(
+        default=False,
+        alias="PARSER_PARTITIONED_CRAWL",
+    )
+    parser_pagination_cap: int = Field(
+        default=1000,
+        alias="PARSER_PAGINATION_CAP",
+    )
+    parser_partition_price_step: int = Field(
+        default=5000,
+        alias="PARSER_PARTITION_PRICE_STEP",
+    )
+    parser_partition_concurrency: int = Field(
+        default=4,
+        alias="PARSER_PARTITION_CONCURRENCY",
+    )
+    parser_archive_backend: str | None = Field(
+        default=None,
+        alias="PARSER_ARCHIVE_BACKEND",
+    )
+    parser_archive_dir: str = Field(
+        default="./archive",
+        alias="PARSER_ARCHIVE_DIR",
+    )
+    parser_archive_level: int = Field(default=3, alias="PARSER_ARCHIVE_LEVEL")
+    parser_archive_dictionary_size: int = Field(
+        default=112640,
+        alias="PARSER_ARCHIVE_DICTIONARY_SIZE",
+    )
+    parser_archive_dictionary_samples: int = Field(
+        default=1000,
+        alias="PARSER_ARCHIVE_DICTIONARY_SAMPLES",
+    )
+    parser_reextract_batch_size: int = Field(
+        default=500,
+        alias="PARSER_REEXTRACT_BATCH_SIZE",
+    )
+    parser_card_required_fields: str = Field(
+        default="mark,price_numeric,year_created,mileage_numeric,location",
+        alias="PARSER_CARD_REQUIRED_FIELDS",
+    )
+    parser_schema_path: str = Field(
+        default=DEFAULT_SCHEMA_PATH,
+        alias="PARSER_SCHEMA_PATH",
+    )
+    parser_refresh_after_hours: float = Field(
+        default=24 * 7,
+        alias="PARSER_REFRESH_AFTER_HOURS",
+    )
+    parser_max_concurrent_syncs: int = Field(
+        default=1,
+        alias="PARSER_MAX_CONCURRENT_SYNCS",
+    )
+    parser_max_pending_syncs: int = Field(
+        default=5,
+        alias="PARSER_MAX_PENDING_SYNCS",
+    )
+    parser_shutdown_timeout: float = Field(
+        default=30.0,
+        alias="PARSER_SHUTDOWN_TIMEOUT",
+    )
+    parser_lease_seconds: float = Field(
+        default=300.0,
+        alias="PARSER_LEASE_SECONDS",
+    )
+    parser_worker_batch_size: int = Field(
+        default=20,
+        alias="PARSER_WORKER_BATCH_SIZE",
+    )
+    parser_checkpoint_batch: int = Field(
+        default=50,
+        alias="PARSER_CHECKPOINT_BATCH",
+    )
+    parser_save_batch_size: int = Field(
+        default=50,
+        alias="PARSER_SAVE_BATCH_SIZE",
+    )
+    parser_save_queue_size: int = Field(
+        default=200,
+        alias="PARSER_SAVE_QUEUE_SIZE",
+    )
+    parser_save_flush_interval: float = Field(
+        default=2.0,
+        alias="PARSER_SAVE_FLUSH_INTERVAL",
+    )
 
     debug: bool = Field(default=True, alias="DEBUG")
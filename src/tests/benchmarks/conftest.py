@@ -0,0 +1,47 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from src.infrastructure.parser.html_parsers import (
+    available_html_parsers,
+    BaseHTMLParser,
+)
+from src.tests.benchmarks.harness import (
+    Corpus,
+    load_corpus,
+    run_benchmark,
+)
+
+
+BENCHMARKS_DIR = Path(__file__).parent
+BENCHMARK_REPEAT = int(os.environ.get("PARSER_BENCHMARK_REPEAT", "5"))
+
+
+@pytest.fixture(scope="session")
+def corpus() -> Corpus:
+    return load_corpus(BENCHMARKS_DIR / "corpus")
+
+
+@pytest.fixture(scope="session")
+def expected() -> dict:
+    return json.loads((BENCHMARKS_DIR / "expected.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(scope="session")
+def baseline() -> dict:
+    return json.loads((BENCHMARKS_DIR / "baseline.json").read_text(encoding="utf-8"))
+
+
+@pytest.fixture(
+    scope="session",
+    params=available_html_parsers(),
+    ids=lambda html_parser: html_parser.name,
+)
+def html_parser(request: pytest.FixtureRequest) -> BaseHTMLParser:
+    return request.param
+
+
+@pytest.fixture(scope="session")
+def benchmark_report(corpus: Corpus, html_parser: BaseHTMLParser) -> dict:
+    return run_benchmark(corpus, html_parser, repeat=BENCHMARK_REPEAT)
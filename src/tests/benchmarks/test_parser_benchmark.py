@@ -0,0 +1,84 @@
+import os
+
+import pytest
+from src.infrastructure.parser.html_parsers import BaseHTMLParser
+from src.infrastructure.parser.parser_auto import (
+    CarPageExtractor,
+    extract_car_details,
+    extract_car_links,
+    OLX_CARS_URL,
+)
+from src.infrastructure.parser.schema import load_car_schema
+from src.tests.benchmarks.harness import Corpus
+
+
+# Допустиме падіння швидкості відносно baseline.json: заміри на спільних машинах шумні
+THROUGHPUT_TOLERANCE = float(os.environ.get("PARSER_BENCHMARK_TOLERANCE", "0.5"))
+# Пам'ять від навантаження машини не залежить, тож поріг суворіший
+ALLOCATION_TOLERANCE = float(os.environ.get("PARSER_ALLOCATION_TOLERANCE", "0.25"))
+# Пороги швидкості й пам'яті залежать від машини, тож їх вмикає лише make benchmark
+performance_gate = pytest.mark.skipif(
+    os.environ.get("PARSER_BENCHMARK_GATES") != "1",
+    reason="set PARSER_BENCHMARK_GATES=1 (make benchmark) to compare against baseline.json",
+)
+
+
+def test_listing_links_match_expected(
+    corpus: Corpus,
+    expected: dict,
+    html_parser: BaseHTMLParser,
+):
+    extractor = CarPageExtractor(html_parser=html_parser, schema=load_car_schema())
+
+    for name, html in corpus.listing.items():
+        links = extract_car_links(html, OLX_CARS_URL, extractor)
+        assert sorted(links) == expected["listing"][name], name
+
+
+def test_car_details_match_expected(
+    corpus: Corpus,
+    expected: dict,
+    html_parser: BaseHTMLParser,
+):
+    extractor = CarPageExtractor(html_parser=html_parser, schema=load_car_schema())
+
+    for name, html in corpus.detail.items():
+        assert extract_car_details(html, extractor) == expected["detail"][name], name
+
+
+def test_state_details_agree_with_dom(
+    corpus: Corpus,
+    expected: dict,
+    html_parser: BaseHTMLParser,
+):
+    extractor = CarPageExtractor(html_parser=html_parser, schema=load_car_schema(), use_state=True)
+
+    for name, html in corpus.detail.items():
+        car_details = extract_car_details(html, extractor)
+        # Стан повніший за DOM: фото і місцезнаходження є, навіть коли блоків немає
+        for field, value in expected["detail"][name].items():
+            assert car_details.get(field) == value, (name, field)
+
+
+@performance_gate
+@pytest.mark.parametrize("kind", ["listing", "detail"])
+def test_throughput_not_regressed(benchmark_report: dict, baseline: dict, kind: str):
+    backend = benchmark_report["backend"]
+    if backend not in baseline:
+        pytest.skip(f"No baseline for {backend}")
+
+    pages_per_sec = benchmark_report[kind]["pages_per_sec"]
+    floor = baseline[backend][f"{kind}_pages_per_sec"] * (1 - THROUGHPUT_TOLERANCE)
+    assert pages_per_sec >= floor, f"{backend} {kind}: {pages_per_sec:.1f} pages/sec < {floor:.1f}"
+
+
+@performance_gate
+@pytest.mark.parametrize("kind", ["listing", "detail"])
+def test_allocations_not_regressed(benchmark_report: dict, baseline: dict, kind: str):
+    backend = benchmark_report["backend"]
+    if backend not in baseline:
+        pytest.skip(f"No baseline for {backend}")
+
+    peak_kib = benchmark_report[kind]["peak_kib"]
+    ceiling = baseline[backend][f"{kind}_peak_kib"] * (1 + ALLOCATION_TOLERANCE)
+    assert peak_kib <= ceiling, f"{backend} {kind}: {peak_kib:.1f} KiB > {ceiling:.1f}"
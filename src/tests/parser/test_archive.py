@@ -0,0 +1,120 @@
+import asyncio
+from dataclasses import replace
+from datetime import datetime
+
+import pytest
+from src.infrastructure.parser.archive import (
+    ArchivedPage,
+    decode_page,
+    encode_page,
+    FilePageArchive,
+    PageCodec,
+)
+
+
+zstandard = pytest.importorskip("zstandard")
+
+DICTIONARY_SIZE = 2048
+
+
+def page_html(i: int, variant: str = "css-title") -> str:
+    params = "".join(f'<li class="css-param">Параметр {n}: {i * n}</li>' for n in range(i % 7))
+    return (
+        f'<html><body><h4 class="{variant}">BMW X5 {i}</h4>'
+        f'<h3 data-testid="ad-price-container">{i * 100} $</h3><ul>{params}</ul></body></html>'
+    )
+
+
+def samples(variant: str = "css-title") -> list[bytes]:
+    return [page_html(i, variant).encode() for i in range(300)]
+
+
+def archived_page(i: int, fetched_at: datetime = datetime(2026, 10, 1, 12, 0)) -> ArchivedPage:
+    return ArchivedPage(
+        olx_id=f"ID{i}",
+        url=f"https://www.olx.ua/d/uk/obyavlenie/car-{i}-ID{i}.html",
+        fetched_at=fetched_at,
+        body=page_html(i),
+    )
+
+
+def test_page_encoding_round_trip():
+    page = archived_page(1)
+    assert decode_page(page.olx_id, page.fetched_at, encode_page(page)) == page
+
+
+def test_round_trip_without_dictionary():
+    codec = PageCodec()
+    data = page_html(1).encode()
+
+    frame = codec.compress(data)
+
+    assert zstandard.get_frame_parameters(frame).dict_id == 0
+    assert codec.decompress(frame) == data
+
+
+def test_round_trip_with_dictionary():
+    codec = PageCodec()
+    dict_id = codec.add_dictionary(codec.train(samples(), DICTIONARY_SIZE))
+    data = page_html(1000).encode()
+
+    frame = codec.compress(data)
+
+    assert zstandard.get_frame_parameters(frame).dict_id == dict_id
+    assert codec.decompress(frame) == data
+    assert len(frame) < len(PageCodec().compress(data))
+
+
+def test_frame_compressed_under_older_dictionary():
+    codec = PageCodec()
+    old_id = codec.add_dictionary(codec.train(samples(), DICTIONARY_SIZE))
+    old_data = page_html(1000).encode()
+    old_frame = codec.compress(old_data)
+
+    new_id = codec.add_dictionary(codec.train(samples("css-1jh69qu"), DICTIONARY_SIZE))
+    new_data = page_html(1001, "css-1jh69qu").encode()
+    new_frame = codec.compress(new_data)
+
+    assert old_id != new_id
+    assert zstandard.get_frame_parameters(new_frame).dict_id == new_id
+    assert codec.decompress(old_frame) == old_data
+    assert codec.decompress(new_frame) == new_data
+
+
+def test_unknown_dictionary_rejected():
+    codec = PageCodec()
+    codec.add_dictionary(codec.train(samples(), DICTIONARY_SIZE))
+    frame = codec.compress(page_html(1).encode())
+
+    with pytest.raises(ValueError):
+        PageCodec().decompress(frame)
+
+
+def test_file_archive_reads_latest_pages_under_their_dictionaries(tmp_path):
+    updated = replace(archived_page(1), fetched_at=datetime(2026, 10, 2), body=page_html(1, "css-1jh69qu"))
+
+    async def run():
+        archive = FilePageArchive(codec=PageCodec(), directory=tmp_path)
+        await archive.put(archived_page(1))
+        await archive.save_dictionary(archive.codec.train(samples(), DICTIONARY_SIZE))
+        await archive.put(archived_page(2))
+        await archive.save_dictionary(archive.codec.train(samples("css-1jh69qu"), DICTIONARY_SIZE))
+        await archive.put(updated)
+
+        # Новий екземпляр читає обидва словники з диска
+        reopened = FilePageArchive(codec=PageCodec(), directory=tmp_path)
+        return [page async for page in reopened.latest()]
+
+    assert asyncio.run(run()) == [updated, archived_page(2)]
+
+
+def test_file_archive_skips_corrupt_frame(tmp_path):
+    async def run():
+        archive = FilePageArchive(codec=PageCodec(), directory=tmp_path)
+        await archive.put(archived_page(1))
+        await archive.put(archived_page(2))
+        for path in (tmp_path / "pages" / "ID1").glob("*.zst"):
+            path.write_bytes(b"not a zstd frame")
+        return [page async for page in archive.latest()]
+
+    assert asyncio.run(run()) == [archived_page(2)]
@@ -0,0 +1,91 @@
+import asyncio
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from src.infrastructure.parser.driver import WebDriverPool
+
+
+class FakeDriver:
+    def __init__(self):
+        self.dead = False
+        self.quit_calls = 0
+
+    def execute_script(self, script: str) -> int:
+        if self.dead:
+            raise WebDriverException("dead")
+        return 1
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+
+
+class DriverFactory:
+    """Створює limit драйверів, далі Chrome не запускається."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.drivers: list[FakeDriver] = []
+
+    def __call__(self) -> FakeDriver:
+        if len(self.drivers) >= self.limit:
+            raise RuntimeError("Chrome failed to start")
+        self.drivers.append(FakeDriver())
+        return self.drivers[-1]
+
+
+def test_waiter_fails_instead_of_hanging_when_replacement_fails():
+    pool = WebDriverPool(size=1, driver_factory=DriverFactory(limit=1))
+
+    async def crash(acquired: asyncio.Event) -> None:
+        async with pool.acquire() as driver:
+            acquired.set()
+            await asyncio.sleep(0.01)
+            driver.dead = True
+            raise WebDriverException("crash")
+
+    async def wait_for_driver() -> None:
+        async with pool.acquire():
+            pass
+
+    async def run():
+        acquired = asyncio.Event()
+        crashed = asyncio.create_task(crash(acquired))
+        await acquired.wait()
+        waiter = asyncio.create_task(wait_for_driver())
+        return await asyncio.wait_for(asyncio.gather(crashed, waiter, return_exceptions=True), timeout=5)
+
+    crashed, waited = asyncio.run(run())
+
+    assert isinstance(crashed, WebDriverException)
+    assert isinstance(waited, RuntimeError)
+
+
+def test_driver_checked_out_at_close_is_quit():
+    factory = DriverFactory(limit=2)
+    pool = WebDriverPool(size=2, driver_factory=factory)
+
+    async def run():
+        async with pool.acquire() as driver:
+            await pool.close()
+        return driver
+
+    driver = asyncio.run(run())
+
+    assert [created.quit_calls for created in factory.drivers] == [1, 1]
+    assert driver.quit_calls == 1
+
+
+def test_acquire_after_failed_spawn_retries_on_the_free_slot():
+    factory = DriverFactory(limit=0)
+    pool = WebDriverPool(size=1, driver_factory=factory)
+
+    async def run():
+        with pytest.raises(RuntimeError):
+            async with pool.acquire():
+                pass
+
+        factory.limit = 1
+        async with pool.acquire() as driver:
+            return driver
+
+    assert asyncio.run(run()) is factory.drivers[0]
@@ -0,0 +1,37 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+import pytest
+from src.infrastructure.parser.extraction import ProcessExtractionRunner
+
+
+def crash_once(marker: str) -> int:
+    # Перший виклик вбиває процес пулу, як це робить OOM killer
+    path = Path(marker)
+    if not path.exists():
+        path.touch()
+        os._exit(1)
+    return 42
+
+
+def crash_always() -> int:
+    os._exit(1)
+
+
+def test_broken_pool_is_rebuilt_and_retried_once(tmp_path: Path):
+    runner = ProcessExtractionRunner(max_workers=1)
+    try:
+        assert asyncio.run(runner.run(crash_once, str(tmp_path / "crashed"))) == 42
+    finally:
+        runner.close()
+
+
+def test_pool_broken_again_is_reported(tmp_path: Path):
+    runner = ProcessExtractionRunner(max_workers=1)
+    try:
+        with pytest.raises(BrokenProcessPool):
+            asyncio.run(runner.run(crash_always))
+    finally:
+        runner.close()
@@ -0,0 +1,136 @@
+import asyncio
+from collections.abc import Sequence
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+import pytest
+from src.infrastructure.exceptions.parser import (
+    IncompletePageException,
+    ListingRemovedException,
+)
+from src.infrastructure.parser.cache import DiskPageCache
+from src.infrastructure.parser.fetchers import (
+    BaseFetcher,
+    BLANK,
+    HTTPFetcher,
+    page_status,
+    PARTIAL,
+    READY,
+    REMOVED,
+    RetryingFetcher,
+)
+from src.infrastructure.parser.metrics import CrawlMetrics
+from src.infrastructure.parser.resilience import CircuitBreaker
+from src.infrastructure.parser.schema import load_car_schema
+
+
+CORPUS_DIR = Path(__file__).parents[1] / "benchmarks" / "corpus" / "detail"
+WAIT_FOR = ("css-title", "css-price", "css-param")
+REMOVED_MARKERS = ("ad-inactive-msg",)
+STATE_MARKER = "window.__PRERENDERED_STATE__"
+
+
+@dataclass
+class StaticFetcher(BaseFetcher):
+    html: str
+    calls: int = 0
+
+    async def fetch(
+        self,
+        url: str,
+        wait_for: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str:
+        self.calls += 1
+        return self.html
+
+
+def fetch_with_retries(html: str) -> tuple[StaticFetcher, RetryingFetcher]:
+    inner = StaticFetcher(html=html)
+    fetcher = RetryingFetcher(
+        inner=inner,
+        attempts=3,
+        base_delay=0.0,
+        max_delay=0.0,
+        # Один збій відкриває вимикач, тож його стан показує, чи рахувалася сторінка збоєм
+        breaker=CircuitBreaker(failure_threshold=1),
+        metrics=CrawlMetrics(),
+    )
+    return inner, fetcher
+
+
+@pytest.mark.parametrize(
+    ("html", "status"),
+    [
+        ('<h4 class="css-title"></h4><h3 class="css-price"></h3><p class="css-param"></p>', READY),
+        ('<h4 class="css-title"></h4><p class="css-param"></p>', PARTIAL),
+        ("<html><body></body></html>", BLANK),
+        ('<div data-testid="ad-inactive-msg"></div><div class="css-title"></div>', REMOVED),
+    ],
+)
+def test_page_status(html: str, status: str):
+    assert page_status(html, WAIT_FOR, REMOVED_MARKERS) == status
+
+
+def test_state_marker_makes_page_ready_without_css_markers():
+    html = f'<script>{STATE_MARKER} = "{{}}";</script><h4 class="css-title"></h4>'
+
+    assert page_status(html, WAIT_FOR, REMOVED_MARKERS) == PARTIAL
+    assert page_status(html, WAIT_FOR, REMOVED_MARKERS, ready_marker=STATE_MARKER) == READY
+
+
+def test_corpus_removed_listing_is_detected():
+    schema = load_car_schema()
+
+    for path in sorted(CORPUS_DIR.glob("*.html")):
+        status = page_status(path.read_text(encoding="utf-8"), schema.detail_wait_for, schema.detail_removed)
+        assert status == (REMOVED if "removed" in path.name else READY), path.name
+
+
+def test_partial_page_is_returned_without_retry():
+    html = '<h4 class="css-title"></h4><p class="css-param"></p>'
+    inner, fetcher = fetch_with_retries(html)
+
+    assert asyncio.run(fetcher.fetch("https://example.com/car", WAIT_FOR, REMOVED_MARKERS)) == html
+    assert inner.calls == 1
+    assert not fetcher.breaker.is_open
+    assert fetcher.metrics.counters["partial_pages"] == 1
+
+
+def test_removed_listing_is_not_retried_or_counted_by_breaker():
+    inner, fetcher = fetch_with_retries('<div data-testid="ad-inactive-msg"></div>')
+
+    with pytest.raises(ListingRemovedException):
+        asyncio.run(fetcher.fetch("https://example.com/car", WAIT_FOR, REMOVED_MARKERS))
+    assert inner.calls == 1
+    assert not fetcher.breaker.is_open
+
+
+def test_blank_page_is_retried_and_counted_by_breaker():
+    inner, fetcher = fetch_with_retries("<html><body></body></html>")
+    fetcher.breaker = CircuitBreaker(failure_threshold=3)
+
+    with pytest.raises(IncompletePageException):
+        asyncio.run(fetcher.fetch("https://example.com/car", WAIT_FOR, REMOVED_MARKERS))
+    assert inner.calls == 3
+    assert fetcher.breaker.is_open
+
+
+def test_blank_page_is_not_cached_and_retry_reaches_site(tmp_path):
+    ready = '<h4 class="css-title"></h4><h3 class="css-price"></h3><p class="css-param"></p>'
+    responses = ["<html><body></body></html>", ready]
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, text=responses.pop(0))
+
+    async def run():
+        inner = HTTPFetcher(cache=DiskPageCache(tmp_path))
+        inner._client = httpx.AsyncClient(transport=httpx.MockTransport(respond))
+        async with RetryingFetcher(inner=inner, attempts=2, base_delay=0.0, max_delay=0.0) as fetcher:
+            html = await fetcher.fetch("https://example.com/car", WAIT_FOR, REMOVED_MARKERS)
+            cached = await fetcher.fetch("https://example.com/car", WAIT_FOR, REMOVED_MARKERS)
+        return html, cached, inner.metrics.counters["cache_hits"]
+
+    assert asyncio.run(run()) == (ready, ready, 1)
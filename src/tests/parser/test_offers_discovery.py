@@ -0,0 +1,160 @@
+import asyncio
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+
+import httpx
+import pytest
+from src.infrastructure.parser.discovery import OffersAPIDiscovery
+from src.infrastructure.parser.fetchers import HTTPFetcher
+from src.infrastructure.parser.partitions import PricePartition
+from src.infrastructure.parser.progress import CrawlProgress
+from src.infrastructure.parser.schema import load_car_schema
+
+
+API_URL = "http://offers.test/api/v1/offers/"
+TOTAL = 5
+PAGE_SIZE = 2
+
+
+def offer_url(i: int) -> str:
+    return f"https://www.olx.ua/d/uk/obyavlenie/car-{i}-IDx{i}.html"
+
+
+def offer(i: int) -> dict:
+    return {
+        "id": i,
+        "url": offer_url(i),
+        "title": f"BMW X5 {i}",
+        "params": [
+            {"key": "price", "value": {"value": 10000 + i, "label": f"{10 + i} 000 $"}},
+            {"key": "motor_year", "value": {"key": "2015", "label": "2015"}},
+            {"key": "motor_mileage_thou", "value": {"key": "150", "label": "150 тис. км"}},
+            {"key": "model", "value": {"label": "X5"}},
+        ],
+        "location": {"city": {"name": "Київ"}, "region": {"name": "Київська область"}},
+        "photos": [{"link": "https://ireland.apollo.olxcdn.com/v1/files/x/image;s={width}x{height}"}],
+    }
+
+
+class OffersAPIStub:
+    """Відповідає сторінками `{"data": [...], "metadata": {...}}` з TOTAL
+    оголошень і запам'ятовує параметри запитів."""
+
+    def __init__(self, broken_offsets: tuple[int, ...] = ()):
+        self.broken_offsets = broken_offsets
+        self.requests: list[dict] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        query = {name: values[0] for name, values in parse_qs(urlsplit(str(request.url)).query).items()}
+        self.requests.append(query)
+
+        offset, limit = int(query["offset"]), int(query["limit"])
+        if offset in self.broken_offsets:
+            return httpx.Response(200, text="<html>captcha</html>")
+
+        return httpx.Response(
+            200,
+            json={
+                "data": [offer(i) for i in range(offset, min(offset + limit, TOTAL))],
+                "metadata": {"total_elements": TOTAL},
+            },
+        )
+
+
+def discover(stub: OffersAPIStub, pages: int = 10, partition: PricePartition | None = None) -> tuple:
+    handled = []
+    cards = {}
+
+    async def on_page(page: int, page_cards: dict[str, dict]) -> None:
+        handled.append(page)
+        cards.update(page_cards)
+
+    async def run():
+        async with HTTPFetcher() as fetcher:
+            fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(stub))
+            discovery = OffersAPIDiscovery(
+                fetcher=fetcher,
+                schema=load_car_schema(),
+                api_url=API_URL,
+                page_size=PAGE_SIZE,
+            )
+            progress = CrawlProgress()
+            links = await discovery.discover(pages, on_page=on_page, progress=progress, partition=partition)
+            return links, progress
+
+    links, progress = asyncio.run(run())
+    return links, handled, cards, progress
+
+
+def test_discover_pages_until_short_page():
+    stub = OffersAPIStub()
+    links, handled, _, progress = discover(stub)
+
+    assert links == {offer_url(i) for i in range(TOTAL)}
+    assert handled == [0, 1, 2]
+    assert progress.pages == 3
+    # Третя сторінка неповна: сторінки за нею вже в черзі, але не обробляються
+    assert [request["offset"] for request in stub.requests[:3]] == ["0", "2", "4"]
+    assert {request["limit"] for request in stub.requests} == {str(PAGE_SIZE)}
+    assert {request["category_id"] for request in stub.requests} == {"108"}
+
+
+def test_discover_stops_at_pages_limit():
+    stub = OffersAPIStub()
+    links, handled, _, _ = discover(stub, pages=1)
+
+    assert links == {offer_url(0), offer_url(1)}
+    assert handled == [0]
+    assert len(stub.requests) == 1
+
+
+def test_discover_skips_page_that_is_not_json():
+    stub = OffersAPIStub(broken_offsets=(2,))
+    links, handled, _, progress = discover(stub)
+
+    assert links == {offer_url(0), offer_url(1), offer_url(4)}
+    assert handled == [0, 2]
+    assert progress.errors == 1
+
+
+def test_discover_passes_partition_filters():
+    stub = OffersAPIStub()
+    discover(stub, partition=PricePartition(5000, 10000))
+
+    assert stub.requests[0]["filter_float_price:from"] == "5000"
+    assert stub.requests[0]["filter_float_price:to"] == "10000"
+
+
+def test_offer_mapped_to_card():
+    _, _, cards, _ = discover(OffersAPIStub())
+
+    assert cards[offer_url(3)] == {
+        "mark": "BMW X5 3",
+        "url_image": "https://ireland.apollo.olxcdn.com/v1/files/x/image;s=1000x700",
+        "price": "13 000 $",
+        "price_numeric": 13000,
+        "year_created": 2015,
+        "mileage": "150 тис. км",
+        "mileage_numeric": 150000,
+        "model": "X5",
+        "location": "Київ, Київська область",
+    }
+
+
+@pytest.mark.parametrize(
+    "body, expected",
+    [
+        ({"data": [], "metadata": {"total_elements": 1234}}, 1234),
+        ({"data": []}, None),
+    ],
+)
+def test_count_reads_total_elements(body, expected):
+    async def run():
+        async with HTTPFetcher() as fetcher:
+            fetcher._client = httpx.AsyncClient(transport=httpx.MockTransport(lambda _: httpx.Response(200, json=body)))
+            discovery = OffersAPIDiscovery(fetcher=fetcher, schema=load_car_schema(), api_url=API_URL)
+            return await discovery.count()
+
+    assert asyncio.run(run()) == expected
@@ -0,0 +1,82 @@
+import asyncio
+from collections.abc import Sequence
+from dataclasses import (
+    dataclass,
+    field,
+)
+from pathlib import Path
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+
+from src.infrastructure.parser.fetchers import (
+    BaseFetcher,
+    page_status,
+    REMOVED,
+    RetryingFetcher,
+)
+from src.infrastructure.parser.metrics import CrawlMetrics
+from src.infrastructure.parser.parser_auto import (
+    default_extractor,
+    PaginationDiscovery,
+)
+from src.infrastructure.parser.resilience import CircuitBreaker
+
+
+LISTING_DIR = Path(__file__).parents[1] / "benchmarks" / "corpus" / "listing"
+EMPTY_PAGE = "page_4.html"
+
+
+@dataclass
+class ListingSite(BaseFetcher):
+    """Сторінки пошуку з корпусу; за останньою — порожня видача."""
+
+    pages: list[str]
+    empty: str
+    calls: list[int] = field(default_factory=list)
+
+    async def fetch(
+        self,
+        url: str,
+        wait_for: Sequence[str] = (),
+        removed: Sequence[str] = (),
+        ready_marker: str | None = None,
+    ) -> str:
+        page = int(parse_qs(urlsplit(url).query)["page"][0])
+        self.calls.append(page)
+        return self.pages[page] if page < len(self.pages) else self.empty
+
+
+def test_empty_page_is_detected_in_corpus():
+    schema = default_extractor().schema
+
+    for path in sorted(LISTING_DIR.glob("*.html")):
+        status = page_status(path.read_text(encoding="utf-8"), schema.listing_wait_for, schema.listing_empty)
+        assert (status == REMOVED) == (path.name == EMPTY_PAGE), path.name
+
+
+def test_pages_past_the_end_are_not_retried_or_counted_by_breaker():
+    site = ListingSite(
+        pages=[(LISTING_DIR / f"page_{page}.html").read_text(encoding="utf-8") for page in (1, 2, 3)],
+        empty=(LISTING_DIR / EMPTY_PAGE).read_text(encoding="utf-8"),
+    )
+    fetcher = RetryingFetcher(
+        inner=site,
+        attempts=3,
+        base_delay=0.0,
+        max_delay=0.0,
+        # Один збій відкрив би вимикач
+        breaker=CircuitBreaker(failure_threshold=1, reset_timeout=0.01, max_reset_timeout=0.01),
+        metrics=CrawlMetrics(),
+    )
+    # Кілька сторінок за кінцем пагінації завантажуються одночасно з останніми
+    discovery = PaginationDiscovery(fetcher=fetcher, concurrency=4)
+
+    links = asyncio.run(discovery.discover(8))
+
+    assert links
+    assert not fetcher.breaker.is_open
+    # Кожна сторінка завантажена один раз, без повторів
+    assert sorted(site.calls) == sorted(set(site.calls))
+    assert fetcher.metrics.counters.get("retries", 0) == 0
@@ -0,0 +1,202 @@
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import pytest
+from src.infrastructure.exceptions.parser import PageFetchException
+from src.infrastructure.parser.discovery import (
+    BaseListingDiscovery,
+    PageHandler,
+    PartitionedDiscovery,
+)
+from src.infrastructure.parser.partitions import (
+    InMemoryPartitionStore,
+    PricePartition,
+)
+from src.infrastructure.parser.progress import CrawlProgress
+
+
+SOURCE = "fake-listing"
+CAP = 12
+PRICE_STEP = 1000
+PRICES = [100 * i for i in range(30)]
+
+
+@dataclass
+class PricedListings(BaseListingDiscovery):
+    """Пошук з оголошеннями за цінами prices, що, як OLX, догортається
+    лише до cap оголошень. Розмір діапазонів failing дізнатися не вдається."""
+
+    prices: list[int]
+    cap: int = CAP
+    failing: set[PricePartition] = field(default_factory=set)
+    counted: list[PricePartition] = field(default_factory=list)
+    crawled: list[PricePartition] = field(default_factory=list)
+
+    def cursor_key(self, partition: PricePartition | None = None) -> str:
+        return SOURCE
+
+    def listings(self, partition: PricePartition) -> list[str]:
+        return [
+            f"car-{price}"
+            for price in self.prices
+            if price >= partition.price_from and (partition.price_to is None or price <= partition.price_to)
+        ]
+
+    async def count(
+        self,
+        partition: PricePartition | None = None,
+        progress: CrawlProgress | None = None,
+    ) -> int | None:
+        self.counted.append(partition)
+        if partition in self.failing:
+            raise PageFetchException(url=partition.key)
+        return len(self.listings(partition))
+
+    async def discover(
+        self,
+        pages: int,
+        start_page: int = 0,
+        on_page: PageHandler | None = None,
+        progress: CrawlProgress | None = None,
+        partition: PricePartition | None = None,
+    ) -> set:
+        self.crawled.append(partition)
+        cards = {link: {} for link in self.listings(partition)[: self.cap]}
+        if on_page is not None:
+            await on_page(0, cards)
+        return set(cards)
+
+
+def partitioned(inner: PricedListings, store: InMemoryPartitionStore) -> PartitionedDiscovery:
+    return PartitionedDiscovery(inner=inner, store=store, cap=CAP, price_step=PRICE_STEP)
+
+
+def run_discover(discovery: PartitionedDiscovery, start_page: int = 0) -> tuple[set, list[int]]:
+    handled = []
+
+    async def on_page(page: int, cards: dict[str, dict]) -> None:
+        handled.append(page)
+
+    links = asyncio.run(discovery.discover(1, start_page=start_page, on_page=on_page))
+    return links, handled
+
+
+@pytest.mark.parametrize(
+    "partition, expected",
+    [
+        (PricePartition(0, 100), (PricePartition(0, 50), PricePartition(50, 100))),
+        (PricePartition(7, 9), (PricePartition(7, 8), PricePartition(8, 9))),
+        # Відкритий діапазон ділиться геометрично: крок, потім подвоєння
+        (PricePartition(), (PricePartition(0, 1000), PricePartition(1000, None))),
+        (PricePartition(1000), (PricePartition(1000, 2000), PricePartition(2000, None))),
+    ],
+)
+def test_split(partition, expected):
+    assert partition.split(PRICE_STEP) == expected
+
+
+@pytest.mark.parametrize("partition", [PricePartition(), PricePartition(500), PricePartition(0, 500)])
+def test_key_round_trip(partition):
+    assert PricePartition.from_key(partition.key) == partition
+
+
+def test_single_price_range_cannot_split():
+    assert not PricePartition(500, 501).can_split()
+    assert PricePartition(500).can_split()
+
+
+def test_plan_splits_until_ranges_fit_cap():
+    inner = PricedListings(PRICES)
+    store = InMemoryPartitionStore()
+
+    links, handled = run_discover(partitioned(inner, store))
+
+    assert links == {f"car-{price}" for price in PRICES}
+    assert asyncio.run(store.load(SOURCE)) == {
+        PricePartition(0, 1000): 11,
+        PricePartition(1000, 2000): 11,
+        PricePartition(2000, None): 10,
+    }
+    assert handled == [0, 1, 2]
+
+
+def test_learned_plan_reused_without_probes():
+    store = InMemoryPartitionStore()
+    run_discover(partitioned(PricedListings(PRICES), store))
+    learned = asyncio.run(store.load(SOURCE))
+
+    inner = PricedListings(PRICES)
+    links, _ = run_discover(partitioned(inner, store))
+
+    assert inner.counted == []
+    assert sorted(inner.crawled) == sorted(learned)
+    assert links == {f"car-{price}" for price in PRICES}
+    assert asyncio.run(store.load(SOURCE)) == learned
+
+
+def test_range_that_reached_cap_is_split_on_next_sync():
+    store = InMemoryPartitionStore()
+    run_discover(partitioned(PricedListings(PRICES), store))
+
+    # Нові оголошення: діапазон 1000-2000 догортається лише до cap
+    inner = PricedListings(PRICES + [1550, 1650, 1750])
+    run_discover(partitioned(inner, store))
+    assert asyncio.run(store.load(SOURCE))[PricePartition(1000, 2000)] == CAP
+
+    inner = PricedListings(PRICES + [1550, 1650, 1750])
+    links, _ = run_discover(partitioned(inner, store))
+
+    assert inner.counted == [PricePartition(1000, 1500), PricePartition(1500, 2000)]
+    assert PricePartition(1000, 2000) not in asyncio.run(store.load(SOURCE))
+    assert {"car-1550", "car-1650", "car-1750"} <= links
+
+
+def test_resume_keeps_plan_of_interrupted_crawl():
+    store = InMemoryPartitionStore()
+    plan = {
+        PricePartition(0, 1000): 4,
+        PricePartition(1000, 2000): CAP,
+        PricePartition(2000, None): 3,
+    }
+    asyncio.run(store.save(SOURCE, plan))
+
+    # Курсор фронтиру вказує на другий діапазон: розбиття не змінюється,
+    # хоча діапазон 1000-2000 уперся в cap
+    inner = PricedListings(PRICES)
+    _, handled = run_discover(partitioned(inner, store), start_page=1)
+
+    assert inner.counted == []
+    assert inner.crawled == [PricePartition(1000, 2000), PricePartition(2000, None)]
+    assert handled == [1, 2]
+    assert set(asyncio.run(store.load(SOURCE))) == set(plan)
+
+    # Новий обхід з першої сторінки ділить такий діапазон
+    inner = PricedListings(PRICES)
+    run_discover(partitioned(inner, store))
+    assert inner.counted == [PricePartition(1000, 1500), PricePartition(1500, 2000)]
+
+
+def test_price_on_boundary_is_not_lost():
+    inner = PricedListings([49, 50, 51, 100])
+    lower, upper = PricePartition(0, 100).split(PRICE_STEP)
+
+    assert set(inner.listings(lower)) | set(inner.listings(upper)) == {"car-49", "car-50", "car-51", "car-100"}
+
+
+def test_range_with_failed_probe_is_probed_again():
+    store = InMemoryPartitionStore()
+    inner = PricedListings(PRICES, failing={PricePartition(1000, 2000)})
+    links, _ = run_discover(partitioned(inner, store))
+
+    # Діапазон все одно обходиться, але його розмір лишається невідомим
+    assert PricePartition(1000, 2000) in inner.crawled
+    assert asyncio.run(store.load(SOURCE))[PricePartition(1000, 2000)] is None
+
+    inner = PricedListings(PRICES)
+    run_discover(partitioned(inner, store))
+
+    assert inner.counted == [PricePartition(1000, 2000)]
+    assert asyncio.run(store.load(SOURCE))[PricePartition(1000, 2000)] == 11
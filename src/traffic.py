@@ -0,0 +1,5 @@
+from src.presentation.traffic.__main__ import main
+
+
+if __name__ == "__main__":
+    main()
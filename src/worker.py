@@ -0,0 +1,7 @@
+import asyncio
+
+from src.presentation.worker.__main__ import main
+
+
+if __name__ == "__main__":
+    asyncio.run(main())